@@ -0,0 +1,622 @@
+"""Local stand-in for an Emby server, for benchmarks and tests.
+
+Serves synthetic data for the endpoints the integration polls, with a
+configurable number of sessions and devices, WebSocket session pushes,
+injectable latency and injectable errors. Run it standalone to point a
+Home Assistant dev instance at it:
+
+    python benchmarks/fake_emby.py --sessions 500 --port 8096
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+API_KEY = "benchmark"
+TICKS_PER_SECOND = 10_000_000
+
+# Words of the synthetic titles in the catalog served by a recursive /Items
+_WORDS = (
+    "the last star night city river dark empire love story ocean king road "
+    "ghost winter summer shadow secret garden wild heart fire storm blue"
+).split()
+_CJK_WORDS = "流浪 地球 长安 十二 时辰 山海 情深 星辰 大海 风起 云涌 人间 烟火 少年 江湖".split()
+
+
+def _iso(value: datetime) -> str:
+    """Format a datetime like Emby does."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S.0000000Z")
+
+
+def _media_streams(rng: random.Random) -> list[dict[str, Any]]:
+    """Return a video, a few audio and a few subtitle streams."""
+    streams = [
+        {
+            "Index": 0,
+            "Type": "Video",
+            "Codec": "hevc",
+            "Width": 3840,
+            "Height": 2160,
+            "BitRate": 25_000_000,
+            "DisplayTitle": "4K HEVC HDR",
+        }
+    ]
+    for index in range(1, rng.randint(2, 4)):
+        streams.append(
+            {
+                "Index": index,
+                "Type": "Audio",
+                "Codec": rng.choice(["aac", "ac3", "eac3", "truehd"]),
+                "Language": rng.choice(["chi", "eng", "jpn"]),
+                "DisplayLanguage": rng.choice(["Chinese", "English", "Japanese"]),
+                "Channels": rng.choice([2, 6, 8]),
+                "ChannelLayout": rng.choice(["stereo", "5.1", "7.1"]),
+                "BitRate": 640_000,
+                "SampleRate": 48_000,
+                "IsDefault": index == 1,
+                "DisplayTitle": "Audio track",
+            }
+        )
+    for index in range(len(streams), len(streams) + rng.randint(0, 6)):
+        streams.append(
+            {
+                "Index": index,
+                "Type": "Subtitle",
+                "Codec": rng.choice(["srt", "ass", "pgssub"]),
+                "Language": rng.choice(["chi", "eng"]),
+                "DisplayLanguage": rng.choice(["Chinese", "English"]),
+                "IsDefault": False,
+                "IsForced": False,
+                "IsExternal": rng.random() < 0.5,
+                "DisplayTitle": "Subtitle track",
+            }
+        )
+    return streams
+
+
+class FakeEmbyServer:
+    """aiohttp application that imitates the Emby endpoints used here.
+
+    Args:
+        sessions: Number of sessions; about 60% of them are playing
+        devices: Number of registered devices (defaults to sessions)
+        activity_entries: Number of activity log entries
+        library_items: Number of episodes in the TV library, and of items
+            in the recursive catalog
+        latency: Fixed delay added to every response, in seconds
+        jitter: Random extra delay up to this many seconds
+        error_rate: Probability of answering with a 500
+        fail_endpoints: Paths that always answer with a 500
+        etags: Send ETags and answer If-None-Match with 304
+        seed: Seed of the synthetic data
+    """
+
+    def __init__(
+        self,
+        sessions: int = 10,
+        devices: int | None = None,
+        activity_entries: int = 500,
+        library_items: int = 1000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        fail_endpoints: set[str] | None = None,
+        etags: bool = False,
+        seed: int = 1,
+    ) -> None:
+        """Initialize the fake server."""
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.fail_endpoints = fail_endpoints or set()
+        self.etags = etags
+        self.rng = random.Random(seed)
+        self.hits: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self.not_modified = 0
+        # Client ports seen, one per connection
+        self.client_ports: set[int] = set()
+        # Open /embywebsocket connections that sent SessionsStart
+        self.websockets: set[web.WebSocketResponse] = set()
+        self.runner: web.AppRunner | None = None
+        self.port = 0
+
+        self.now = datetime.now(timezone.utc).replace(microsecond=0)
+        self.items: dict[str, dict[str, Any]] = {}
+        self.sessions = [self._session(index) for index in range(sessions)]
+        self.devices = [
+            self._device(index) for index in range(devices if devices is not None else sessions)
+        ]
+        self.activity = [self._activity(index) for index in range(activity_entries)]
+        self.library_items = library_items
+        self.catalog = [
+            self._catalog_item(index, self.now - timedelta(days=1))
+            for index in range(library_items)
+        ]
+
+    # ----- Synthetic data -----
+
+    def _item(self, index: int) -> dict[str, Any]:
+        """Return a movie or an episode with the bulky fields Emby embeds."""
+        rng = self.rng
+        episode = rng.random() < 0.5
+        item = {
+            "Id": str(100_000 + index),
+            "Name": f"Title {index}",
+            "Type": "Episode" if episode else "Movie",
+            "RunTimeTicks": rng.randint(20, 150) * 60 * TICKS_PER_SECOND,
+            "ProductionYear": rng.randint(1980, 2025),
+            "ImageTags": {"Primary": hashlib.md5(str(index).encode()).hexdigest()},
+            "BackdropImageTags": [hashlib.md5(f"b{index}".encode()).hexdigest()],
+            "MediaStreams": _media_streams(rng),
+            "Chapters": [
+                {"StartPositionTicks": n * 600 * TICKS_PER_SECOND, "Name": f"Chapter {n}"}
+                for n in range(rng.randint(5, 20))
+            ],
+            "People": [
+                {"Name": f"Person {n}", "Role": f"Role {n}", "Type": "Actor"}
+                for n in range(rng.randint(5, 30))
+            ],
+            "Overview": "Lorem ipsum dolor sit amet. " * rng.randint(5, 20),
+        }
+        if episode:
+            item.update(
+                SeriesName=f"Series {index % 50}",
+                ParentIndexNumber=rng.randint(1, 5),
+                IndexNumber=rng.randint(1, 24),
+            )
+        self.items[item["Id"]] = item
+        return item
+
+    def _catalog_item(self, index: int, saved: datetime) -> dict[str, Any]:
+        """Return a catalog item with a made up title, a fifth of them Chinese."""
+        rng = self.rng
+        if index % 5 == 0:
+            name = "".join(rng.sample(_CJK_WORDS, 2))
+        else:
+            name = " ".join(rng.sample(_WORDS, rng.randint(1, 3))).title()
+        item_type = rng.choice(("Movie", "Series", "Episode", "Episode", "Audio"))
+        return {
+            "Id": f"c{index:07d}",
+            "Name": f"{name} {index}",
+            "Type": item_type,
+            "ProductionYear": rng.randint(1980, 2025),
+            "SeriesName": f"Series {index % 300}" if item_type == "Episode" else None,
+            "DateLastSaved": _iso(saved),
+        }
+
+    def add_catalog_items(self, count: int) -> None:
+        """Add items to the catalog, saved at the current fake time."""
+        self.catalog.extend(
+            self._catalog_item(index, self.now)
+            for index in range(len(self.catalog), len(self.catalog) + count)
+        )
+
+    def _session(self, index: int) -> dict[str, Any]:
+        """Return a session; most are playing, the rest idle for a while."""
+        rng = self.rng
+        session: dict[str, Any] = {
+            "Id": f"session-{index}",
+            "DeviceId": f"device-{index}",
+            "InternalDeviceId": index + 1,
+            "DeviceName": f"Device {index}",
+            "Client": rng.choice(["Emby Web", "Emby for Android", "Emby Theater"]),
+            "ApplicationVersion": "4.8.0.0",
+            "UserId": f"user-{index % 20}",
+            "UserName": f"User {index % 20}",
+            "RemoteEndPoint": f"192.168.1.{index % 250 + 2}",
+            "PlayableMediaTypes": ["Audio", "Video"],
+            "SupportsRemoteControl": True,
+            "SupportedCommands": ["Play", "Pause", "Seek", "SetVolume", "Mute"] * 4,
+        }
+        idle_for = rng.choice([0, 0, 0, 600, 3600])
+        session["LastActivityDate"] = _iso(self.now - timedelta(seconds=idle_for))
+        if rng.random() < 0.6:
+            item = self._item(index)
+            session["NowPlayingItem"] = item
+            session["PlayState"] = {
+                "PositionTicks": rng.randint(0, item["RunTimeTicks"]),
+                "CanSeek": True,
+                "IsPaused": rng.random() < 0.2,
+                "IsMuted": False,
+                "VolumeLevel": 50,
+                "AudioStreamIndex": 1,
+                "SubtitleStreamIndex": None,
+                "PlayMethod": "DirectPlay",
+            }
+        else:
+            session["PlayState"] = {"CanSeek": False, "IsPaused": False, "IsMuted": False}
+        return session
+
+    def _device(self, index: int) -> dict[str, Any]:
+        """Return a registered device."""
+        return {
+            "Id": str(index + 1),
+            "ReportedDeviceId": f"device-{index}",
+            "Name": f"Device {index}",
+            "AppName": "Emby Web",
+            "AppVersion": "4.8.0.0",
+            "LastUserName": f"User {index % 20}",
+            "LastUserId": f"user-{index % 20}",
+            "DateLastActivity": _iso(self.now - timedelta(minutes=index)),
+        }
+
+    def _activity(self, index: int) -> dict[str, Any]:
+        """Return an activity log entry, newest first by index."""
+        entry_type = self.rng.choice(
+            ["VideoPlayback", "VideoPlaybackStopped", "AuthenticationSucceeded"]
+        )
+        return {
+            "Id": 1_000_000 - index,
+            "Name": f"User {index % 20} played Title {index}",
+            "Type": entry_type,
+            "Date": _iso(self.now - timedelta(minutes=3 * index)),
+            "UserId": f"user-{index % 20}",
+            "ItemId": str(100_000 + index),
+            "Severity": "Information",
+        }
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock and the position of unpaused playback forward."""
+        self.now += timedelta(seconds=seconds)
+        for session in self.sessions:
+            play_state = session["PlayState"]
+            if "NowPlayingItem" not in session or play_state["IsPaused"]:
+                continue
+            play_state["PositionTicks"] = min(
+                play_state["PositionTicks"] + int(seconds * TICKS_PER_SECOND),
+                session["NowPlayingItem"]["RunTimeTicks"],
+            )
+            session["LastActivityDate"] = _iso(self.now)
+
+    # ----- HTTP -----
+
+    def application(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/System/Info", self._system_info)
+        app.router.add_get("/System/Info/Public", self._system_info_public)
+        app.router.add_get("/System/Endpoint", self._system_endpoint)
+        app.router.add_get("/Items/Counts", self._items_counts)
+        app.router.add_get("/Items", self._items)
+        app.router.add_get("/Items/{item_id}/Images/{image_type}", self._image)
+        app.router.add_get("/Library/MediaFolders", self._library_folders)
+        app.router.add_get("/Sessions", self._sessions)
+        app.router.add_post("/Sessions/{session_id}/Playing/{command}", self._playing)
+        app.router.add_post("/Sessions/{session_id}/Command", self._command)
+        app.router.add_get("/Users", self._users)
+        app.router.add_get("/Users/{user_id}/Items", self._user_items)
+        app.router.add_get("/System/ActivityLog/Entries", self._activity_log)
+        app.router.add_get("/ScheduledTasks", self._scheduled_tasks)
+        app.router.add_get("/Devices", self._devices)
+        app.router.add_get("/embywebsocket", self._websocket)
+        app.router.add_get("/slow", self._slow)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Count hits, inject latency and errors, check the API key."""
+        self.hits[request.path] += 1
+        peer = request.transport.get_extra_info("peername") if request.transport else None
+        if peer:
+            self.client_ports.add(peer[1])
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if request.path != "/System/Info/Public":
+            token = request.headers.get("X-Emby-Token") or request.query.get("api_key")
+            if token != API_KEY:
+                raise web.HTTPUnauthorized()
+        if request.path in self.fail_endpoints or (
+            self.error_rate and self.rng.random() < self.error_rate
+        ):
+            raise web.HTTPInternalServerError()
+        return await handler(request)
+
+    def _json(self, request: web.Request, payload: Any) -> web.Response:
+        """Serialize a payload, honouring If-None-Match when ETags are on."""
+        body = json.dumps(payload).encode()
+        headers = {}
+        if self.etags:
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            headers["ETag"] = etag
+            if request.headers.get("If-None-Match") == etag:
+                self.not_modified += 1
+                return web.Response(status=304, headers=headers)
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def _system_info(self, request: web.Request) -> web.Response:
+        return self._json(
+            request,
+            {
+                "ServerName": "Fake Emby",
+                "Version": "4.8.0.0",
+                "Id": "fake-server",
+                "OperatingSystem": "Linux",
+                "HasPendingRestart": False,
+                "HasUpdateAvailable": False,
+                "LocalAddress": "http://127.0.0.1:8096",
+                "WanAddress": "http://203.0.113.1:8096",
+            },
+        )
+
+    async def _system_info_public(self, request: web.Request) -> web.Response:
+        return self._json(
+            request, {"ServerName": "Fake Emby", "Version": "4.8.0.0", "Id": "fake-server"}
+        )
+
+    async def _system_endpoint(self, request: web.Request) -> web.Response:
+        return self._json(request, {"IsLocal": True, "IsInNetwork": True})
+
+    async def _items_counts(self, request: web.Request) -> web.Response:
+        return self._json(
+            request,
+            {
+                "MovieCount": 1200,
+                "SeriesCount": 150,
+                "EpisodeCount": 9000,
+                "SongCount": 20000,
+                "AlbumCount": 1500,
+                "ArtistCount": 800,
+            },
+        )
+
+    async def _items(self, request: web.Request) -> web.Response:
+        if request.query.get("Recursive") == "true":
+            return self._catalog_page(request)
+        ids = [item_id for item_id in request.query.get("Ids", "").split(",") if item_id]
+        items = [self.items[item_id] for item_id in ids if item_id in self.items]
+        if "MediaStreams" not in request.query.get("Fields", ""):
+            items = [{k: v for k, v in item.items() if k != "MediaStreams"} for item in items]
+        return self._json(request, {"Items": items, "TotalRecordCount": len(items)})
+
+    def _catalog_page(self, request: web.Request) -> web.Response:
+        """Page through the catalog, filtered like Emby filters /Items."""
+        query = request.query
+        types = set(query.get("IncludeItemTypes", "").split(",")) - {""}
+        term = query.get("SearchTerm", "").casefold()
+        min_saved = query.get("MinDateLastSaved")
+        items = [
+            item
+            for item in self.catalog
+            if (not types or item["Type"] in types)
+            and (not term or term in item["Name"].casefold())
+            and (not min_saved or item["DateLastSaved"][:19] >= min_saved[:19])
+        ]
+        start = int(query.get("StartIndex", 0))
+        limit = int(query.get("Limit", len(items)))
+        return self._json(
+            request,
+            {"Items": items[start : start + limit], "TotalRecordCount": len(items)},
+        )
+
+    async def _image(self, request: web.Request) -> web.Response:
+        """Serve a fake JPEG whose size follows maxWidth."""
+        item = self.items.get(request.match_info["item_id"])
+        if item is None:
+            raise web.HTTPNotFound()
+        width = int(request.query.get("maxWidth", 2000))
+        tag = item["ImageTags"]["Primary"]
+        etag = f'"{tag}-{width}"'
+        headers = {"ETag": etag} if self.etags else {}
+        if self.etags and request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers=headers)
+        body = b"\xff\xd8" + tag.encode() * (width * 3)
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type="image/jpeg", headers=headers)
+
+    async def _library_folders(self, request: web.Request) -> web.Response:
+        return self._json(
+            request,
+            {
+                "Items": [
+                    {"Name": name, "Id": str(index), "CollectionType": kind}
+                    for index, (name, kind) in enumerate(
+                        [("Movies", "movies"), ("TV", "tvshows"), ("Music", "music")]
+                    )
+                ]
+            },
+        )
+
+    async def _sessions(self, request: web.Request) -> web.Response:
+        sessions = self.sessions
+        active_within = request.query.get("ActiveWithinSeconds")
+        if active_within:
+            cutoff = _iso(self.now - timedelta(seconds=int(active_within)))
+            sessions = [s for s in sessions if s["LastActivityDate"] >= cutoff]
+        if "Fields" in request.query:
+            # Projected: drop the optional fields that were not asked for
+            fields = set(request.query["Fields"].split(","))
+            optional = {"MediaStreams", "Chapters", "People", "Overview", "BackdropImageTags"}
+            drop = optional - fields
+            if request.query.get("EnableImages") == "false":
+                drop.add("ImageTags")
+            sessions = [
+                {
+                    **session,
+                    "NowPlayingItem": {
+                        k: v for k, v in session["NowPlayingItem"].items() if k not in drop
+                    },
+                }
+                if "NowPlayingItem" in session
+                else session
+                for session in sessions
+            ]
+        return self._json(request, sessions)
+
+    def _session_by_id(self, session_id: str) -> dict[str, Any]:
+        for session in self.sessions:
+            if session["Id"] == session_id:
+                return session
+        raise web.HTTPNotFound()
+
+    async def _playing(self, request: web.Request) -> web.Response:
+        """Apply a playstate command to a session."""
+        session = self._session_by_id(request.match_info["session_id"])
+        play_state = session["PlayState"]
+        command = request.match_info["command"]
+        if command in ("Pause", "Unpause"):
+            play_state["IsPaused"] = command == "Pause"
+        elif command == "Seek":
+            play_state["PositionTicks"] = int(request.query["SeekPositionTicks"])
+        elif command == "Stop":
+            session.pop("NowPlayingItem", None)
+        session["LastActivityDate"] = _iso(self.now)
+        return web.Response(status=204)
+
+    async def _command(self, request: web.Request) -> web.Response:
+        """Apply a general command (SetVolume, Mute, Unmute) to a session."""
+        session = self._session_by_id(request.match_info["session_id"])
+        body = await request.json()
+        play_state = session["PlayState"]
+        if body["Name"] == "SetVolume":
+            play_state["VolumeLevel"] = int(body["Arguments"]["Volume"])
+        elif body["Name"] in ("Mute", "Unmute"):
+            play_state["IsMuted"] = body["Name"] == "Mute"
+        return web.Response(status=204)
+
+    async def _users(self, request: web.Request) -> web.Response:
+        return self._json(
+            request,
+            [
+                {"Name": f"User {index}", "Id": f"user-{index}", "HasPassword": True}
+                for index in range(20)
+            ],
+        )
+
+    async def _user_items(self, request: web.Request) -> web.Response:
+        """Page through a library; the TV library is one flat folder."""
+        parent_id = request.query.get("ParentId", "")
+        total = {"0": 200, "1": self.library_items, "2": 200}.get(parent_id, 0)
+        start = int(request.query.get("StartIndex", 0))
+        limit = int(request.query.get("Limit", total))
+        items = [
+            {
+                "Id": f"{parent_id}{index:07d}",
+                "Name": f"Episode {index}",
+                "Type": "Episode" if parent_id == "1" else "Movie",
+                "IsFolder": False,
+                "IndexNumber": index % 24 + 1,
+                "ImageTags": {"Primary": hashlib.md5(str(index).encode()).hexdigest()},
+                "RunTimeTicks": 45 * 60 * TICKS_PER_SECOND,
+            }
+            for index in range(start, min(start + limit, total))
+        ]
+        return self._json(request, {"Items": items, "TotalRecordCount": total})
+
+    async def _activity_log(self, request: web.Request) -> web.Response:
+        query = {key.lower(): value for key, value in request.query.items()}
+        entries = self.activity
+        if "mindate" in query:
+            min_date = query["mindate"].replace("Z", "")
+            entries = [e for e in entries if e["Date"].replace("Z", "")[:19] >= min_date[:19]]
+        start = int(query.get("startindex", 0))
+        limit = int(query.get("limit", 100))
+        return self._json(
+            request,
+            {"Items": entries[start : start + limit], "TotalRecordCount": len(entries)},
+        )
+
+    async def _scheduled_tasks(self, request: web.Request) -> web.Response:
+        return self._json(
+            request,
+            [
+                {
+                    "Name": f"Task {index}",
+                    "State": "Running" if index == 0 else "Idle",
+                    "Id": f"task-{index}",
+                    "Category": "Library",
+                    "CurrentProgressPercentage": 42.0 if index == 0 else None,
+                }
+                for index in range(15)
+            ],
+        )
+
+    async def _devices(self, request: web.Request) -> web.Response:
+        return self._json(
+            request, {"Items": self.devices, "TotalRecordCount": len(self.devices)}
+        )
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Push the session list to subscribers, like /embywebsocket."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                if msg.json().get("MessageType") == "SessionsStart":
+                    self.websockets.add(ws)
+                    await ws.send_json({"MessageType": "Sessions", "Data": self.sessions})
+        finally:
+            self.websockets.discard(ws)
+        return ws
+
+    async def push_sessions(self) -> None:
+        """Send the current (unprojected) session list to subscribers."""
+        for ws in list(self.websockets):
+            await ws.send_json({"MessageType": "Sessions", "Data": self.sessions})
+
+    async def close_websockets(self) -> None:
+        """Drop every WebSocket connection, as a server restart would."""
+        for ws in list(self.websockets):
+            await ws.close()
+
+    async def _slow(self, request: web.Request) -> web.Response:
+        """Hold a connection open, to saturate a shared connection pool."""
+        await asyncio.sleep(float(request.query.get("seconds", 1)))
+        return web.Response(text="ok")
+
+    # ----- Lifecycle -----
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving; returns the bound port."""
+        self.runner = web.AppRunner(self.application(), access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        await self.close_websockets()
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = FakeEmbyServer(
+        sessions=args.sessions,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        etags=args.etags,
+    )
+    port = await server.start(args.host, args.port)
+    print(f"Fake Emby on http://{args.host}:{port} (api key: {API_KEY})")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8096)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--etags", action="store_true")
+    asyncio.run(_serve(parser.parse_args()))
@@ -0,0 +1,728 @@
+"""End-to-end benchmarks for the Emby integration.
+
+Runs the API client (and, when Home Assistant is installed, the
+coordinator) against the local FakeEmbyServer and writes a JSON report.
+Pass a previous report as --baseline to fail on regressions:
+
+    python benchmarks/run.py --output report.json
+    python benchmarks/run.py --baseline report.json --tolerance 0.25
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import importlib.util
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from fake_emby import API_KEY, TICKS_PER_SECOND, FakeEmbyServer
+
+ROOT = Path(__file__).resolve().parent.parent
+INTEGRATION = ROOT / "custom_components" / "emby"
+PACKAGE = "custom_components.emby"
+
+try:
+    import homeassistant  # noqa: F401
+except ImportError:
+    HAS_HOMEASSISTANT = False
+else:
+    HAS_HOMEASSISTANT = True
+
+
+def _load_integration() -> Any:
+    """Import the integration's api module.
+
+    Without Home Assistant the package __init__ cannot be executed, so
+    the package is registered without running it; api.py only needs
+    aiohttp and the sibling const and stats modules.
+    """
+    sys.path.insert(0, str(ROOT))
+    if not HAS_HOMEASSISTANT:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE,
+            INTEGRATION / "__init__.py",
+            submodule_search_locations=[str(INTEGRATION)],
+        )
+        sys.modules[PACKAGE] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"{PACKAGE}.api")
+
+
+api = _load_integration()
+
+
+def _summary(samples_ms: list[float]) -> dict[str, float]:
+    """Return the median, p95 and throughput of a list of durations."""
+    ordered = sorted(samples_ms)
+    p95 = ordered[max(0, round(0.95 * len(ordered)) - 1)]
+    return {
+        "runs": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(p95, 2),
+        "ops_per_s": round(1000 / statistics.mean(ordered), 1),
+    }
+
+
+async def _time(func: Callable[[], Awaitable[Any]], runs: int) -> list[float]:
+    """Await func runs times and return the durations in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+class Bench:
+    """A fake server plus an API client pointed at it."""
+
+    def __init__(self, session: aiohttp.ClientSession | None = None, **server: Any) -> None:
+        """Initialize the bench; server options go to FakeEmbyServer."""
+        self.server = FakeEmbyServer(**server)
+        self._own_session = session is None
+        self.session = session
+        self.client = None
+
+    async def __aenter__(self) -> Bench:
+        port = await self.server.start()
+        if self.session is None:
+            self.session = api.create_session()
+        self.client = api.EmbyAPIClient("127.0.0.1", port, API_KEY, self.session)
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.client.close()
+        if self._own_session:
+            await self.session.close()
+        await self.server.stop()
+
+    def reset_caches(self) -> None:
+        """Forget cached and conditional responses, for cold runs."""
+        self.client.invalidate()
+        self.client._validators.clear()
+
+
+# ----- Scenarios -----
+
+
+async def bench_overview(sizes: list[int], runs: int) -> dict[str, Any]:
+    """get_dashboard_overview throughput by number of sessions.
+
+    Cold runs drop every cache so each call downloads and decodes all
+    sections; warm runs are the steady state of a polling coordinator.
+    """
+    results = {}
+    for sessions in sizes:
+        # Keep the 10k run short
+        count = max(3, min(runs, runs * 100 // max(sessions, 100)))
+        async with Bench(sessions=sessions) as bench:
+            await bench.client.get_dashboard_overview()
+
+            async def cold() -> None:
+                bench.reset_caches()
+                await bench.client.get_dashboard_overview()
+
+            cold_ms = await _time(cold, count)
+            bytes_before = bench.server.bytes_sent
+            warm_ms = await _time(bench.client.get_dashboard_overview, count)
+            results[str(sessions)] = {
+                "cold": _summary(cold_ms),
+                "warm": _summary(warm_ms),
+                "warm_bytes_per_refresh": (bench.server.bytes_sent - bytes_before) // count,
+            }
+    return results
+
+
+async def bench_conditional(runs: int) -> dict[str, Any]:
+    """Share of refreshes answered with 304 when the server sends ETags."""
+    async with Bench(sessions=100, etags=True) as bench:
+        await bench.client.get_dashboard_overview()
+        sent_before = bench.server.bytes_sent
+        for _ in range(runs):
+            bench.client.invalidate()
+            await bench.client.get_dashboard_overview()
+        requests = sum(bench.server.hits.values())
+        return {
+            "requests": requests,
+            "not_modified": bench.server.not_modified,
+            "body_bytes_after_first": bench.server.bytes_sent - sent_before,
+        }
+
+
+async def bench_coalescing(callers: int) -> dict[str, Any]:
+    """Concurrent identical GETs share one server request."""
+    async with Bench(sessions=100, latency=0.02) as bench:
+        await asyncio.gather(*(bench.client.get_sessions() for _ in range(callers)))
+        return {
+            "callers": callers,
+            "server_requests": bench.server.hits["/Sessions"],
+            "coalesced": bench.client.coalesced_requests,
+        }
+
+
+async def bench_decode(runs: int) -> dict[str, Any]:
+    """json vs orjson on recorded /Sessions and /Devices bodies."""
+    results: dict[str, Any] = {"orjson_available": api.orjson is not None}
+    async with Bench(sessions=1000) as bench, aiohttp.ClientSession() as session:
+        base = f"http://127.0.0.1:{bench.server.port}"
+        headers = {"X-Emby-Token": API_KEY}
+        for endpoint in ("/Sessions", "/Devices"):
+            async with session.get(f"{base}{endpoint}", headers=headers) as response:
+                body = await response.read()
+            decoders = {"json": json.loads}
+            if api.orjson is not None:
+                decoders["orjson"] = api.orjson.loads
+            timings = {}
+            for name, decode in decoders.items():
+                samples = []
+                for _ in range(runs):
+                    started = time.perf_counter()
+                    decode(body)
+                    samples.append((time.perf_counter() - started) * 1000)
+                timings[f"{name}_p50_ms"] = round(statistics.median(samples), 3)
+            results[endpoint] = {"bytes": len(body), **timings}
+    return results
+
+
+async def bench_contention(runs: int) -> dict[str, Any]:
+    """Refresh latency while another integration saturates a shared pool.
+
+    The shared session has a small pool whose connections are all held
+    by slow requests; the dedicated session comes from create_session.
+    Idle connections of the shared pool expire almost immediately, like
+    its default 15 s keep-alive does between 30 s polls.
+    """
+    results = {}
+    for name in ("shared", "dedicated"):
+        shared = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=0.005)
+        )
+        session = shared if name == "shared" else None
+        async with Bench(sessions=100, session=session) as bench:
+            slow_url = f"http://127.0.0.1:{bench.server.port}/slow?seconds=0.2"
+            await bench.client.get_dashboard_overview()
+
+            async def hog() -> None:
+                async with shared.get(slow_url, headers={"X-Emby-Token": API_KEY}) as response:
+                    await response.read()
+
+            samples = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                hogs = [asyncio.create_task(hog()) for _ in range(10)]
+                await asyncio.sleep(0.01)
+                bench.reset_caches()
+                await bench.client.get_dashboard_overview()
+                samples.append((time.perf_counter() - started) * 1000)
+                await asyncio.gather(*hogs)
+            results[name] = _summary(samples)
+        await shared.close()
+    return results
+
+
+async def bench_projection() -> dict[str, Any]:
+    """Bytes saved by the /Sessions projection with 1000 sessions."""
+    async with Bench(sessions=1000) as bench:
+        return await bench.client.measure_sessions_projection()
+
+
+async def bench_errors(runs: int) -> dict[str, Any]:
+    """Refresh behaviour with injected latency and errors."""
+    async with Bench(sessions=100, latency=0.01, jitter=0.02, error_rate=0.1) as bench:
+        complete = 0
+        samples = []
+        for _ in range(runs):
+            bench.reset_caches()
+            started = time.perf_counter()
+            try:
+                data = await bench.client.get_dashboard_sections(api.DASHBOARD_SECTIONS)
+            except api.EmbyCircuitOpenError:
+                break
+            samples.append((time.perf_counter() - started) * 1000)
+            complete += len(data) == len(api.DASHBOARD_SECTIONS)
+        return {
+            **_summary(samples),
+            "complete_refreshes": complete,
+            "breaker_state": bench.client.breaker_state,
+            "failures": sum(s.failures for s in bench.client.endpoint_stats.values()),
+        }
+
+
+async def _async_setup_entities(
+    hass: Any, bench: Bench, devices: int, platforms: tuple[str, ...]
+) -> tuple[Any, list[Any]]:
+    """Set up a coordinator and the entities of the first devices.
+
+    Returns the coordinator and the entities, already added to hass.
+    """
+    from homeassistant.config_entries import ConfigEntry
+
+    const = importlib.import_module(f"{PACKAGE}.const")
+    sensor = importlib.import_module(f"{PACKAGE}.sensor")
+
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=const.DOMAIN,
+        title="Benchmark",
+        data={},
+        source="user",
+        options={
+            "monitored_devices": [
+                {
+                    "device_id": session["DeviceId"],
+                    "device_name": session["DeviceName"],
+                    "user_name": session["UserName"],
+                }
+                for session in bench.server.sessions[:devices]
+            ]
+        },
+    )
+    coordinator = sensor.EmbyDataUpdateCoordinator(hass, bench.client, entry)
+    hass.data[const.DOMAIN] = {
+        entry.entry_id: {"coordinator": coordinator, "client": bench.client}
+    }
+    await coordinator.async_refresh()
+
+    entities = []
+    for name in platforms:
+        platform = importlib.import_module(f"{PACKAGE}.{name}")
+        added = []
+        await platform.async_setup_entry(hass, entry, added.extend)
+        for entity in added:
+            entity.hass = hass
+            entity.entity_id = f"{name}.benchmark_{len(entities)}"
+            await entity.async_added_to_hass()
+            entities.append(entity)
+    return coordinator, entities
+
+
+async def bench_coordinator(sessions: int, devices: int, runs: int) -> dict[str, Any]:
+    """Coordinator refresh and entity update time (needs Home Assistant).
+
+    Sets up the sensor, binary_sensor and media_player entities of the
+    first devices, then times full refreshes while playback advances.
+    """
+    if not HAS_HOMEASSISTANT:
+        return {"skipped": "homeassistant is not installed"}
+
+    import tempfile
+
+    from homeassistant.core import HomeAssistant
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with Bench(sessions=sessions) as bench:
+            coordinator, entities = await _async_setup_entities(
+                hass, bench, devices, ("sensor", "binary_sensor", "media_player")
+            )
+
+            async def refresh() -> None:
+                bench.server.advance(10)
+                coordinator._section_fetched.clear()
+                bench.reset_caches()
+                await coordinator.async_refresh()
+
+            refresh_ms = await _time(refresh, runs)
+            timings = list(coordinator.refresh_timings)[-runs:]
+            for entity in entities:
+                await entity.async_will_remove_from_hass()
+            await coordinator.async_close()
+        await hass.async_stop(force=True)
+
+    def median(key: str) -> float:
+        return round(statistics.median(timing[key] for timing in timings), 3)
+
+    return {
+        "entities": len(entities),
+        "refresh": _summary(refresh_ms),
+        "network_p50_ms": median("network_ms"),
+        "process_p50_ms": median("process_ms"),
+        "fanout_p50_ms": median("fanout_ms"),
+        "state_writes_per_refresh": median("state_writes"),
+        "state_writes_skipped_per_refresh": median("state_writes_skipped"),
+    }
+
+
+async def bench_commands(seeks: int, volume_steps: int) -> dict[str, Any]:
+    """Remote control through the command queue (needs Home Assistant).
+
+    Drags the seek slider and presses volume up repeatedly on one media
+    player, like a user would, then waits for the confirming refresh.
+    Reports the commands actually sent and the requests that followed.
+    """
+    if not HAS_HOMEASSISTANT:
+        return {"skipped": "homeassistant is not installed"}
+
+    import tempfile
+
+    from homeassistant.core import HomeAssistant
+
+    const = importlib.import_module(f"{PACKAGE}.const")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with Bench(sessions=10, latency=0.02) as bench:
+            playing = next(
+                index
+                for index, session in enumerate(bench.server.sessions)
+                if "NowPlayingItem" in session
+            )
+            coordinator, players = await _async_setup_entities(
+                hass, bench, playing + 1, ("media_player",)
+            )
+            player = players[playing]
+            session = bench.server.sessions[playing]
+            # Let the setup's own requests (projection measurement) finish
+            await hass.async_block_till_done()
+            hits_before = bench.server.hits.copy()
+
+            # Each call returns once the optimistic state is written
+            call_ms = []
+            started = time.perf_counter()
+            for step in range(seeks):
+                call_started = time.perf_counter()
+                await player.async_media_seek(60 + step * 10)
+                call_ms.append((time.perf_counter() - call_started) * 1000)
+                await asyncio.sleep(0.01)  # Slider events arrive while commands are in flight
+            for _ in range(volume_steps):
+                call_started = time.perf_counter()
+                await player.async_volume_up()
+                call_ms.append((time.perf_counter() - call_started) * 1000)
+            shown = (player.media_position, round(player.volume_level, 2))
+
+            # Drained queue, then the debounced sessions refresh
+            queue = coordinator.command_queue(session["Id"])
+            while queue.busy:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(const.COMMAND_REFRESH_DELAY + 0.2)
+            confirmed_ms = (time.perf_counter() - started) * 1000
+            requests = bench.server.hits - hits_before
+
+            result = {
+                "commands_issued": seeks + volume_steps,
+                "commands_sent": queue.sent,
+                "commands_coalesced": queue.coalesced,
+                "optimistic_state": _summary(call_ms),
+                "confirmed_ms": round(confirmed_ms, 2),
+                "shown_position_s": shown[0],
+                "server_position_s": session["PlayState"]["PositionTicks"] // TICKS_PER_SECOND,
+                "shown_volume": shown[1],
+                "server_volume": session["PlayState"]["VolumeLevel"],
+                "optimistic_values_left": len(player._optimistic),
+                "command_requests": sum(
+                    count for path, count in requests.items() if path.startswith("/Sessions/")
+                ),
+                "refresh_requests": dict(
+                    (path, count)
+                    for path, count in requests.items()
+                    if not path.startswith("/Sessions/")
+                ),
+            }
+            for entity in players:
+                await entity.async_will_remove_from_hass()
+            await coordinator.async_close()
+        await hass.async_stop(force=True)
+    return result
+
+
+async def bench_artwork(items: int, loads: int) -> dict[str, Any]:
+    """Artwork proxy: repeated dashboard loads, then a restart (needs Home Assistant).
+
+    Each load requests the poster of every playing item, like a
+    dashboard with one media player card per device.
+    """
+    if not HAS_HOMEASSISTANT:
+        return {"skipped": "homeassistant is not installed"}
+
+    import tempfile
+
+    from homeassistant.core import HomeAssistant
+
+    artwork = importlib.import_module(f"{PACKAGE}.artwork")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with Bench(sessions=items * 2) as bench:
+            playing = [
+                session["NowPlayingItem"]
+                for session in bench.server.sessions
+                if "NowPlayingItem" in session
+            ][:items]
+            path = f"{config_dir}/artwork"
+
+            async def load(cache: Any) -> None:
+                await asyncio.gather(
+                    *(
+                        cache.async_get_image(item["Id"], "Primary", item["ImageTags"]["Primary"])
+                        for item in playing
+                    )
+                )
+
+            cache = artwork.ArtworkCache(hass, bench.client, path)
+            first_ms = await _time(lambda: load(cache), 1)
+            hits_after_first = bench.server.hits.copy()
+            repeat_ms = await _time(lambda: load(cache), loads)
+            repeat_requests = sum((bench.server.hits - hits_after_first).values())
+
+            # A new cache reads the disk copies, like after a restart
+            restarted = artwork.ArtworkCache(hass, bench.client, path)
+            hits_before_restart = bench.server.hits.copy()
+            restart_ms = await _time(lambda: load(restarted), 1)
+            restart_requests = sum((bench.server.hits - hits_before_restart).values())
+        await hass.async_stop(force=True)
+
+    return {
+        "images": len(playing),
+        "first_load_ms": round(first_ms[0], 2),
+        "repeat_load": _summary(repeat_ms),
+        "repeat_server_requests": repeat_requests,
+        "restart_load_ms": round(restart_ms[0], 2),
+        "restart_server_requests": restart_requests,
+        "downloads": cache.downloads,
+        "memory_hits": cache.memory_hits,
+        "disk_hits": restarted.disk_hits,
+    }
+
+
+async def bench_browse(library_items: int, runs: int) -> dict[str, Any]:
+    """Browsing a large flat library folder (needs Home Assistant).
+
+    Compares opening the folder in one request with the paginated,
+    cached browser: first page, next page and reopening the first page.
+    """
+    if not HAS_HOMEASSISTANT:
+        return {"skipped": "homeassistant is not installed"}
+
+    browse = importlib.import_module(f"{PACKAGE}.browse")
+
+    def thumbnail(item_id: str, tag: str) -> str:
+        return f"/api/media_player_proxy/media_player.benchmark/browse_media/image/{item_id}"
+
+    async with Bench(sessions=1, library_items=library_items) as bench:
+        user_id = "5d41402abc4b2a76b9719d911017c592"  # Emby user ids are GUIDs
+
+        async def unpaginated() -> None:
+            bench.reset_caches()
+            await bench.client.get_user_items(user_id, "1", 0, library_items)
+
+        full_ms = await _time(unpaginated, max(3, runs // 4))
+        full_bytes = bench.client.endpoint_stats["/Users/{id}/Items"].latest_size
+
+        browser = browse.LibraryBrowser(bench.client)
+
+        async def first_page_cold() -> None:
+            browser.invalidate()
+            bench.reset_caches()
+            await browser.async_browse(user_id, "1", thumbnail)
+
+        first_ms = await _time(first_page_cold, runs)
+        page_bytes = bench.client.endpoint_stats["/Users/{id}/Items"].latest_size
+        next_ms = await _time(lambda: browser.async_browse(user_id, "1:100", thumbnail), 1)
+        requests_before = bench.server.hits.copy()
+        cached_ms = await _time(lambda: browser.async_browse(user_id, "1", thumbnail), runs)
+        cached_requests = sum((bench.server.hits - requests_before).values())
+
+    return {
+        "library_items": library_items,
+        "unpaginated": {**_summary(full_ms), "bytes": full_bytes},
+        "first_page": {**_summary(first_ms), "bytes": page_bytes},
+        "next_page_ms": round(next_ms[0], 2),
+        "cached_page": _summary(cached_ms),
+        "cached_server_requests": cached_requests,
+    }
+
+
+async def bench_search(library_items: int, runs: int) -> dict[str, Any]:
+    """Library search: server SearchTerm vs the local index (needs Home Assistant).
+
+    Times the full index build, an incremental refresh after new items
+    were added, and exact, prefix, fuzzy and Chinese queries.
+    """
+    if not HAS_HOMEASSISTANT:
+        return {"skipped": "homeassistant is not installed"}
+
+    import tempfile
+
+    from homeassistant.core import HomeAssistant
+
+    search = importlib.import_module(f"{PACKAGE}.search")
+    queries = {
+        "exact": "ocean king",
+        "prefix": "shad",
+        "fuzzy": "gardan",
+        "chinese": "地球",
+    }
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with Bench(sessions=1, library_items=library_items) as bench:
+            server_ms = await _time(
+                lambda: bench.client.search_items(queries["exact"], 10), runs
+            )
+
+            index = search.SearchIndex(hass, bench.client, "benchmark")
+            hits_before = bench.server.hits.copy()
+            build_ms = await _time(index.async_refresh, 1)
+            build_requests = sum((bench.server.hits - hits_before).values())
+
+            bench.server.advance(60)
+            bench.server.add_catalog_items(100)
+            hits_before = bench.server.hits.copy()
+            incremental_ms = await _time(index.async_refresh, 1)
+            incremental_requests = sum((bench.server.hits - hits_before).values())
+
+            query_ms = {}
+            matches = {}
+            for name, query in queries.items():
+                samples = await _time(lambda query=query: _async(index.search, query), runs)
+                query_ms[name] = _summary(samples)
+                matches[name] = len(index.search(query, 50))
+        await hass.async_stop(force=True)
+
+    return {
+        "library_items": library_items,
+        "indexed": len(index),
+        "server_search": _summary(server_ms),
+        "build_ms": round(build_ms[0], 2),
+        "build_requests": build_requests,
+        "incremental_ms": round(incremental_ms[0], 2),
+        "incremental_requests": incremental_requests,
+        "index_search": query_ms,
+        "matches": matches,
+    }
+
+
+async def _async(func: Callable[..., Any], *args: Any) -> Any:
+    """Call a synchronous function from _time."""
+    return func(*args)
+
+
+# ----- Report -----
+
+
+def _flatten(value: Any, prefix: str = "") -> dict[str, float]:
+    """Flatten nested results to dotted keys."""
+    if isinstance(value, dict):
+        flat = {}
+        for key, item in value.items():
+            flat.update(_flatten(item, f"{prefix}{key}."))
+        return flat
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {prefix[:-1]: value}
+    return {}
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Return the metrics that regressed by more than tolerance.
+
+    Durations (*_ms) regress when they grow, throughputs (*_per_s) when
+    they shrink; other numbers are informational.
+    """
+    current = _flatten(report["results"])
+    previous = _flatten(baseline["results"])
+    regressions = []
+    for key, old in previous.items():
+        new = current.get(key)
+        if new is None or not old:
+            continue
+        if key.endswith("_ms") and new > old * (1 + tolerance):
+            regressions.append(f"{key}: {old} -> {new} ms")
+        elif key.endswith("_per_s") and new < old * (1 - tolerance):
+            regressions.append(f"{key}: {old} -> {new} /s")
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every scenario and return the report."""
+    sizes = [int(size) for size in args.sessions.split(",")]
+    scenarios: dict[str, Callable[[], Awaitable[Any]]] = {
+        "overview": lambda: bench_overview(sizes, args.runs),
+        "conditional": lambda: bench_conditional(args.runs),
+        "coalescing": lambda: bench_coalescing(50),
+        "decode": lambda: bench_decode(args.runs),
+        "contention": lambda: bench_contention(max(3, args.runs // 4)),
+        "projection": bench_projection,
+        "errors": lambda: bench_errors(args.runs),
+        "coordinator": lambda: bench_coordinator(100, 10, args.runs),
+        "commands": lambda: bench_commands(20, 5),
+        "artwork": lambda: bench_artwork(10, args.runs),
+        "browse": lambda: bench_browse(50_000, args.runs),
+        "search": lambda: bench_search(50_000, args.runs),
+    }
+    only = set(args.only.split(",")) if args.only else None
+    results = {}
+    for name, scenario in scenarios.items():
+        if only and name not in only:
+            continue
+        print(f"{name}...", file=sys.stderr)
+        results[name] = await scenario()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "aiohttp": aiohttp.__version__,
+            "orjson": api.orjson is not None,
+            "homeassistant": HAS_HOMEASSISTANT,
+            "runs": args.runs,
+        },
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="previous report to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--sessions", default="1,100,1000,10000")
+    parser.add_argument("--only", help="comma separated scenario names")
+    args = parser.parse_args()
+
+    # The error scenario logs every injected failure
+    logging.basicConfig(level=logging.CRITICAL)
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,51 @@
 """The Emby integration."""
 from __future__ import annotations
 
+import contextlib
 import logging
+import os
+from datetime import datetime
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PORT,
+    CONF_SSL,
+    CONF_VERIFY_SSL,
+    Platform,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import (
+    async_track_time_change,
+    async_track_time_interval,
+)
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util.ssl import client_context
 
-from .api import EmbyAPIClient
-from .const import CONF_API_KEY, DOMAIN
+from .api import EmbyAPIClient, EmbyAPIError, create_session
+from .artwork import ArtworkCache
+from .const import (
+    ARTWORK_DIR,
+    CONF_API_KEY,
+    CONF_AUTO_DISCOVERY,
+    CONF_SEARCH_INDEX,
+    DEVICE_PRUNE_INTERVAL,
+    DOMAIN,
+    HISTORY_DB_FILE,
+    SEARCH_REFRESH_INTERVAL,
+    SIGNAL_ADD_DEVICES,
+    STORAGE_KEY_DEVICES,
+    STORAGE_KEY_SEARCH_INDEX,
+    STORAGE_KEY_SNAPSHOT,
+    STORAGE_KEY_WATCH_TIME,
+    STORAGE_VERSION,
+)
+from .search import SearchIndex
 from .sensor import EmbyDataUpdateCoordinator
+from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,33 +61,94 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Emby from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Create API client
-    session = async_get_clientsession(hass)
+    # Create API client with its own connection pool
+    ssl_context = None
+    if entry.data.get(CONF_VERIFY_SSL, False):
+        # Loading the CA bundle is blocking I/O
+        ssl_context = await hass.async_add_executor_job(client_context)
+    session = create_session(ssl_context)
     client = EmbyAPIClient(
         host=entry.data[CONF_HOST],
         port=entry.data[CONF_PORT],
         api_key=entry.data[CONF_API_KEY],
         session=session,
+        use_ssl=entry.data.get(CONF_SSL, False),
+        ssl_context=ssl_context,
     )
 
     # Create coordinator
-    coordinator = EmbyDataUpdateCoordinator(hass, client)
+    coordinator = EmbyDataUpdateCoordinator(hass, client, entry)
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Restore today's watch time totals and the device sightings
+    await coordinator.watch_time.async_load()
+    await coordinator.devices.async_load()
+
+    # Start from the last known data when available and fetch live data in
+    # the background, so a slow or offline server does not block setup
+    if await coordinator.async_load_snapshot():
+        hass.async_create_task(coordinator.async_refresh())
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Setup is retried with a new coordinator; stop this one's probes
+            await coordinator.async_close()
+            await session.close()
+            raise
+
+    # Optional local search index, answers from storage until refreshed
+    search_index = None
+    if entry.options.get(CONF_SEARCH_INDEX, False):
+        search_index = SearchIndex(hass, client, entry.entry_id)
+        await search_index.async_load()
 
     # Store coordinator and client
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "client": client,
+        "session": session,
+        "search_index": search_index,
+        # Options the entities were set up with, see async_options_updated
+        "options": dict(entry.options),
     }
+    async_setup_services(hass)
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Receive session updates over WebSocket, polling covers the rest
+    coordinator.async_start_websocket()
+
+    # Reset daily totals at local midnight
+    entry.async_on_unload(
+        async_track_time_change(
+            hass, coordinator.async_midnight, hour=0, minute=0, second=0
+        )
+    )
+
+    # Keep the search index up to date in the background
+    if search_index is not None:
+        hass.async_create_task(_async_refresh_search_index(search_index))
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                partial(_async_refresh_search_index, search_index),
+                SEARCH_REFRESH_INTERVAL,
+            )
+        )
+
     # Register options update listener
     entry.async_on_unload(entry.add_update_listener(async_options_updated))
 
+    # Monitor new devices automatically and drop the ones gone for good
+    if entry.options.get(CONF_AUTO_DISCOVERY, False):
+        coordinator.async_enable_discovery()
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass, coordinator.async_prune_devices, DEVICE_PRUNE_INTERVAL
+            )
+        )
+
     _LOGGER.info(
         "Emby integration setup complete for %s:%s",
         entry.data[CONF_HOST],
@@ -62,11 +158,73 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_refresh_search_index(
+    search_index: SearchIndex, now: datetime | None = None
+) -> None:
+    """Update the search index, keeping the current one on errors."""
+    try:
+        await search_index.async_refresh()
+    except EmbyAPIError as err:
+        _LOGGER.warning("Error updating the Emby search index: %s", err)
+
+
 async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
-    _LOGGER.info("Options updated for entry %s, reloading platforms", entry.entry_id)
-    # Reload the config entry to apply new device settings
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options update.
+
+    Added or removed monitored devices are applied in place; any other
+    change reloads the entry.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    previous, entry_data["options"] = entry_data["options"], dict(entry.options)
+
+    if {**previous, "monitored_devices": None} != {
+        **entry.options,
+        "monitored_devices": None,
+    }:
+        _LOGGER.info("Options updated for entry %s, reloading platforms", entry.entry_id)
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    old = {device["device_id"] for device in previous.get("monitored_devices", [])}
+    monitored = entry.options.get("monitored_devices", [])
+    added = [device for device in monitored if device["device_id"] not in old]
+    removed = old - {device["device_id"] for device in monitored}
+
+    coordinator = entry_data["coordinator"]
+    coordinator.devices.async_monitored_changed(
+        [device["device_id"] for device in added], list(removed)
+    )
+    if removed:
+        _async_remove_devices(hass, entry, coordinator, removed)
+    if added:
+        async_dispatcher_send(
+            hass, SIGNAL_ADD_DEVICES.format(entry_id=entry.entry_id), added
+        )
+    _LOGGER.info(
+        "Monitored devices updated for entry %s: %d added, %d removed",
+        entry.entry_id,
+        len(added),
+        len(removed),
+    )
+
+
+@callback
+def _async_remove_devices(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: EmbyDataUpdateCoordinator,
+    device_ids: set[str],
+) -> None:
+    """Remove the devices of unmonitored Emby devices, with their entities."""
+    system_info = (coordinator.data or {}).get("system_info") or {}
+    server_id = system_info.get("Id", entry.entry_id)
+    registry = dr.async_get(hass)
+    for device_id in device_ids:
+        device = registry.async_get_device(
+            identifiers={(DOMAIN, f"{server_id}_device_{device_id}")}
+        )
+        if device is not None:
+            registry.async_remove_device(device.id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -74,6 +232,39 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["coordinator"].async_close()
+        if data["search_index"] is not None:
+            await data["search_index"].async_flush()
+        await data["session"].close()
+        async_unload_services(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored data when a config entry is deleted."""
+    for key in (
+        STORAGE_KEY_SNAPSHOT,
+        STORAGE_KEY_WATCH_TIME,
+        STORAGE_KEY_SEARCH_INDEX,
+        STORAGE_KEY_DEVICES,
+    ):
+        store = Store(hass, STORAGE_VERSION, key.format(entry_id=entry.entry_id))
+        await store.async_remove()
+
+    history_path = hass.config.path(
+        STORAGE_DIR, HISTORY_DB_FILE.format(entry_id=entry.entry_id)
+    )
+    await hass.async_add_executor_job(_remove_file, history_path)
+
+    artwork_path = hass.config.path(
+        STORAGE_DIR, ARTWORK_DIR.format(entry_id=entry.entry_id)
+    )
+    await hass.async_add_executor_job(ArtworkCache.remove, artwork_path)
+
+
+def _remove_file(path: str) -> None:
+    """Delete a file if it exists."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
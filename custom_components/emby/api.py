@@ -2,32 +2,137 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import logging
+import random
+import re
+import ssl
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiohttp
 import async_timeout
 
+try:
+    import orjson
+except ImportError:  # Optional; Home Assistant ships it
+    orjson = None
+
 from .const import (
     API_ENDPOINT_ACTIVITY_LOG,
     API_ENDPOINT_DEVICES,
+    API_ENDPOINT_ITEM_IMAGE,
+    API_ENDPOINT_ITEMS,
     API_ENDPOINT_ITEMS_COUNTS,
     API_ENDPOINT_LIBRARY_FOLDERS,
     API_ENDPOINT_SCHEDULED_TASKS,
+    API_ENDPOINT_SESSION_COMMAND,
+    API_ENDPOINT_SESSION_PLAYING,
     API_ENDPOINT_SESSIONS,
     API_ENDPOINT_SYSTEM_ENDPOINT,
     API_ENDPOINT_SYSTEM_INFO,
     API_ENDPOINT_SYSTEM_INFO_PUBLIC,
+    API_ENDPOINT_USER_ITEMS,
     API_ENDPOINT_USERS,
+    API_ENDPOINT_WEBSOCKET,
+    ARTWORK_MAX_WIDTH,
+    ARTWORK_QUALITY,
+    BROWSE_PAGE_SIZE,
+    BREAKER_BACKOFF_MAX,
+    BREAKER_BACKOFF_MIN,
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    BREAKER_PROBE_TIMEOUT,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTLS,
+    CONNECTOR_DNS_TTL,
+    CONNECTOR_KEEPALIVE,
+    CONNECTOR_LIMIT,
     DEFAULT_TIMEOUT,
     ERROR_AUTH,
     ERROR_CONNECT,
     ERROR_TIMEOUT,
     ERROR_UNKNOWN,
+    SESSIONS_QUERY,
+    WEBSOCKET_DEVICE_ID,
+    WEBSOCKET_HEARTBEAT,
+    WEBSOCKET_RECONNECT_MAX,
+    WEBSOCKET_RECONNECT_MIN,
+    WEBSOCKET_SESSIONS_START,
 )
+from .stats import EndpointStats, LatencyRecorder
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sections returned by get_dashboard_overview, in request order
+DASHBOARD_SECTIONS: tuple[str, ...] = (
+    "system_info",
+    "endpoint_info",
+    "items_counts",
+    "library_folders",
+    "sessions",
+    "users",
+    "activity_log",
+    "scheduled_tasks",
+    "devices",
+)
+
+# Sections whose payload is a JSON array rather than an object
+_LIST_SECTIONS = frozenset({"sessions", "users", "scheduled_tasks"})
+
+# Item, session and device ids in a path; statistics group them as {id}
+_ID_SEGMENT = re.compile(r"/(?:\d+|[0-9a-fA-F]{32}|[0-9a-fA-F-]{36})(?=/|$)")
+
+
+def json_loads(body: bytes) -> Any:
+    """Decode a JSON body, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def json_dumps_sorted(value: Any) -> bytes | str:
+    """Serialize a value with sorted keys, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def create_session(ssl_context: ssl.SSLContext | None = None) -> aiohttp.ClientSession:
+    """Create a session with a connection pool for a single Emby server.
+
+    Keeps a few connections alive and caches DNS, so dashboard bursts
+    reuse warm connections and do not compete with other integrations
+    for the shared Home Assistant pool. The caller closes the session.
+
+    Args:
+        ssl_context: Context used to verify HTTPS certificates; None
+            accepts any certificate (self-signed servers)
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTOR_LIMIT,
+        limit_per_host=CONNECTOR_LIMIT,
+        keepalive_timeout=CONNECTOR_KEEPALIVE,
+        ttl_dns_cache=CONNECTOR_DNS_TTL,
+        ssl=ssl_context if ssl_context is not None else False,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def empty_section(name: str) -> Any:
+    """Return the placeholder used when a section could not be fetched."""
+    return [] if name in _LIST_SECTIONS else {}
+
 
 class EmbyAPIError(Exception):
     """Base exception for Emby API errors."""
@@ -45,6 +150,10 @@ class EmbyTimeoutError(EmbyAPIError):
     """Timeout error."""
 
 
+class EmbyCircuitOpenError(EmbyConnectionError):
+    """Request not sent because the server is considered unreachable."""
+
+
 class EmbyAPIClient:
     """Emby API Client."""
 
@@ -55,6 +164,7 @@ class EmbyAPIClient:
         api_key: str,
         session: aiohttp.ClientSession,
         use_ssl: bool = False,
+        ssl_context: ssl.SSLContext | None = None,
     ) -> None:
         """Initialize the API client.
 
@@ -64,13 +174,49 @@ class EmbyAPIClient:
             api_key: Emby API key
             session: aiohttp ClientSession
             use_ssl: Whether to use HTTPS
+            ssl_context: Context used to verify HTTPS certificates; None
+                accepts any certificate (self-signed servers)
         """
         self.host = host
         self.port = port
         self.api_key = api_key
         self.session = session
         self.use_ssl = use_ssl
+        # Passed as the ssl argument of every request
+        self.ssl: ssl.SSLContext | bool = ssl_context if ssl_context is not None else False
         self.base_url = f"{'https' if use_ssl else 'http'}://{host}:{port}"
+        # In-flight GET requests, keyed by endpoint and params
+        self._inflight: dict[tuple[str, tuple[tuple[str, Any], ...]], asyncio.Future] = {}
+        self.coalesced_requests = 0
+        # Cached GET responses: key -> (monotonic expiry, response), LRU order
+        self._cache: OrderedDict[
+            tuple[str, tuple[tuple[str, Any], ...]], tuple[float, Any]
+        ] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Last GET response per request: key -> (ETag, Last-Modified, body
+        # hash, decoded response), for conditional requests, LRU order
+        self._validators: OrderedDict[
+            tuple[str, tuple[tuple[str, Any], ...]],
+            tuple[str | None, str | None, int, Any],
+        ] = OrderedDict()
+        self.not_modified = 0
+        # Latency, bytes, status codes and failures per endpoint
+        self.endpoint_stats: dict[str, EndpointStats] = {}
+        # Duration of get_dashboard_sections calls
+        self.refresh_latency = LatencyRecorder()
+        # Milliseconds per section of the last get_dashboard_sections call
+        self.last_section_timings: dict[str, float] = {}
+        # Total time spent decoding JSON bodies (ms)
+        self.decode_ms = 0.0
+        # Circuit breaker, see _record_failure
+        self.breaker_state = BREAKER_CLOSED
+        self.breaker_retry_at: datetime | None = None
+        self.consecutive_failures = 0
+        self._breaker_trips = 0
+        self._breaker_listener: Callable[[str], None] | None = None
+        self._probe_handle: asyncio.TimerHandle | None = None
+        self._probe_task: asyncio.Task | None = None
 
     async def _request(
         self,
@@ -79,19 +225,280 @@ class EmbyAPIClient:
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         timeout: int = DEFAULT_TIMEOUT,
+        conditional: bool = True,
     ) -> Any:
         """Make a request to the Emby API.
 
+        Identical GET requests that overlap share one round trip: later
+        callers await the request already in flight and get the same
+        result object, so callers must not modify it. GET responses of
+        endpoints listed in CACHE_TTLS are served from memory until they
+        expire, also while the circuit breaker is open.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             data: Request body data
             params: URL parameters
             timeout: Request timeout in seconds
+            conditional: Use and remember validators (see _send); off for
+                large one-off responses that should not be kept
 
         Returns:
             Response data (dict or list)
 
+        Raises:
+            EmbyAuthError: Authentication failed
+            EmbyConnectionError: Connection failed
+            EmbyTimeoutError: Request timeout
+            EmbyCircuitOpenError: Server is unreachable, request not sent
+            EmbyAPIError: Other API errors
+        """
+        if method != "GET" or data is not None:
+            if self.breaker_state != BREAKER_CLOSED:
+                raise EmbyCircuitOpenError(ERROR_CONNECT)
+            return await self._send(method, endpoint, data, params, timeout, conditional)
+
+        key = self._request_key(endpoint, params)
+        ttl = CACHE_TTLS.get(endpoint)
+        if ttl is not None:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached[1]
+            self.cache_misses += 1
+
+        # Fresh cached responses are still served while the breaker is open
+        if self.breaker_state != BREAKER_CLOSED:
+            raise EmbyCircuitOpenError(ERROR_CONNECT)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced_requests += 1
+            _LOGGER.debug("Joining in-flight request to %s", endpoint)
+        else:
+            inflight = asyncio.ensure_future(
+                self._send(method, endpoint, data, params, timeout, conditional)
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda fut: self._request_done(key, fut))
+
+        # Shielded so one caller being cancelled does not cancel the others
+        result = await asyncio.shield(inflight)
+
+        if ttl is not None and result is not None:
+            self._cache[key] = (time.monotonic() + ttl, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return result
+
+    def _remember_response(
+        self,
+        key: tuple[str, tuple[tuple[str, Any], ...]],
+        etag: str | None,
+        last_modified: str | None,
+        body_hash: int,
+        result: Any,
+    ) -> None:
+        """Store the validators and decoded body of a GET response."""
+        self._validators[key] = (etag, last_modified, body_hash, result)
+        self._validators.move_to_end(key)
+        while len(self._validators) > CACHE_MAX_ENTRIES:
+            self._validators.popitem(last=False)
+
+    def _endpoint_stats(self, endpoint: str) -> EndpointStats:
+        """Return the statistics of an endpoint, created on first use.
+
+        Ids in the path are replaced by {id}, so per-item endpoints share
+        one entry.
+        """
+        endpoint = _ID_SEGMENT.sub("/{id}", endpoint)
+        stats = self.endpoint_stats.get(endpoint)
+        if stats is None:
+            stats = self.endpoint_stats[endpoint] = EndpointStats()
+        return stats
+
+    def slowest_endpoint(self) -> tuple[str, float] | None:
+        """Return the endpoint with the highest recent p95 latency (ms)."""
+        slowest = None
+        for endpoint, stats in self.endpoint_stats.items():
+            p95 = stats.latency.percentile(95)
+            if p95 is not None and (slowest is None or p95 > slowest[1]):
+                slowest = (endpoint, p95)
+        return slowest
+
+    def set_breaker_listener(self, listener: Callable[[str], None] | None) -> None:
+        """Set a callback invoked with the new state whenever the breaker changes."""
+        self._breaker_listener = listener
+
+    def _record_success(self) -> None:
+        """Reset the breaker after the server answered."""
+        self.consecutive_failures = 0
+        if self.breaker_state == BREAKER_CLOSED:
+            return
+
+        _LOGGER.info("Emby server at %s is reachable again", self.base_url)
+        self._breaker_trips = 0
+        self.breaker_retry_at = None
+        if self._probe_handle is not None:
+            self._probe_handle.cancel()
+            self._probe_handle = None
+        self._set_breaker_state(BREAKER_CLOSED)
+
+    def _record_failure(self) -> None:
+        """Count a failed round trip and open the breaker when needed.
+
+        After BREAKER_FAILURE_THRESHOLD consecutive failures requests are
+        no longer sent; instead /System/Info/Public is probed on a
+        jittered exponential schedule until the server answers.
+        """
+        self.consecutive_failures += 1
+        if self.breaker_state == BREAKER_HALF_OPEN or (
+            self.breaker_state == BREAKER_CLOSED
+            and self.consecutive_failures >= BREAKER_FAILURE_THRESHOLD
+        ):
+            self._open_breaker()
+
+    def _open_breaker(self) -> None:
+        """Stop sending requests and schedule the next probe."""
+        backoff = min(BREAKER_BACKOFF_MAX, BREAKER_BACKOFF_MIN * 2**self._breaker_trips)
+        # Jitter so several clients do not probe in lockstep
+        delay = random.uniform(backoff / 2, backoff)
+        self._breaker_trips += 1
+        self.breaker_retry_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+        if self.breaker_state == BREAKER_CLOSED:
+            _LOGGER.warning(
+                "Emby server at %s unreachable after %d failed requests, "
+                "pausing requests",
+                self.base_url,
+                self.consecutive_failures,
+            )
+        _LOGGER.debug("Next Emby probe in %.1fs", delay)
+        self._probe_handle = asyncio.get_running_loop().call_later(
+            delay, self._start_probe
+        )
+        self._set_breaker_state(BREAKER_OPEN)
+
+    def _start_probe(self) -> None:
+        """Probe the server once."""
+        self._probe_handle = None
+        self._set_breaker_state(BREAKER_HALF_OPEN)
+        self._probe_task = asyncio.ensure_future(self._probe())
+
+    async def _probe(self) -> None:
+        """Request the public system info; _send updates the breaker.
+
+        A probe that fails without _send counting it, e.g. on an
+        unexpected error, still reopens the breaker so probing goes on.
+        """
+        try:
+            await self._send(
+                "GET",
+                API_ENDPOINT_SYSTEM_INFO_PUBLIC,
+                timeout=BREAKER_PROBE_TIMEOUT,
+                conditional=False,
+            )
+        except EmbyAPIError:
+            pass
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error probing Emby at %s", self.base_url)
+        if self.breaker_state == BREAKER_HALF_OPEN:
+            self._record_failure()
+
+    def _set_breaker_state(self, state: str) -> None:
+        """Store the breaker state and notify the listener."""
+        self.breaker_state = state
+        if self._breaker_listener is not None:
+            self._breaker_listener(state)
+
+    async def close(self) -> None:
+        """Cancel pending breaker probes."""
+        self._breaker_listener = None
+        if self._probe_handle is not None:
+            self._probe_handle.cancel()
+            self._probe_handle = None
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._probe_task
+            self._probe_task = None
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return response cache counters, for diagnostics."""
+        return {
+            "response_cache_entries": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "conditional_entries": len(self._validators),
+            "not_modified": self.not_modified,
+            "coalesced_requests": self.coalesced_requests,
+        }
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """Drop cached responses.
+
+        Args:
+            endpoint: Only drop responses of this endpoint; all if None
+        """
+        if endpoint is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[0] == endpoint]:
+            del self._cache[key]
+
+    @staticmethod
+    def _request_key(
+        endpoint: str, params: dict[str, Any] | None
+    ) -> tuple[str, tuple[tuple[str, Any], ...]]:
+        """Return the key identifying a GET request."""
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    def _request_done(
+        self, key: tuple[str, tuple[tuple[str, Any], ...]], future: asyncio.Future
+    ) -> None:
+        """Forget a finished in-flight request."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the error as retrieved in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        conditional: bool = True,
+        raw: bool = False,
+        extra_headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Send a single request to the Emby API.
+
+        GET requests send the validators of the previous response
+        (If-None-Match / If-Modified-Since). On a 304, or a 200 whose body
+        is byte-identical to the previous one, the previously decoded
+        object is returned without parsing, so unchanged data keeps its
+        identity all the way to the entities.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: URL parameters
+            timeout: Request timeout in seconds
+            conditional: Use and remember validators for GET requests
+            raw: Return the undecoded response, see get_image
+            extra_headers: Headers added to the request
+
+        Returns:
+            Response data (dict or list); with raw, a (status, body,
+            headers) tuple. None if the endpoint was not found.
+
         Raises:
             EmbyAuthError: Authentication failed
             EmbyConnectionError: Connection failed
@@ -102,9 +509,24 @@ class EmbyAPIClient:
         headers = {
             "X-Emby-Token": self.api_key,
             "Accept": "application/json",
+            **(extra_headers or {}),
         }
 
+        key = None
+        previous = None
+        if conditional and method == "GET" and data is None:
+            key = self._request_key(endpoint, params)
+            previous = self._validators.get(key)
+            if previous is not None:
+                if previous[0]:
+                    headers["If-None-Match"] = previous[0]
+                if previous[1]:
+                    headers["If-Modified-Since"] = previous[1]
+
         _LOGGER.debug("Making %s request to %s", method, endpoint)
+        started = time.monotonic()
+        status: int | None = None
+        size = 0
 
         try:
             async with async_timeout.timeout(timeout):
@@ -114,9 +536,12 @@ class EmbyAPIClient:
                     headers=headers,
                     json=data,
                     params=params,
-                    ssl=False,  # Allow self-signed certs
+                    ssl=self.ssl,
                 ) as response:
                     _LOGGER.debug("Response status: %s", response.status)
+                    status = response.status
+                    if response.status < 500:
+                        self._record_success()
 
                     if response.status == 401:
                         raise EmbyAuthError(ERROR_AUTH)
@@ -125,25 +550,70 @@ class EmbyAPIClient:
                         _LOGGER.warning("Endpoint not found: %s", endpoint)
                         return None
 
+                    if raw:
+                        response.raise_for_status()
+                        body = await response.read()
+                        size = len(body)
+                        return response.status, body, response.headers
+
+                    if response.status == 304 and previous is not None:
+                        self.not_modified += 1
+                        return previous[3]
+
                     response.raise_for_status()
 
-                    # Parse response
-                    if response.content_type == "application/json":
-                        return await response.json()
+                    body = await response.read()
+                    size = len(body)
+                    body_hash = hash(body)
+                    if previous is not None and previous[2] == body_hash:
+                        # No validators, or the server ignored them
+                        self.not_modified += 1
+                        result = previous[3]
+                    elif response.content_type == "application/json":
+                        decode_started = time.monotonic()
+                        result = json_loads(body)
+                        decode_ms = (time.monotonic() - decode_started) * 1000
+                        self.decode_ms += decode_ms
+                        self._endpoint_stats(endpoint).decode_ms += decode_ms
+                    else:
+                        result = body.decode(response.charset or "utf-8")
 
-                    return await response.text()
+                    if key is not None:
+                        self._remember_response(
+                            key,
+                            response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"),
+                            body_hash,
+                            result,
+                        )
+                    return result
 
         except asyncio.TimeoutError as err:
-            _LOGGER.error("Timeout connecting to Emby at %s", url)
+            # Failed probes are expected while the breaker is open
+            log = _LOGGER.error if self.breaker_state == BREAKER_CLOSED else _LOGGER.debug
+            log("Timeout connecting to Emby at %s", url)
+            self._record_failure()
             raise EmbyTimeoutError(ERROR_TIMEOUT) from err
         except aiohttp.ClientError as err:
-            _LOGGER.error("Error connecting to Emby: %s", err)
+            log = _LOGGER.error if self.breaker_state == BREAKER_CLOSED else _LOGGER.debug
+            log("Error connecting to Emby: %s", err)
+            if not (
+                isinstance(err, aiohttp.ClientResponseError) and err.status < 500
+            ):
+                self._record_failure()
             raise EmbyConnectionError(ERROR_CONNECT) from err
         except EmbyAuthError:
             raise
         except Exception as err:
             _LOGGER.error("Unexpected error: %s", err)
             raise EmbyAPIError(ERROR_UNKNOWN) from err
+        finally:
+            self._endpoint_stats(endpoint).record(
+                (time.monotonic() - started) * 1000,
+                status,
+                size,
+                failed=status is None or status >= 400,
+            )
 
     async def get_system_info(self) -> dict[str, Any]:
         """Get complete system information.
@@ -211,6 +681,112 @@ class EmbyAPIClient:
         """
         return await self._request("GET", API_ENDPOINT_LIBRARY_FOLDERS)
 
+    async def get_items_page(
+        self,
+        item_types: str,
+        start_index: int,
+        limit: int,
+        min_date_last_saved: str | None = None,
+    ) -> dict[str, Any]:
+        """Get one page of library items with only their names.
+
+        Args:
+            item_types: Comma separated Emby item types
+            start_index: Index of the first item
+            limit: Maximum number of items; 0 only counts them
+            min_date_last_saved: Only items saved at or after this UTC
+                time (ISO 8601)
+
+        Returns:
+            Dict with 'Items' (Id, Name, Type, ProductionYear,
+            SeriesName) and 'TotalRecordCount'
+        """
+        params: dict[str, Any] = {
+            "Recursive": "true",
+            "IncludeItemTypes": item_types,
+            "StartIndex": start_index,
+            "Limit": limit,
+            "SortBy": "DateCreated",
+            "Fields": "ProductionYear",
+            "EnableImages": "false",
+            "EnableUserData": "false",
+            "EnableTotalRecordCount": "true",
+        }
+        if min_date_last_saved:
+            params["MinDateLastSaved"] = min_date_last_saved
+        result = await self._request(
+            "GET", API_ENDPOINT_ITEMS, params=params, conditional=False
+        )
+        return result or {"Items": [], "TotalRecordCount": 0}
+
+    async def search_items(
+        self, term: str, limit: int, item_types: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Search the library on the server.
+
+        Args:
+            term: Search term
+            limit: Maximum number of items
+            item_types: Comma separated Emby item types, all if None
+
+        Returns:
+            List of item dicts (Id, Name, Type, ProductionYear, SeriesName)
+        """
+        params: dict[str, Any] = {
+            "SearchTerm": term,
+            "Recursive": "true",
+            "Limit": limit,
+            "Fields": "ProductionYear",
+            "EnableImages": "false",
+            "EnableUserData": "false",
+        }
+        if item_types:
+            params["IncludeItemTypes"] = item_types
+        result = await self._request(
+            "GET", API_ENDPOINT_ITEMS, params=params, conditional=False
+        )
+        return (result or {}).get("Items", [])
+
+    async def get_user_items(
+        self,
+        user_id: str,
+        parent_id: str,
+        start_index: int = 0,
+        limit: int = BROWSE_PAGE_SIZE,
+    ) -> dict[str, Any]:
+        """Get one page of the children of a library folder.
+
+        Args:
+            user_id: User whose view of the library is browsed
+            parent_id: Id of the folder, series, season or album
+            start_index: Index of the first child
+            limit: Maximum number of children
+
+        Returns:
+            Dict with 'Items' (children sorted by name) and
+            'TotalRecordCount' (number of children of the folder)
+        """
+        params = {
+            "ParentId": parent_id,
+            "StartIndex": start_index,
+            "Limit": limit,
+            "SortBy": "SortName",
+            "SortOrder": "Ascending",
+            "Fields": "ChildCount",
+            "EnableImageTypes": "Primary",
+            "ImageTypeLimit": 1,
+            "EnableUserData": "false",
+            "EnableTotalRecordCount": "true",
+        }
+        # Pages are cached by the library browser, not by validators
+        result = await self._request(
+            "GET",
+            API_ENDPOINT_USER_ITEMS.format(user_id=user_id),
+            params=params,
+            conditional=False,
+        )
+        return result or {"Items": [], "TotalRecordCount": 0}
+
     async def get_sessions(self) -> list[dict[str, Any]]:
         """Get active sessions.
 
@@ -224,8 +800,140 @@ class EmbyAPIClient:
                 - NowPlayingItem
                 - LastActivityDate
                 etc.
+
+            NowPlayingItem is projected by SESSIONS_QUERY and has no
+            MediaStreams; use get_media_streams for track details.
+        """
+        return await self._request("GET", API_ENDPOINT_SESSIONS, params=SESSIONS_QUERY)
+
+    async def send_playstate_command(
+        self, session_id: str, command: str, seek_position_ticks: int | None = None
+    ) -> None:
+        """Send a playback command to a session.
+
+        Args:
+            session_id: Id of the session (not of the device)
+            command: Stop, Pause, Unpause, PlayPause, NextTrack,
+                PreviousTrack or Seek
+            seek_position_ticks: Target position of a Seek
         """
-        return await self._request("GET", API_ENDPOINT_SESSIONS)
+        params = None
+        if seek_position_ticks is not None:
+            params = {"SeekPositionTicks": seek_position_ticks}
+        await self._request(
+            "POST",
+            API_ENDPOINT_SESSION_PLAYING.format(session_id=session_id, command=command),
+            params=params,
+        )
+
+    async def send_general_command(
+        self, session_id: str, name: str, arguments: dict[str, str] | None = None
+    ) -> None:
+        """Send a general command, such as SetVolume or Mute, to a session.
+
+        Args:
+            session_id: Id of the session (not of the device)
+            name: Command name
+            arguments: Command arguments; Emby expects string values
+        """
+        await self._request(
+            "POST",
+            API_ENDPOINT_SESSION_COMMAND.format(session_id=session_id),
+            data={"Name": name, "Arguments": arguments or {}},
+        )
+
+    async def get_media_streams(self, item_ids: Iterable[str]) -> dict[str, list]:
+        """Get the audio, video and subtitle streams of items.
+
+        Args:
+            item_ids: Ids of the items
+
+        Returns:
+            Dict of item id to its list of MediaStreams
+        """
+        params = {"Ids": ",".join(item_ids), "Fields": "MediaStreams"}
+        result = await self._request(
+            "GET", API_ENDPOINT_ITEMS, params=params, conditional=False
+        )
+        return {
+            item["Id"]: item.get("MediaStreams") or []
+            for item in (result or {}).get("Items", [])
+        }
+
+    async def get_image(
+        self,
+        item_id: str,
+        image_type: str = "Primary",
+        tag: str | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> tuple[int, bytes, Any] | None:
+        """Download an item image, resized by the server.
+
+        Args:
+            item_id: Id of the item
+            image_type: Emby image type (Primary, Backdrop, Thumb, ...)
+            tag: Image tag of the item, lets Emby serve its cached rendition
+            etag: ETag of a cached copy, for revalidation
+            last_modified: Last-Modified of a cached copy, for revalidation
+
+        Returns:
+            (status, body, headers), status 304 with an empty body if the
+            cached copy is still valid. None if the item has no such image.
+
+        Raises:
+            EmbyCircuitOpenError: Server is unreachable, request not sent
+            EmbyAPIError: The request failed (see _send)
+        """
+        if self.breaker_state != BREAKER_CLOSED:
+            raise EmbyCircuitOpenError(ERROR_CONNECT)
+
+        params: dict[str, Any] = {
+            "maxWidth": ARTWORK_MAX_WIDTH,
+            "quality": ARTWORK_QUALITY,
+            "format": "jpg",
+        }
+        if tag:
+            params["tag"] = tag
+        headers = {"Accept": "image/*"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        return await self._send(
+            "GET",
+            API_ENDPOINT_ITEM_IMAGE.format(item_id=item_id, image_type=image_type),
+            params=params,
+            conditional=False,
+            raw=True,
+            extra_headers=headers,
+        )
+
+    async def measure_sessions_projection(self) -> dict[str, int]:
+        """Measure the bytes saved by the /Sessions projection.
+
+        Fetches the session list once with and once without SESSIONS_QUERY
+        and compares the body sizes. Sessions outside ActiveWithinSeconds
+        are part of the savings.
+
+        Returns:
+            Dict with full_bytes, projected_bytes and saved_bytes
+        """
+        sizes = []
+        for params in (None, SESSIONS_QUERY):
+            # Unconditional, so both bodies are downloaded in full
+            await self._send(
+                "GET", API_ENDPOINT_SESSIONS, params=params, conditional=False
+            )
+            sizes.append(self.endpoint_stats[API_ENDPOINT_SESSIONS].latest_size)
+
+        full_bytes, projected_bytes = sizes
+        return {
+            "full_bytes": full_bytes,
+            "projected_bytes": projected_bytes,
+            "saved_bytes": full_bytes - projected_bytes,
+        }
 
     async def get_users(self) -> list[dict[str, Any]]:
         """Get all users.
@@ -242,11 +950,18 @@ class EmbyAPIClient:
         """
         return await self._request("GET", API_ENDPOINT_USERS)
 
-    async def get_activity_log(self, limit: int = 10) -> dict[str, Any]:
-        """Get activity log entries.
+    async def get_activity_log(
+        self,
+        limit: int = 10,
+        start_index: int = 0,
+        min_date: str | None = None,
+    ) -> dict[str, Any]:
+        """Get activity log entries, newest first.
 
         Args:
             limit: Maximum number of entries to return
+            start_index: Index of the first entry, for paging
+            min_date: Only return entries at or after this ISO date
 
         Returns:
             Dict with 'Items' key containing list of activity objects:
@@ -258,8 +973,18 @@ class EmbyAPIClient:
                 - Severity
                 etc.
         """
-        params = {"limit": limit}
-        return await self._request("GET", API_ENDPOINT_ACTIVITY_LOG, params=params)
+        params: dict[str, Any] = {"limit": limit}
+        if start_index:
+            params["startIndex"] = start_index
+        if min_date:
+            params["minDate"] = min_date
+        # Only the dashboard query repeats; history pages move with the mark
+        return await self._request(
+            "GET",
+            API_ENDPOINT_ACTIVITY_LOG,
+            params=params,
+            conditional=not start_index and min_date is None,
+        )
 
     async def get_scheduled_tasks(self) -> list[dict[str, Any]]:
         """Get scheduled tasks.
@@ -294,6 +1019,58 @@ class EmbyAPIClient:
         """
         return await self._request("GET", API_ENDPOINT_DEVICES)
 
+    async def get_dashboard_sections(self, sections: Iterable[str]) -> dict[str, Any]:
+        """Fetch a subset of the dashboard data with concurrent requests.
+
+        Args:
+            sections: Section names to fetch (see get_dashboard_overview)
+
+        Returns:
+            Dict with one entry per section that was fetched successfully.
+            Failed sections are logged and left out.
+        """
+        fetchers = {
+            "system_info": self.get_system_info,
+            "endpoint_info": self.get_system_endpoint,
+            "items_counts": self.get_items_counts,
+            "library_folders": self.get_library_folders,
+            "sessions": self.get_sessions,
+            "users": self.get_users,
+            "activity_log": lambda: self.get_activity_log(10),
+            "scheduled_tasks": self.get_scheduled_tasks,
+            "devices": self.get_devices,
+        }
+        names = [name for name in sections if name in fetchers]
+        _LOGGER.debug("Fetching %d dashboard sections: %s", len(names), names)
+
+        timings: dict[str, float] = {}
+
+        async def timed(name: str) -> Any:
+            section_started = time.monotonic()
+            try:
+                return await fetchers[name]()
+            finally:
+                timings[name] = round((time.monotonic() - section_started) * 1000, 1)
+
+        # Execute all requests concurrently for better performance
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(timed(name) for name in names),
+            return_exceptions=True,
+        )
+        self.refresh_latency.record((time.monotonic() - started) * 1000)
+        self.last_section_timings = timings
+
+        # Process results with graceful degradation
+        data: dict[str, Any] = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Request for %s failed: %s", name, result)
+                continue
+            data[name] = result if result is not None else empty_section(name)
+
+        return data
+
     async def get_dashboard_overview(self) -> dict[str, Any]:
         """Get complete dashboard data with concurrent requests.
 
@@ -311,49 +1088,8 @@ class EmbyAPIClient:
                 - scheduled_tasks: Scheduled tasks
                 - devices: Connected devices
         """
-        _LOGGER.debug("Fetching dashboard overview (9 concurrent requests)")
-
-        # Execute all requests concurrently for better performance
-        results = await asyncio.gather(
-            self.get_system_info(),
-            self.get_system_endpoint(),
-            self.get_items_counts(),
-            self.get_library_folders(),
-            self.get_sessions(),
-            self.get_users(),
-            self.get_activity_log(10),
-            self.get_scheduled_tasks(),
-            self.get_devices(),
-            return_exceptions=True,
-        )
-
-        # Process results with graceful degradation
-        system_info = results[0] if not isinstance(results[0], Exception) else {}
-        endpoint_info = results[1] if not isinstance(results[1], Exception) else {}
-        items_counts = results[2] if not isinstance(results[2], Exception) else {}
-        library_folders = results[3] if not isinstance(results[3], Exception) else {}
-        sessions = results[4] if not isinstance(results[4], Exception) else []
-        users = results[5] if not isinstance(results[5], Exception) else []
-        activity_log = results[6] if not isinstance(results[6], Exception) else {}
-        scheduled_tasks = results[7] if not isinstance(results[7], Exception) else []
-        devices = results[8] if not isinstance(results[8], Exception) else {}
-
-        # Log any errors
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                _LOGGER.warning("Request %d failed: %s", i, result)
-
-        return {
-            "system_info": system_info,
-            "endpoint_info": endpoint_info,
-            "items_counts": items_counts,
-            "library_folders": library_folders,
-            "sessions": sessions,
-            "users": users,
-            "activity_log": activity_log,
-            "scheduled_tasks": scheduled_tasks,
-            "devices": devices,
-        }
+        data = await self.get_dashboard_sections(DASHBOARD_SECTIONS)
+        return {name: data.get(name, empty_section(name)) for name in DASHBOARD_SECTIONS}
 
     async def test_connection(self) -> bool:
         """Test the connection to Emby server.
@@ -367,3 +1103,153 @@ class EmbyAPIClient:
         except Exception as err:
             _LOGGER.error("Connection test failed: %s", err)
             return False
+
+
+class EmbyWebSocket:
+    """Persistent push subscription to the Emby server.
+
+    Connects to /embywebsocket, subscribes to session updates with a
+    SessionsStart message and hands every Sessions payload to a callback.
+    The connection is re-established with exponential backoff when it drops.
+    """
+
+    def __init__(
+        self,
+        client: EmbyAPIClient,
+        on_sessions: Callable[[list[dict[str, Any]]], None],
+        on_connection_change: Callable[[bool], None] | None = None,
+        device_id: str = WEBSOCKET_DEVICE_ID,
+    ) -> None:
+        """Initialize the WebSocket client.
+
+        Args:
+            client: API client providing session, host and API key
+            on_sessions: Called with the session list on every push
+            on_connection_change: Called with True/False on connect/disconnect
+            device_id: Device id reported to Emby for this connection
+        """
+        self.client = client
+        self.device_id = device_id
+        self._on_sessions = on_sessions
+        self._on_connection_change = on_connection_change
+        self._task: asyncio.Task | None = None
+        self._keepalive_task: asyncio.Task | None = None
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._connected = False
+        self._closing = False
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the push subscription is active."""
+        return self._connected
+
+    @property
+    def url(self) -> str:
+        """Return the WebSocket URL of the Emby server."""
+        scheme = "wss" if self.client.use_ssl else "ws"
+        return f"{scheme}://{self.client.host}:{self.client.port}{API_ENDPOINT_WEBSOCKET}"
+
+    def start(self) -> None:
+        """Start the connection loop in the background."""
+        self._closing = False
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the connection and stop reconnecting."""
+        self._closing = True
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._set_connected(False)
+
+    async def _run(self) -> None:
+        """Connect, listen and reconnect with exponential backoff."""
+        backoff = WEBSOCKET_RECONNECT_MIN
+        while not self._closing:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+                _LOGGER.debug("Emby WebSocket error: %s", err)
+            except Exception:  # pylint: disable=broad-except
+                # Keep reconnecting, and polling meanwhile, whatever went wrong
+                _LOGGER.exception("Unexpected error in the Emby WebSocket")
+
+            # A connection that was established resets the backoff
+            if self._connected:
+                backoff = WEBSOCKET_RECONNECT_MIN
+            self._set_connected(False)
+
+            if self._closing:
+                break
+
+            _LOGGER.debug("Reconnecting Emby WebSocket in %s seconds", backoff)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, WEBSOCKET_RECONNECT_MAX)
+
+    async def _listen(self) -> None:
+        """Open one connection and process messages until it closes."""
+        params = {"api_key": self.client.api_key, "deviceId": self.device_id}
+
+        async with self.client.session.ws_connect(
+            self.url,
+            params=params,
+            heartbeat=WEBSOCKET_HEARTBEAT,
+            ssl=self.client.ssl,
+        ) as ws:
+            self._ws = ws
+            await ws.send_json(
+                {"MessageType": "SessionsStart", "Data": WEBSOCKET_SESSIONS_START}
+            )
+            self._set_connected(True)
+            _LOGGER.debug("Emby WebSocket connected to %s", self.url)
+
+            try:
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        await self._handle_message(msg.json(loads=json_loads))
+                    elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                        break
+            finally:
+                self._ws = None
+                if self._keepalive_task is not None:
+                    self._keepalive_task.cancel()
+                    self._keepalive_task = None
+
+    async def _handle_message(self, message: dict[str, Any]) -> None:
+        """Dispatch a single message received from the server."""
+        message_type = message.get("MessageType")
+
+        if message_type == "Sessions":
+            sessions = message.get("Data")
+            if isinstance(sessions, list):
+                self._on_sessions(sessions)
+
+        elif message_type == "ForceKeepAlive":
+            # Server closes idle sockets unless we answer within Data seconds
+            timeout = message.get("Data") or 60
+            if self._keepalive_task is None:
+                self._keepalive_task = asyncio.create_task(
+                    self._keepalive(max(timeout / 2, 1))
+                )
+
+    async def _keepalive(self, interval: float) -> None:
+        """Send KeepAlive messages while the connection is open."""
+        with contextlib.suppress(ConnectionError, aiohttp.ClientError):
+            while self._ws is not None and not self._ws.closed:
+                await self._ws.send_json({"MessageType": "KeepAlive"})
+                await asyncio.sleep(interval)
+
+    def _set_connected(self, connected: bool) -> None:
+        """Update connection state and notify the listener on change."""
+        if connected == self._connected:
+            return
+        self._connected = connected
+        if self._on_connection_change is not None and not self._closing:
+            self._on_connection_change(connected)
@@ -0,0 +1,195 @@
+"""Artwork cache for the Emby integration."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import re
+import shutil
+import time
+from collections import OrderedDict
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .api import EmbyAPIClient, EmbyAPIError
+from .const import ARTWORK_DISK_ENTRIES, ARTWORK_MEMORY_ENTRIES, ARTWORK_REVALIDATE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Images are requested as JPEG, see EmbyAPIClient.get_image
+CONTENT_TYPE = "image/jpeg"
+
+# (item id, image type, image tag)
+ArtworkKey = tuple[str, str, str | None]
+
+# Emby ids, image types and tags; anything else could escape the cache folder
+_SAFE_ID = re.compile(r"[A-Za-z0-9]+")
+
+
+class ArtworkCache:
+    """Resized item images kept in memory and on disk.
+
+    Emby changes an image's tag whenever the image changes, so an image
+    cached under its tag never needs revalidation and is served without
+    contacting the server, from memory or, after a restart, from disk.
+    Images without a tag are kept in memory only and revalidated with
+    If-None-Match / If-Modified-Since after ARTWORK_REVALIDATE seconds.
+    Both caches drop the least recently used images when full.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: EmbyAPIClient, path: str) -> None:
+        """Initialize the cache; path is the folder of the disk cache."""
+        self.hass = hass
+        self.client = client
+        self.path = path
+        # Key -> (content, ETag, Last-Modified, monotonic fetch time), LRU order
+        self._memory: OrderedDict[
+            ArtworkKey, tuple[bytes, str | None, str | None, float]
+        ] = OrderedDict()
+        # Downloads in flight, shared by concurrent requests for one image
+        self._pending: dict[ArtworkKey, asyncio.Future] = {}
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.downloads = 0
+        self.revalidated = 0
+
+    async def async_get_image(
+        self, item_id: str, image_type: str = "Primary", tag: str | None = None
+    ) -> tuple[bytes | None, str | None]:
+        """Return (content, content type) of an image, (None, None) if unavailable."""
+        if not all(
+            _SAFE_ID.fullmatch(value) for value in (item_id, image_type, tag or "0")
+        ):
+            _LOGGER.debug("Refusing artwork request for item %r", item_id)
+            return None, None
+
+        key = (item_id, image_type, tag)
+        cached = self._memory.get(key)
+        if cached is not None and (
+            tag or time.monotonic() - cached[3] < ARTWORK_REVALIDATE
+        ):
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return cached[0], CONTENT_TYPE
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._async_load(key, cached))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        # Shielded so one browser disconnecting does not cancel the others
+        content = await asyncio.shield(pending)
+        return (content, CONTENT_TYPE) if content is not None else (None, None)
+
+    async def _async_load(
+        self,
+        key: ArtworkKey,
+        cached: tuple[bytes, str | None, str | None, float] | None,
+    ) -> bytes | None:
+        """Load an image from disk, or download or revalidate it."""
+        item_id, image_type, tag = key
+        if tag:
+            content = await self.hass.async_add_executor_job(
+                self._read_file, self._file_path(key)
+            )
+            if content is not None:
+                self.disk_hits += 1
+                self._remember(key, (content, None, None, time.monotonic()))
+                return content
+
+        try:
+            result = await self.client.get_image(
+                item_id,
+                image_type,
+                tag,
+                etag=cached[1] if cached else None,
+                last_modified=cached[2] if cached else None,
+            )
+        except EmbyAPIError as err:
+            _LOGGER.debug("Could not fetch artwork of item %s: %s", item_id, err)
+            # A stale image is better than none
+            return cached[0] if cached else None
+
+        if result is None:
+            return None
+        status, content, headers = result
+        if status == 304 and cached is not None:
+            self.revalidated += 1
+            self._remember(key, (*cached[:3], time.monotonic()))
+            return cached[0]
+
+        self.downloads += 1
+        self._remember(
+            key,
+            (content, headers.get("ETag"), headers.get("Last-Modified"), time.monotonic()),
+        )
+        if tag:
+            await self.hass.async_add_executor_job(
+                self._write_file, self._file_path(key), content
+            )
+        return content
+
+    def _remember(
+        self, key: ArtworkKey, entry: tuple[bytes, str | None, str | None, float]
+    ) -> None:
+        """Store an image in memory, dropping the least recently used."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > ARTWORK_MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def _file_path(self, key: ArtworkKey) -> str:
+        """Return the disk cache file of a tagged image.
+
+        The parts of the key were checked against _SAFE_ID, so the name
+        stays inside the cache folder.
+        """
+        item_id, image_type, tag = key
+        return os.path.join(self.path, f"{item_id}_{image_type}_{tag}.jpg")
+
+    @staticmethod
+    def _read_file(path: str) -> bytes | None:
+        """Read a cached image and mark it as recently used."""
+        try:
+            with open(path, "rb") as file:
+                content = file.read()
+        except OSError:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return content
+
+    def _write_file(self, path: str, content: bytes) -> None:
+        """Write an image to disk and drop the least recently used files."""
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, path)
+
+            files = [entry for entry in os.scandir(self.path) if entry.is_file()]
+            if len(files) > ARTWORK_DISK_ENTRIES:
+                files.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in files[: len(files) - ARTWORK_DISK_ENTRIES]:
+                    os.remove(entry.path)
+        except OSError as err:
+            _LOGGER.warning("Could not write the artwork cache: %s", err)
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters, for diagnostics."""
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "downloads": self.downloads,
+            "revalidated": self.revalidated,
+        }
+
+    @staticmethod
+    def remove(path: str) -> None:
+        """Delete the disk cache folder."""
+        shutil.rmtree(path, ignore_errors=True)
@@ -11,7 +11,6 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     BINARY_SENSOR_TYPE_ACTIVE_STREAMS,
@@ -20,6 +19,7 @@ from .const import (
     BINARY_SENSOR_TYPE_ONLINE,
     BINARY_SENSOR_TYPE_PENDING_RESTART,
     BINARY_SENSOR_TYPE_TASKS_RUNNING,
+    BREAKER_CLOSED,
     DOMAIN,
     ICON_FOLDER,
     ICON_NETWORK,
@@ -30,6 +30,7 @@ from .const import (
     INTEGRATION_VERSION,
     TASK_STATE_RUNNING,
 )
+from .entity import EmbyEntity
 from .sensor import EmbyDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,7 +59,7 @@ async def async_setup_entry(
     async_add_entities(binary_sensors)
 
 
-class EmbyBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
+class EmbyBinarySensorBase(EmbyEntity, BinarySensorEntity):
     """Base class for Emby binary sensors."""
 
     def __init__(
@@ -99,6 +100,8 @@ class EmbyBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
 class EmbyOnlineBinarySensor(EmbyBinarySensorBase):
     """Emby server online binary sensor."""
 
+    _fingerprint_keys = ("system_info", "breaker")
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -110,12 +113,35 @@ class EmbyOnlineBinarySensor(EmbyBinarySensorBase):
         self._attr_icon = ICON_ONLINE
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Include the failure count shown in the attributes."""
+        return (
+            *super()._state_fingerprint(),
+            self.coordinator.client.consecutive_failures,
+        )
+
     @property
     def is_on(self) -> bool:
         """Return true if server is online."""
+        if not self.coordinator.last_update_success or not self.coordinator.data:
+            return False
+        if self.coordinator.client.breaker_state != BREAKER_CLOSED:
+            return False
         system_info = self.coordinator.data.get("system_info", {})
         return bool(system_info.get("ServerName"))
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the circuit breaker state."""
+        client = self.coordinator.client
+        return {
+            "circuit_breaker": client.breaker_state,
+            "consecutive_failures": client.consecutive_failures,
+            "next_retry": (
+                client.breaker_retry_at.isoformat() if client.breaker_retry_at else None
+            ),
+        }
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -125,6 +151,8 @@ class EmbyOnlineBinarySensor(EmbyBinarySensorBase):
 class EmbyActiveStreamsBinarySensor(EmbyBinarySensorBase):
     """Emby active streams binary sensor."""
 
+    _fingerprint_keys = ("sessions",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -137,29 +165,20 @@ class EmbyActiveStreamsBinarySensor(EmbyBinarySensorBase):
         self._attr_device_class = BinarySensorDeviceClass.RUNNING
         self._device_filter = entry.data.get("device_id")
 
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
-
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Include the session cadence shown in the attributes."""
         return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
+            *super()._state_fingerprint(),
+            self.coordinator.sessions_interval,
+            self.coordinator.cadence_changes,
         )
 
     @property
     def is_on(self) -> bool:
         """Return true if there are active streams."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
         # Check if any session matching device filter is playing content
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 return True
@@ -168,12 +187,9 @@ class EmbyActiveStreamsBinarySensor(EmbyBinarySensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
         active_streams = []
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 active_streams.append({
@@ -184,7 +200,12 @@ class EmbyActiveStreamsBinarySensor(EmbyBinarySensorBase):
                     "type": now_playing.get("Type"),
                 })
 
-        result = {"active_streams": active_streams}
+        result = {
+            "active_streams": active_streams,
+            # Current session poll cadence and how often it has switched
+            "refresh_interval": self.coordinator.sessions_interval,
+            "refresh_interval_changes": self.coordinator.cadence_changes,
+        }
 
         # Add device filter info
         if self._device_filter and self._device_filter != "all":
@@ -200,6 +221,8 @@ class EmbyActiveStreamsBinarySensor(EmbyBinarySensorBase):
 class EmbyTasksRunningBinarySensor(EmbyBinarySensorBase):
     """Emby tasks running binary sensor."""
 
+    _fingerprint_keys = ("scheduled_tasks",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -238,6 +261,8 @@ class EmbyTasksRunningBinarySensor(EmbyBinarySensorBase):
 class EmbyPendingRestartBinarySensor(EmbyBinarySensorBase):
     """Emby pending restart binary sensor."""
 
+    _fingerprint_keys = ("system_info",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -259,6 +284,8 @@ class EmbyPendingRestartBinarySensor(EmbyBinarySensorBase):
 class EmbyInNetworkBinarySensor(EmbyBinarySensorBase):
     """Emby in network binary sensor."""
 
+    _fingerprint_keys = ("endpoint_info",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -288,6 +315,8 @@ class EmbyInNetworkBinarySensor(EmbyBinarySensorBase):
 class EmbyLibraryScanningBinarySensor(EmbyBinarySensorBase):
     """Emby library scanning binary sensor."""
 
+    _fingerprint_keys = ("scheduled_tasks",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
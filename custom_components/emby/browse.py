@@ -0,0 +1,215 @@
+"""Media browsing for the Emby integration."""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.components.media_player import BrowseMedia, MediaClass, MediaType
+from homeassistant.components.media_player.errors import BrowseError
+
+from .api import EmbyAPIClient, EmbyAPIError
+from .const import BROWSE_CACHE_ENTRIES, BROWSE_CACHE_TTL, BROWSE_PAGE_SIZE
+
+# Content id of the list of libraries
+ROOT_ID = "library"
+
+# Emby item type -> media class of the browse node
+ITEM_CLASSES: dict[str, MediaClass] = {
+    "CollectionFolder": MediaClass.DIRECTORY,
+    "Folder": MediaClass.DIRECTORY,
+    "UserView": MediaClass.DIRECTORY,
+    "BoxSet": MediaClass.DIRECTORY,
+    "Playlist": MediaClass.PLAYLIST,
+    "Movie": MediaClass.MOVIE,
+    "Series": MediaClass.TV_SHOW,
+    "Season": MediaClass.SEASON,
+    "Episode": MediaClass.EPISODE,
+    "Video": MediaClass.VIDEO,
+    "MusicVideo": MediaClass.VIDEO,
+    "MusicAlbum": MediaClass.ALBUM,
+    "MusicArtist": MediaClass.ARTIST,
+    "Audio": MediaClass.TRACK,
+    "PhotoAlbum": MediaClass.ALBUM,
+    "Photo": MediaClass.IMAGE,
+}
+
+# Thumbnail URL of an item: (item id, image tag) -> URL
+ThumbnailUrl = Callable[[str, str], str]
+
+
+class LibraryBrowser:
+    """Library tree for media browsing, fetched one page at a time.
+
+    Opening a folder requests only the BROWSE_PAGE_SIZE children being
+    shown; the rest of the folder is behind a "next page" node. Pages are
+    kept for BROWSE_CACHE_TTL seconds (least recently used first out) and
+    dropped early when the coordinator sees the library counts change.
+    """
+
+    def __init__(self, client: EmbyAPIClient) -> None:
+        """Initialize the browser."""
+        self.client = client
+        # (user id, parent id, start index) -> (monotonic expiry, page), LRU order
+        self._pages: OrderedDict[tuple[str, str, int], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        # Item id -> name, for the titles of folder nodes
+        self._titles: dict[str, str] = {}
+        self.page_hits = 0
+        self.page_misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return page cache counters, for diagnostics."""
+        return {
+            "pages": len(self._pages),
+            "page_hits": self.page_hits,
+            "page_misses": self.page_misses,
+        }
+
+    def invalidate(self) -> None:
+        """Drop every cached page."""
+        self._pages.clear()
+        self._titles.clear()
+
+    async def _async_get_page(
+        self, user_id: str, parent_id: str, start_index: int
+    ) -> dict[str, Any]:
+        """Return a page of children, from the cache when still fresh."""
+        key = (user_id, parent_id, start_index)
+        cached = self._pages.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._pages.move_to_end(key)
+            self.page_hits += 1
+            return cached[1]
+
+        self.page_misses += 1
+        page = await self.client.get_user_items(user_id, parent_id, start_index)
+        self._pages[key] = (time.monotonic() + BROWSE_CACHE_TTL, page)
+        self._pages.move_to_end(key)
+        while len(self._pages) > BROWSE_CACHE_ENTRIES:
+            self._pages.popitem(last=False)
+        return page
+
+    async def async_browse(
+        self,
+        user_id: str | None,
+        media_content_id: str | None,
+        thumbnail_url: ThumbnailUrl,
+    ) -> BrowseMedia:
+        """Return the browse node of a content id.
+
+        Content ids are ROOT_ID, an item id, or "<item id>:<start index>"
+        for the later pages of a folder.
+
+        Raises:
+            BrowseError: The library could not be read
+        """
+        try:
+            if media_content_id in (None, "", ROOT_ID):
+                return await self._async_browse_root()
+            if not user_id:
+                raise BrowseError("No Emby user to browse the library as")
+            parent_id, _, start = media_content_id.partition(":")
+            return await self._async_browse_folder(
+                user_id, parent_id, int(start or 0), thumbnail_url
+            )
+        except EmbyAPIError as err:
+            raise BrowseError(f"Could not browse Emby library: {err}") from err
+        except ValueError as err:
+            raise BrowseError(f"Unknown media content id: {media_content_id}") from err
+
+    async def _async_browse_root(self) -> BrowseMedia:
+        """Return the list of libraries."""
+        folders = (await self.client.get_library_folders() or {}).get("Items", [])
+        for folder in folders:
+            self._titles[folder["Id"]] = folder.get("Name", folder["Id"])
+        return BrowseMedia(
+            media_class=MediaClass.DIRECTORY,
+            media_content_id=ROOT_ID,
+            media_content_type=MediaType.APP,
+            title="Emby",
+            can_play=False,
+            can_expand=True,
+            children=[
+                BrowseMedia(
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_id=folder["Id"],
+                    media_content_type=folder.get("CollectionType") or "folder",
+                    title=self._titles[folder["Id"]],
+                    can_play=False,
+                    can_expand=True,
+                )
+                for folder in folders
+            ],
+            children_media_class=MediaClass.DIRECTORY,
+        )
+
+    async def _async_browse_folder(
+        self,
+        user_id: str,
+        parent_id: str,
+        start_index: int,
+        thumbnail_url: ThumbnailUrl,
+    ) -> BrowseMedia:
+        """Return one page of a folder, plus a node for the next page."""
+        page = await self._async_get_page(user_id, parent_id, start_index)
+        items = page.get("Items", [])
+        total = page.get("TotalRecordCount", len(items))
+
+        children = [self._item_node(item, thumbnail_url) for item in items]
+        next_index = start_index + len(items)
+        if items and next_index < total:
+            children.append(
+                BrowseMedia(
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_id=f"{parent_id}:{next_index}",
+                    media_content_type="folder",
+                    title=(
+                        f"下一页（{next_index + 1}-"
+                        f"{min(next_index + BROWSE_PAGE_SIZE, total)} / {total}）"
+                    ),
+                    can_play=False,
+                    can_expand=True,
+                )
+            )
+
+        child_classes = {child.media_class for child in children[: len(items)]}
+        title = self._titles.get(parent_id, "Emby")
+        if start_index:
+            title = f"{title}（{start_index + 1}-{next_index} / {total}）"
+        return BrowseMedia(
+            media_class=MediaClass.DIRECTORY,
+            media_content_id=(
+                f"{parent_id}:{start_index}" if start_index else parent_id
+            ),
+            media_content_type="folder",
+            title=title,
+            can_play=False,
+            can_expand=True,
+            children=children,
+            children_media_class=(
+                child_classes.pop() if len(child_classes) == 1 else MediaClass.DIRECTORY
+            ),
+        )
+
+    def _item_node(self, item: dict[str, Any], thumbnail_url: ThumbnailUrl) -> BrowseMedia:
+        """Return the browse node of a library item."""
+        item_type = item.get("Type", "")
+        tag = (item.get("ImageTags") or {}).get("Primary")
+        title = item.get("Name", item["Id"])
+        if item.get("IsFolder"):
+            self._titles[item["Id"]] = title
+        if item_type == "Episode" and item.get("IndexNumber") is not None:
+            title = f"{item['IndexNumber']}. {title}"
+
+        return BrowseMedia(
+            media_class=ITEM_CLASSES.get(item_type, MediaClass.VIDEO),
+            media_content_id=item["Id"],
+            media_content_type=item_type or "folder",
+            title=title,
+            can_play=False,
+            can_expand=bool(item.get("IsFolder")),
+            thumbnail=thumbnail_url(item["Id"], tag) if tag else None,
+        )
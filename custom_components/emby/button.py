@@ -8,7 +8,6 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     BUTTON_TYPE_REFRESH,
@@ -18,6 +17,7 @@ from .const import (
     ICON_REFRESH,
     INTEGRATION_VERSION,
 )
+from .entity import EmbyEntity
 from .sensor import EmbyDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,9 +41,11 @@ async def async_setup_entry(
     async_add_entities(buttons)
 
 
-class EmbyButtonBase(CoordinatorEntity, ButtonEntity):
+class EmbyButtonBase(EmbyEntity, ButtonEntity):
     """Base class for Emby buttons."""
 
+    _fingerprint_keys = ()
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -95,7 +97,7 @@ class EmbyRefreshButton(EmbyButtonBase):
     async def async_press(self) -> None:
         """Handle the button press."""
         _LOGGER.info("Refresh button pressed, updating data")
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_full_refresh()
 
 
 class EmbyTestConnectionButton(EmbyButtonBase):
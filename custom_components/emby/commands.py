@@ -0,0 +1,130 @@
+"""Remote control command queue for the Emby integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import EmbyAPIClient, EmbyAPIError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands sent to /Sessions/{id}/Playing/{command}; others are general commands
+PLAYSTATE_COMMANDS = frozenset(
+    {"Stop", "Pause", "Unpause", "PlayPause", "NextTrack", "PreviousTrack", "Seek"}
+)
+
+# Commands that set the same state; a later one replaces a queued earlier one
+_COALESCE_GROUPS: dict[str, str] = {
+    "Seek": "seek",
+    "SetVolume": "volume",
+    "Mute": "mute",
+    "Unmute": "mute",
+    "Pause": "pause",
+    "Unpause": "pause",
+}
+
+# (command name, value, called if sending fails)
+Command = tuple[str, int | None, Callable[[], None] | None]
+
+
+class SessionCommandQueue:
+    """Commands for one Emby session, sent in order, one at a time.
+
+    A command queued right behind a waiting command of the same group
+    (seeks, volume levels, mute, pause) replaces it, so dragging a slider
+    sends the first and the last position instead of every step. When
+    the queue drains, on_idle is called once, for a single session
+    refresh after a burst of commands.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: EmbyAPIClient,
+        session_id: str,
+        on_idle: Callable[[], None],
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self.client = client
+        self.session_id = session_id
+        self._on_idle = on_idle
+        self._pending: list[Command] = []
+        self._task: asyncio.Task | None = None
+        self.sent = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    @property
+    def busy(self) -> bool:
+        """Return True while commands are waiting or in flight."""
+        return self._task is not None
+
+    @callback
+    def async_send(
+        self,
+        command: str,
+        value: int | None = None,
+        on_error: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue a command.
+
+        Args:
+            command: Playstate command (see PLAYSTATE_COMMANDS) or general
+                command name
+            value: Position in ticks for Seek, 0-100 for SetVolume
+            on_error: Called if the command could not be sent
+        """
+        group = _COALESCE_GROUPS.get(command)
+        if (
+            group is not None
+            and self._pending
+            and _COALESCE_GROUPS.get(self._pending[-1][0]) == group
+        ):
+            self._pending[-1] = (command, value, on_error)
+            self.coalesced += 1
+        else:
+            self._pending.append((command, value, on_error))
+
+        if self._task is None:
+            self._task = self.hass.async_create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        """Send the queued commands until none are left."""
+        try:
+            while self._pending:
+                command, value, on_error = self._pending.pop(0)
+                try:
+                    await self._async_send(command, value)
+                except EmbyAPIError as err:
+                    _LOGGER.warning(
+                        "Could not send %s to Emby session %s: %s",
+                        command,
+                        self.session_id,
+                        err,
+                    )
+                    self.failed += 1
+                    if on_error is not None:
+                        on_error()
+                else:
+                    self.sent += 1
+        finally:
+            self._task = None
+        self._on_idle()
+
+    async def _async_send(self, command: str, value: int | None) -> None:
+        """Send one command to the server."""
+        _LOGGER.debug("Sending %s (%s) to Emby session %s", command, value, self.session_id)
+        if command in PLAYSTATE_COMMANDS:
+            await self.client.send_playstate_command(
+                self.session_id, command, value if command == "Seek" else None
+            )
+        elif command == "SetVolume":
+            await self.client.send_general_command(
+                self.session_id, command, {"Volume": str(value)}
+            )
+        else:
+            await self.client.send_general_command(self.session_id, command)
@@ -8,13 +8,28 @@ import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SSL, CONF_VERIFY_SSL
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.ssl import client_context
 
 from .api import EmbyAPIClient, EmbyAPIError, EmbyAuthError
-from .const import CONF_API_KEY, DEFAULT_NAME, DEFAULT_PORT, DOMAIN
+from .const import (
+    API_ENDPOINT_DEVICES,
+    CONF_API_KEY,
+    CONF_AUTO_DISCOVERY,
+    CONF_SCAN_INTERVAL_IDLE,
+    CONF_SCAN_INTERVAL_PLAYING,
+    CONF_SEARCH_INDEX,
+    DEFAULT_NAME,
+    DEFAULT_PORT,
+    DEFAULT_SCAN_INTERVAL_IDLE,
+    DEFAULT_SCAN_INTERVAL_PLAYING,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,22 +38,33 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_HOST): str,
         vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
         vol.Required(CONF_API_KEY): str,
+        vol.Optional(CONF_SSL, default=False): bool,
+        vol.Optional(CONF_VERIFY_SSL, default=False): bool,
     }
 )
 
 
+async def async_create_client(hass: HomeAssistant, data: dict[str, Any]) -> EmbyAPIClient:
+    """Create a client on the shared session for one-off flow requests."""
+    ssl_context = None
+    if data.get(CONF_VERIFY_SSL, False):
+        ssl_context = await hass.async_add_executor_job(client_context)
+    return EmbyAPIClient(
+        host=data[CONF_HOST],
+        port=data[CONF_PORT],
+        api_key=data[CONF_API_KEY],
+        session=async_get_clientsession(hass),
+        use_ssl=data.get(CONF_SSL, False),
+        ssl_context=ssl_context,
+    )
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    session = async_get_clientsession(hass)
-    client = EmbyAPIClient(
-        host=data[CONF_HOST],
-        port=data[CONF_PORT],
-        api_key=data[CONF_API_KEY],
-        session=session,
-    )
+    client = await async_create_client(hass, data)
 
     # Test the connection
     try:
@@ -118,6 +144,13 @@ class EmbyOptionsFlowHandler(config_entries.OptionsFlow):
         self.config_entry = config_entry
         self._devices = []
 
+    async def _async_get_client(self) -> EmbyAPIClient:
+        """Return the entry's API client, or a new one if it is not loaded."""
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if entry_data is not None:
+            return entry_data["client"]
+        return await async_create_client(self.hass, self.config_entry.data)
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -134,6 +167,12 @@ class EmbyOptionsFlowHandler(config_entries.OptionsFlow):
                 return await self.async_step_add_device()
             elif action == "remove_device":
                 return await self.async_step_remove_device()
+            elif action == "polling":
+                return await self.async_step_polling()
+            elif action == "search_index":
+                return await self.async_step_search_index()
+            elif action == "auto_discovery":
+                return await self.async_step_auto_discovery()
             elif action == "done":
                 return self.async_create_entry(title="", data=self.config_entry.options)
 
@@ -144,6 +183,7 @@ class EmbyOptionsFlowHandler(config_entries.OptionsFlow):
         if monitored_devices:
             device_list = "\n".join([
                 f"• {d['device_name']} ({d['user_name']})"
+                + ("（自动发现）" if d.get("discovered") else "")
                 for d in monitored_devices
             ])
             description = f"当前监控的设备：\n{device_list}"
@@ -156,6 +196,9 @@ class EmbyOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required("action", default="done"): vol.In({
                     "add_device": "添加监控设备",
                     "remove_device": "删除监控设备",
+                    "polling": "刷新频率设置",
+                    "search_index": "本地搜索索引",
+                    "auto_discovery": "自动发现设备",
                     "done": "完成",
                 }),
             }),
@@ -207,13 +250,9 @@ class EmbyOptionsFlowHandler(config_entries.OptionsFlow):
 
         # Fetch available devices
         try:
-            session = async_get_clientsession(self.hass)
-            client = EmbyAPIClient(
-                host=self.config_entry.data[CONF_HOST],
-                port=self.config_entry.data[CONF_PORT],
-                api_key=self.config_entry.data[CONF_API_KEY],
-                session=session,
-            )
+            client = await self._async_get_client()
+            # Always list the devices known right now
+            client.invalidate(API_ENDPOINT_DEVICES)
             devices_data = await client.get_devices()
             raw_devices = devices_data.get("Items", [])
 
@@ -272,6 +311,102 @@ class EmbyOptionsFlowHandler(config_entries.OptionsFlow):
             },
         )
 
+    async def async_step_polling(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure the adaptive session refresh interval."""
+        errors: dict[str, str] = {}
+        options = self.config_entry.options
+
+        if user_input is not None:
+            playing = user_input[CONF_SCAN_INTERVAL_PLAYING]
+            idle = user_input[CONF_SCAN_INTERVAL_IDLE]
+
+            if playing > idle:
+                errors["base"] = "invalid_interval"
+            else:
+                # Update options
+                new_options = {**options}
+                new_options[CONF_SCAN_INTERVAL_PLAYING] = playing
+                new_options[CONF_SCAN_INTERVAL_IDLE] = idle
+
+                # Save and return to device management
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    options=new_options
+                )
+
+                return await self.async_step_device_management()
+
+        interval_range = vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+        )
+
+        return self.async_show_form(
+            step_id="polling",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_SCAN_INTERVAL_PLAYING,
+                    default=options.get(
+                        CONF_SCAN_INTERVAL_PLAYING, DEFAULT_SCAN_INTERVAL_PLAYING
+                    ),
+                ): interval_range,
+                vol.Required(
+                    CONF_SCAN_INTERVAL_IDLE,
+                    default=options.get(
+                        CONF_SCAN_INTERVAL_IDLE, DEFAULT_SCAN_INTERVAL_IDLE
+                    ),
+                ): interval_range,
+            }),
+            errors=errors,
+        )
+
+    async def async_step_search_index(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Enable or disable the local search index."""
+        options = self.config_entry.options
+
+        if user_input is not None:
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                options={**options, CONF_SEARCH_INDEX: user_input[CONF_SEARCH_INDEX]},
+            )
+            return await self.async_step_device_management()
+
+        return self.async_show_form(
+            step_id="search_index",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_SEARCH_INDEX,
+                    default=options.get(CONF_SEARCH_INDEX, False),
+                ): bool,
+            }),
+        )
+
+    async def async_step_auto_discovery(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Enable or disable automatic device discovery."""
+        options = self.config_entry.options
+
+        if user_input is not None:
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                options={**options, CONF_AUTO_DISCOVERY: user_input[CONF_AUTO_DISCOVERY]},
+            )
+            return await self.async_step_device_management()
+
+        return self.async_show_form(
+            step_id="auto_discovery",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_AUTO_DISCOVERY,
+                    default=options.get(CONF_AUTO_DISCOVERY, False),
+                ): bool,
+            }),
+        )
+
     async def async_step_remove_device(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -12,6 +12,10 @@ INTEGRATION_VERSION: Final = "1.0.1"  # Integration version
 # Configuration
 CONF_API_KEY: Final = "api_key"
 CONF_DEVICE_ID: Final = "device_id"
+CONF_SCAN_INTERVAL_PLAYING: Final = "scan_interval_playing"
+CONF_SCAN_INTERVAL_IDLE: Final = "scan_interval_idle"
+CONF_SEARCH_INDEX: Final = "search_index"
+CONF_AUTO_DISCOVERY: Final = "auto_discovery"
 
 # API endpoints (all tested and verified - 11 working endpoints)
 API_ENDPOINT_SYSTEM_INFO: Final = "/System/Info"
@@ -20,15 +24,156 @@ API_ENDPOINT_SYSTEM_ENDPOINT: Final = "/System/Endpoint"
 API_ENDPOINT_ITEMS_COUNTS: Final = "/Items/Counts"
 API_ENDPOINT_LIBRARY_FOLDERS: Final = "/Library/MediaFolders"
 API_ENDPOINT_SESSIONS: Final = "/Sessions"
+API_ENDPOINT_SESSION_PLAYING: Final = "/Sessions/{session_id}/Playing/{command}"
+API_ENDPOINT_SESSION_COMMAND: Final = "/Sessions/{session_id}/Command"
 API_ENDPOINT_USERS: Final = "/Users"
 API_ENDPOINT_USERS_PUBLIC: Final = "/Users/Public"
+API_ENDPOINT_USER_ITEMS: Final = "/Users/{user_id}/Items"
 API_ENDPOINT_ACTIVITY_LOG: Final = "/System/ActivityLog/Entries"
 API_ENDPOINT_SCHEDULED_TASKS: Final = "/ScheduledTasks"
 API_ENDPOINT_DEVICES: Final = "/Devices"
+API_ENDPOINT_ITEMS: Final = "/Items"
+API_ENDPOINT_ITEM_IMAGE: Final = "/Items/{item_id}/Images/{image_type}"
+API_ENDPOINT_WEBSOCKET: Final = "/embywebsocket"
+
+# Sessions idle for longer than this are left out, polled or pushed
+SESSIONS_ACTIVE_WITHIN: Final = 960
+
+# /Sessions query: skip long-idle sessions and ask only for what is read.
+# MediaStreams are fetched per item only when track sensors need them
+SESSIONS_QUERY: Final = {
+    "ActiveWithinSeconds": SESSIONS_ACTIVE_WITHIN,
+    "Fields": "ProductionYear",
+    "EnableImages": "true",
+    "ImageTypeLimit": 1,
+    "EnableImageTypes": "Primary",
+    "EnableUserData": "false",
+}
+
+# Response cache freshness per endpoint (seconds); other endpoints are not cached
+CACHE_TTLS: Final = {
+    API_ENDPOINT_SYSTEM_INFO: 300,
+    API_ENDPOINT_SYSTEM_ENDPOINT: 300,
+    API_ENDPOINT_ITEMS_COUNTS: 300,
+    API_ENDPOINT_LIBRARY_FOLDERS: 600,
+    API_ENDPOINT_USERS: 300,
+    API_ENDPOINT_DEVICES: 300,
+}
+CACHE_MAX_ENTRIES: Final = 64
 
 # Update interval
 UPDATE_INTERVAL: Final = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
 
+# Adaptive session polling (seconds)
+# Fast while a monitored device is playing, slow while everything is idle
+DEFAULT_SCAN_INTERVAL_PLAYING: Final = 5
+DEFAULT_SCAN_INTERVAL_IDLE: Final = DEFAULT_SCAN_INTERVAL
+MIN_SCAN_INTERVAL: Final = 1
+MAX_SCAN_INTERVAL: Final = 600
+ADAPTIVE_IDLE_HYSTERESIS: Final = 3  # Idle samples in a row before slowing down
+
+# Connection pool dedicated to one Emby server
+CONNECTOR_LIMIT: Final = 10  # Concurrent connections
+CONNECTOR_KEEPALIVE: Final = 60  # Seconds an idle connection is kept open
+CONNECTOR_DNS_TTL: Final = 300  # Seconds a resolved address is cached
+
+# Request statistics
+LATENCY_BUCKETS: Final = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)  # ms
+LATENCY_SAMPLES: Final = 200  # Recent samples kept for percentiles
+
+# Refresh timings kept for diagnostics
+DIAGNOSTICS_REFRESH_HISTORY: Final = 20
+
+# Circuit breaker for an unreachable server
+BREAKER_FAILURE_THRESHOLD: Final = 5  # Consecutive failed requests before opening
+BREAKER_BACKOFF_MIN: Final = 5  # Seconds before the first probe
+BREAKER_BACKOFF_MAX: Final = 300
+BREAKER_PROBE_TIMEOUT: Final = 5
+BREAKER_CLOSED: Final = "closed"
+BREAKER_OPEN: Final = "open"
+BREAKER_HALF_OPEN: Final = "half_open"
+
+# Persisted last-known data, used to seed entities at startup
+STORAGE_VERSION: Final = 1
+STORAGE_KEY_SNAPSHOT: Final = "emby.{entry_id}.snapshot"
+SNAPSHOT_SAVE_DELAY: Final = 60  # Seconds to batch snapshot writes
+# Transient playback fields left out of the snapshot (also holds MediaStreams)
+SNAPSHOT_SESSION_EXCLUDE: Final = ("NowPlayingItem", "PlayState", "NowPlayingQueue")
+
+# Watch time accounting from session position deltas
+STORAGE_KEY_WATCH_TIME: Final = "emby.{entry_id}.watch_time"
+WATCH_TIME_SAVE_DELAY: Final = 60  # Seconds to batch writes
+WATCH_TIME_SEEK_TOLERANCE: Final = 5  # Seconds of advance beyond wall time
+
+# Local playback history built from the activity log
+HISTORY_DB_FILE: Final = "emby.{entry_id}.history.db"  # In the .storage folder
+HISTORY_PAGE_SIZE: Final = 100
+HISTORY_MAX_PAGES: Final = 20  # Per refresh; a longer backfill continues next time
+HISTORY_RETENTION_DAYS: Final = 30
+
+# Artwork served through the media player proxy
+ARTWORK_DIR: Final = "emby.{entry_id}.artwork"  # In the .storage folder
+ARTWORK_MAX_WIDTH: Final = 500  # Pixels requested from Emby
+ARTWORK_QUALITY: Final = 90  # JPEG quality requested from Emby
+ARTWORK_MEMORY_ENTRIES: Final = 32
+ARTWORK_DISK_ENTRIES: Final = 300
+ARTWORK_REVALIDATE: Final = 3600  # Seconds before an untagged image is revalidated
+
+# Media browsing
+BROWSE_PAGE_SIZE: Final = 100  # Children per page
+BROWSE_CACHE_TTL: Final = 600  # Seconds a fetched page is reused
+BROWSE_CACHE_ENTRIES: Final = 128
+
+# Local search index
+STORAGE_KEY_SEARCH_INDEX: Final = "emby.{entry_id}.search_index"
+SEARCH_ITEM_TYPES: Final = "Movie,Series,Episode,MusicArtist,MusicAlbum,Audio"
+SEARCH_PAGE_SIZE: Final = 1000
+SEARCH_REFRESH_INTERVAL: Final = timedelta(hours=1)
+SEARCH_FULL_REBUILD: Final = 86400  # Seconds between full rebuilds, which drop deleted items
+SEARCH_INDEX_SAVE_DELAY: Final = 30
+SEARCH_MAX_RESULTS: Final = 50
+
+# Remote control of sessions
+COMMAND_REFRESH_DELAY: Final = 1.0  # Seconds after the last command before re-reading sessions
+OPTIMISTIC_TIMEOUT: Final = 10  # Seconds optimistic state waits for the server to agree
+OPTIMISTIC_SEEK_TOLERANCE: Final = 5  # Seconds of difference still counted as agreeing
+
+# Automatic discovery of devices
+STORAGE_KEY_DEVICES: Final = "emby.{entry_id}.devices"
+DEVICES_SAVE_DELAY: Final = 60
+DEVICE_STALE_DAYS: Final = 30  # Discovered devices inactive this long are removed
+DEVICE_PRUNE_INTERVAL: Final = timedelta(hours=6)
+# Dispatcher signal carrying newly monitored devices to the platforms
+SIGNAL_ADD_DEVICES: Final = "emby_add_devices_{entry_id}"
+
+# Services
+SERVICE_SEARCH: Final = "search"
+
+# Local playback position extrapolation between session samples
+POSITION_UPDATE_INTERVAL: Final = timedelta(seconds=1)
+TICKS_PER_SECOND: Final = 10_000_000
+
+# Polling schedule per dashboard section (seconds)
+# Server metadata and library counts rarely change; sessions follow the
+# adaptive cadence above
+SECTION_POLL_INTERVALS: Final = {
+    "scheduled_tasks": 60,
+    "activity_log": 60,
+    "system_info": 900,
+    "endpoint_info": 900,
+    "items_counts": 900,
+    "library_folders": 900,
+    "users": 900,
+    "devices": 900,
+}
+
+# WebSocket push
+WEBSOCKET_DEVICE_ID: Final = "homeassistant-emby"
+WEBSOCKET_SESSIONS_START: Final = "0,1500"  # Initial delay, interval (ms)
+WEBSOCKET_HEARTBEAT: Final = 30  # Seconds between ping frames
+WEBSOCKET_RECONNECT_MIN: Final = 5  # Seconds before first reconnect attempt
+WEBSOCKET_RECONNECT_MAX: Final = 300  # Upper bound for reconnect backoff
+
 # Sensor types
 SENSOR_TYPE_VERSION: Final = "version"
 SENSOR_TYPE_SERVER_NAME: Final = "server_name"
@@ -53,6 +198,10 @@ SENSOR_TYPE_SUBTITLE_TRACK: Final = "subtitle_track"
 SENSOR_TYPE_AUDIO_TRACK: Final = "audio_track"
 SENSOR_TYPE_TODAY_PLAY_COUNT: Final = "today_play_count"
 SENSOR_TYPE_TODAY_WATCH_TIME: Final = "today_watch_time"
+SENSOR_TYPE_REFRESH_LATENCY_P50: Final = "refresh_latency_p50"
+SENSOR_TYPE_REFRESH_LATENCY_P95: Final = "refresh_latency_p95"
+SENSOR_TYPE_SLOWEST_ENDPOINT: Final = "slowest_endpoint"
+SENSOR_TYPE_REQUEST_FAILURES: Final = "request_failures"
 
 # Binary sensor types
 BINARY_SENSOR_TYPE_LIBRARY_SCANNING: Final = "library_scanning"
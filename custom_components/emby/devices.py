@@ -0,0 +1,167 @@
+"""Device discovery for the Emby integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DEVICE_STALE_DAYS, DEVICES_SAVE_DELAY, STORAGE_KEY_DEVICES, STORAGE_VERSION
+
+
+class DeviceTracker:
+    """Remember when each Emby device was last active.
+
+    Devices are seen in /Sessions (active now) and in /Devices (with the
+    time of their last activity). Devices active within DEVICE_STALE_DAYS
+    are discovery candidates, except the ones the user removed while they
+    were still active; older ones are stale. Sightings are persisted so a
+    restart does not make every device look new or fresh again.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the tracker."""
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_DEVICES.format(entry_id=entry_id)
+        )
+        # Set while a delayed save has not been written yet
+        self._save_pending = False
+        # Device id -> last activity (UTC)
+        self.last_seen: dict[str, datetime] = {}
+        # Device id -> monitored device entry of devices seen active recently
+        self._candidates: dict[str, dict[str, Any]] = {}
+        # Devices removed by the user, never discovered again
+        self.ignored: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Restore the sightings from storage."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for device_id, seen in stored.get("last_seen", {}).items():
+            parsed = dt_util.parse_datetime(seen)
+            if parsed is not None:
+                self.last_seen[device_id] = parsed
+        self.ignored = set(stored.get("ignored", []))
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save after DEVICES_SAVE_DELAY, batching frequent changes.
+
+        A pending save writes the state current when it runs, so it is
+        not pushed back by later changes.
+        """
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, DEVICES_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now, before the entry is unloaded."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the sightings to persist."""
+        self._save_pending = False
+        return {
+            "last_seen": {
+                device_id: seen.isoformat() for device_id, seen in self.last_seen.items()
+            },
+            "ignored": sorted(self.ignored),
+        }
+
+    @callback
+    def _async_seen(self, device: dict[str, Any], seen: datetime) -> bool:
+        """Record a sighting of a device.
+
+        Returns:
+            True if it moved the last activity of the device forward
+        """
+        device_id = device["device_id"]
+        previous = self.last_seen.get(device_id)
+        changed = previous is None or seen > previous
+        if changed:
+            self.last_seen[device_id] = seen
+        if dt_util.utcnow() - self.last_seen[device_id] < timedelta(days=DEVICE_STALE_DAYS):
+            self._candidates.setdefault(device_id, device)
+        return changed
+
+    @callback
+    def async_update_sessions(self, sessions: list[dict[str, Any]]) -> None:
+        """Record the devices of the current sessions as active now."""
+        now = dt_util.utcnow()
+        changed = False
+        for session in sessions:
+            if not session.get("DeviceId"):
+                continue
+            changed |= self._async_seen(
+                {
+                    "device_id": session["DeviceId"],
+                    "device_name": session.get("DeviceName", "Unknown"),
+                    "user_name": session.get("UserName", ""),
+                    "app_name": session.get("Client", ""),
+                },
+                now,
+            )
+        if changed:
+            self._async_schedule_save()
+
+    @callback
+    def async_update_devices(self, devices: dict[str, Any]) -> None:
+        """Record the last activity of the registered devices."""
+        changed = False
+        for device in devices.get("Items", []):
+            device_id = device.get("ReportedDeviceId") or device.get("Id")
+            seen = dt_util.parse_datetime(device.get("DateLastActivity") or "")
+            if not device_id or seen is None:
+                continue
+            if seen.tzinfo is None:
+                seen = seen.replace(tzinfo=dt_util.UTC)
+            changed |= self._async_seen(
+                {
+                    "device_id": device_id,
+                    "device_name": device.get("Name", "Unknown"),
+                    "user_name": device.get("LastUserName", ""),
+                    "app_name": device.get("AppName", ""),
+                },
+                seen,
+            )
+        if changed:
+            self._async_schedule_save()
+
+    @callback
+    def async_pop_candidates(self, known: set[str]) -> list[dict[str, Any]]:
+        """Return the recently active devices that are not known yet."""
+        candidates = [
+            device
+            for device_id, device in self._candidates.items()
+            if device_id not in known and device_id not in self.ignored
+        ]
+        self._candidates.clear()
+        return candidates
+
+    @callback
+    def async_monitored_changed(self, added: list[str], removed: list[str]) -> None:
+        """Ignore devices removed while still active, until added again.
+
+        Stale devices removed by pruning are discovered again once active.
+        """
+        now = dt_util.utcnow()
+        ignored = self.ignored - set(added)
+        ignored.update(
+            device_id for device_id in removed if not self.is_stale(device_id, now)
+        )
+        if ignored != self.ignored:
+            self.ignored = ignored
+            self._async_schedule_save()
+
+    def is_stale(self, device_id: str, now: datetime) -> bool:
+        """Return True if a device was not active for DEVICE_STALE_DAYS.
+
+        Devices never seen since tracking started count from now.
+        """
+        seen = self.last_seen.setdefault(device_id, now)
+        return now - seen >= timedelta(days=DEVICE_STALE_DAYS)
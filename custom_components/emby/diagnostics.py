@@ -0,0 +1,137 @@
+"""Diagnostics support for the Emby integration."""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .api import json_dumps_sorted
+from .const import CONF_API_KEY, DOMAIN
+
+TO_REDACT = {
+    CONF_API_KEY,
+    CONF_HOST,
+    "AccessToken",
+    "LocalAddress",
+    "LocalAddresses",
+    "RemoteAddresses",
+    "RemoteEndPoint",
+    "WanAddress",
+    "UserName",
+    "LastUserName",
+    "UserPrimaryImageTag",
+    "monitored_devices",
+}
+# Redacted only in these sections, "Name" is also used for items and tasks
+USER_TO_REDACT = {"Name"}
+ACTIVITY_TO_REDACT = {"Name", "ShortOverview", "Overview"}
+
+
+def _redact_sections(data: dict[str, Any]) -> dict[str, Any]:
+    """Redact the coordinator data, including user and activity log names."""
+    data = dict(data)
+    if "users" in data:
+        data["users"] = async_redact_data(data["users"], USER_TO_REDACT)
+    if "activity_log" in data:
+        data["activity_log"] = async_redact_data(data["activity_log"], ACTIVITY_TO_REDACT)
+    return async_redact_data(data, TO_REDACT)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    client = entry_data["client"]
+    search_index = entry_data["search_index"]
+    data = coordinator.data or {}
+
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "data": _redact_sections(data),
+        "payload_sizes": {
+            section: len(json_dumps_sorted(value)) for section, value in data.items()
+        },
+        "entities": {
+            "total": len(entities),
+            "by_domain": dict(Counter(entity.domain for entity in entities)),
+            "listeners": coordinator.listener_count,
+            "state_writes": coordinator.state_writes,
+            "state_writes_skipped": coordinator.state_writes_skipped,
+        },
+        "polling": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "sessions_interval": coordinator.sessions_interval,
+            "cadence_changes": coordinator.cadence_changes,
+            "websocket_connected": bool(
+                coordinator.websocket and coordinator.websocket.connected
+            ),
+        },
+        "caches": {
+            **client.cache_stats(),
+            "media_streams_items": len(coordinator.media_streams),
+            "playback_index_devices": len(coordinator.playback_index),
+            "sessions_projection": coordinator.sessions_projection,
+            "artwork": coordinator.artwork.stats(),
+            "browse": coordinator.library.stats(),
+        },
+        "search_index": (
+            {
+                "items": len(search_index),
+                "ready": search_index.ready,
+                "last_saved": (
+                    search_index.last_saved.isoformat() if search_index.last_saved else None
+                ),
+                "last_full": (
+                    search_index.last_full.isoformat() if search_index.last_full else None
+                ),
+            }
+            if search_index is not None
+            else None
+        ),
+        "discovery": {
+            "enabled": coordinator.discovery_enabled,
+            "tracked_devices": len(coordinator.devices.last_seen),
+            "ignored_devices": len(coordinator.devices.ignored),
+            "discovered_devices": sum(
+                1
+                for device in entry.options.get("monitored_devices", [])
+                if device.get("discovered")
+            ),
+        },
+        "commands": {
+            "queues": len(coordinator.command_queues),
+            "sent": sum(queue.sent for queue in coordinator.command_queues.values()),
+            "coalesced": sum(
+                queue.coalesced for queue in coordinator.command_queues.values()
+            ),
+            "failed": sum(queue.failed for queue in coordinator.command_queues.values()),
+        },
+        "circuit_breaker": {
+            "state": client.breaker_state,
+            "consecutive_failures": client.consecutive_failures,
+            "next_retry": (
+                client.breaker_retry_at.isoformat() if client.breaker_retry_at else None
+            ),
+        },
+        "requests": {
+            "refresh_p50_ms": client.refresh_latency.percentile(50),
+            "refresh_p95_ms": client.refresh_latency.percentile(95),
+            "refresh_histogram": client.refresh_latency.histogram(),
+            "decode_ms_total": round(client.decode_ms, 1),
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(client.endpoint_stats.items())
+            },
+        },
+        "refresh_timings": list(coordinator.refresh_timings),
+    }
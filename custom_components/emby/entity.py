@@ -0,0 +1,51 @@
+"""Base entity for the Emby integration."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .api import DASHBOARD_SECTIONS
+
+if TYPE_CHECKING:
+    from .sensor import EmbyDataUpdateCoordinator
+
+
+class EmbyEntity(CoordinatorEntity):
+    """Coordinator entity that only writes state when its data changed.
+
+    Each entity lists the coordinator fingerprint keys its state is derived
+    from (dashboard sections, or "device:<id>" for device entities). On a
+    coordinator update the entity compares the fingerprints with the ones
+    it last wrote and skips async_write_ha_state when nothing changed.
+    """
+
+    coordinator: EmbyDataUpdateCoordinator
+
+    # Fingerprint keys this entity's state depends on
+    _fingerprint_keys: tuple[str, ...] = DASHBOARD_SECTIONS
+
+    def __init__(self, coordinator: EmbyDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._last_fingerprint: tuple[Any, ...] | None = None
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return the fingerprint of the data this entity's state uses."""
+        return (
+            self.coordinator.last_update_success,
+            *(self.coordinator.fingerprint(key) for key in self._fingerprint_keys),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the entity's slice of data changed."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_fingerprint:
+            self.coordinator.state_writes_skipped += 1
+            return
+
+        self._last_fingerprint = fingerprint
+        self.coordinator.state_writes += 1
+        super()._handle_coordinator_update()
@@ -0,0 +1,257 @@
+"""Local playback history for the Emby integration.
+
+Activity log entries are fetched incrementally and appended to a small
+SQLite database, so daily counters do not depend on how many entries a
+single request returns.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS activity (
+        id INTEGER PRIMARY KEY,
+        date TEXT NOT NULL,
+        type TEXT,
+        name TEXT,
+        user_id TEXT,
+        user_name TEXT,
+        item_id TEXT,
+        is_playback INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_activity_playback_date "
+    "ON activity (is_playback, date)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+)
+
+# Meta key of the date the next incremental fetch starts from
+META_HIGH_WATER_MARK = "high_water_mark"
+# Meta keys of an unfinished backfill: next start index, newest date seen
+META_BACKFILL_START = "backfill_start"
+META_BACKFILL_NEWEST = "backfill_newest"
+
+
+def is_playback_entry(entry: dict[str, Any]) -> bool:
+    """Return True if an activity log entry is a playback event."""
+    entry_type = entry.get("Type") or ""
+    return "Playback" in entry_type or entry_type == "PlaybackStart"
+
+
+def normalize_date(value: str | None) -> str | None:
+    """Return an activity date as a sortable UTC ISO string."""
+    if not value:
+        return None
+    parsed = dt_util.parse_datetime(value)
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return dt_util.as_utc(parsed).isoformat(timespec="seconds")
+
+
+class ActivityHistory:
+    """SQLite store of Emby activity log entries.
+
+    All database work runs in the executor; the async_* methods are safe
+    to call from the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the history store."""
+        self.hass = hass
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def _delete_meta(self, *keys: str) -> None:
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM meta WHERE key = ?", [(key,) for key in keys])
+
+    def _get_backfill(self) -> tuple[int, str] | None:
+        start = self._get_meta(META_BACKFILL_START)
+        newest = self._get_meta(META_BACKFILL_NEWEST)
+        if start is None or newest is None:
+            return None
+        return int(start), newest
+
+    def _set_backfill(self, start_index: int, newest: str) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(META_BACKFILL_START, str(start_index)), (META_BACKFILL_NEWEST, newest)],
+            )
+
+    def _add_entries(self, entries: list[dict[str, Any]]) -> int:
+        rows = []
+        for entry in entries:
+            date = normalize_date(entry.get("Date"))
+            if entry.get("Id") is None or date is None:
+                continue
+            rows.append(
+                (
+                    int(entry["Id"]),
+                    date,
+                    entry.get("Type"),
+                    entry.get("Name"),
+                    entry.get("UserId"),
+                    entry.get("UserName"),
+                    entry.get("ItemId"),
+                    int(is_playback_entry(entry)),
+                )
+            )
+
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO activity "
+                "(id, date, type, name, user_id, user_name, item_id, is_playback) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def _prune(self, before: str) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM activity WHERE date < ?", (before,)
+            ).rowcount
+
+    def _playback_stats(self, start: str, end: str) -> dict[str, Any]:
+        conn = self._connect()
+        where = "FROM activity WHERE is_playback = 1 AND date >= ? AND date < ?"
+        count = conn.execute(f"SELECT COUNT(*) {where}", (start, end)).fetchone()[0]
+        per_user = conn.execute(
+            f"SELECT user_id, MAX(user_name), COUNT(*) {where} "
+            "GROUP BY user_id ORDER BY COUNT(*) DESC",
+            (start, end),
+        ).fetchall()
+        recent = conn.execute(
+            f"SELECT name, type, user_id, user_name, date {where} "
+            "ORDER BY date DESC, id DESC LIMIT 10",
+            (start, end),
+        ).fetchall()
+        return {
+            "count": count,
+            "per_user": [
+                {"user_id": user_id, "user_name": user_name, "count": user_count}
+                for user_id, user_name, user_count in per_user
+            ],
+            "recent": [
+                {
+                    "name": name,
+                    "type": entry_type,
+                    "user_id": user_id,
+                    "user_name": user_name,
+                    "date": date,
+                }
+                for name, entry_type, user_id, user_name, date in recent
+            ],
+        }
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def async_get_high_water_mark(self) -> str | None:
+        """Return the date the next incremental fetch should start from."""
+        return await self.hass.async_add_executor_job(
+            self._get_meta, META_HIGH_WATER_MARK
+        )
+
+    async def async_set_high_water_mark(self, value: str) -> None:
+        """Store the date the next incremental fetch should start from."""
+        await self.hass.async_add_executor_job(
+            self._set_meta, META_HIGH_WATER_MARK, value
+        )
+
+    async def async_get_backfill(self) -> tuple[int, str] | None:
+        """Return where an unfinished backfill continues.
+
+        Returns:
+            (start index of the next page, newest entry date seen so far),
+            or None if the last pass was complete
+        """
+        return await self.hass.async_add_executor_job(self._get_backfill)
+
+    async def async_set_backfill(self, start_index: int, newest: str) -> None:
+        """Remember where an unfinished backfill continues."""
+        await self.hass.async_add_executor_job(self._set_backfill, start_index, newest)
+
+    async def async_clear_backfill(self) -> None:
+        """Forget the backfill position after a complete pass."""
+        await self.hass.async_add_executor_job(
+            self._delete_meta, META_BACKFILL_START, META_BACKFILL_NEWEST
+        )
+
+    async def async_add_entries(self, entries: list[dict[str, Any]]) -> int:
+        """Append activity log entries, ignoring ones already stored.
+
+        Returns:
+            Number of new entries
+        """
+        if not entries:
+            return 0
+        return await self.hass.async_add_executor_job(self._add_entries, entries)
+
+    async def async_prune(self, before: datetime) -> int:
+        """Delete entries older than a point in time.
+
+        Returns:
+            Number of deleted entries
+        """
+        return await self.hass.async_add_executor_job(
+            self._prune, dt_util.as_utc(before).isoformat(timespec="seconds")
+        )
+
+    async def async_playback_stats(
+        self, start: datetime, end: datetime
+    ) -> dict[str, Any]:
+        """Return playback counters for a time range.
+
+        Returns:
+            Dict with keys:
+                - count: Number of playback events
+                - per_user: List of per-user counts, highest first
+                - recent: Up to 10 most recent playback events
+        """
+        return await self.hass.async_add_executor_job(
+            self._playback_stats,
+            dt_util.as_utc(start).isoformat(timespec="seconds"),
+            dt_util.as_utc(end).isoformat(timespec="seconds"),
+        )
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        await self.hass.async_add_executor_job(self._close)
@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import logging
+import time
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.media_player import (
+    BrowseMedia,
     MediaPlayerDeviceClass,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
@@ -12,20 +15,30 @@ from homeassistant.components.media_player import (
     MediaType,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
+from .browse import ROOT_ID
 from .const import (
     DOMAIN,
     ICON_PLAY,
     INTEGRATION_VERSION,
     MEDIA_TYPE_AUDIO,
     MEDIA_TYPE_VIDEO,
+    OPTIMISTIC_SEEK_TOLERANCE,
+    OPTIMISTIC_TIMEOUT,
     SESSION_STATE_IDLE,
     SESSION_STATE_PAUSED,
     SESSION_STATE_PLAYING,
+    SIGNAL_ADD_DEVICES,
+    TICKS_PER_SECOND,
 )
+from .entity import EmbyEntity
+from .playback import PlaybackSnapshot
 from .sensor import EmbyDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,42 +52,48 @@ async def async_setup_entry(
     """Set up Emby media player entries."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    # Get monitored devices from options
-    monitored_devices = entry.options.get("monitored_devices", [])
-
-    # Create media player entities for each monitored device
-    media_players = []
-    for device in monitored_devices:
-        device_id = device["device_id"]
-        device_name = device["device_name"]
-        user_name = device.get("user_name", "")
+    @callback
+    def _async_add_devices(devices: list[dict[str, Any]]) -> None:
+        """Create a media player for each monitored device."""
+        media_players = []
+        for device in devices:
+            device_id = device["device_id"]
+            device_name = device["device_name"]
+            user_name = device.get("user_name", "")
+
+            _LOGGER.info(
+                "Creating media player for device: %s (ID: %s, User: %s)",
+                device_name,
+                device_id,
+                user_name
+            )
 
-        _LOGGER.info(
-            "Creating media player for device: %s (ID: %s, User: %s)",
-            device_name,
-            device_id,
-            user_name
-        )
+            media_players.append(
+                EmbyMediaPlayer(coordinator, entry, device_id, device_name, user_name)
+            )
 
-        media_players.append(
-            EmbyMediaPlayer(coordinator, entry, device_id, device_name, user_name)
-        )
+        if media_players:
+            async_add_entities(media_players)
+            _LOGGER.info("Created %d media player entities", len(media_players))
 
-    if media_players:
-        async_add_entities(media_players)
-        _LOGGER.info("Created %d media player entities", len(media_players))
-    else:
+    # Get monitored devices from options
+    monitored_devices = entry.options.get("monitored_devices", [])
+    if not monitored_devices:
         _LOGGER.info("No monitored devices configured, no media players created")
+    _async_add_devices(monitored_devices)
+
+    # Devices added later (by hand or discovered) arrive without a reload
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ADD_DEVICES.format(entry_id=entry.entry_id), _async_add_devices
+        )
+    )
 
 
-class EmbyMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
+class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
     """Emby media player entity for a session."""
 
     _attr_device_class = MediaPlayerDeviceClass.TV
-    # Only enable informational features, no control features
-    # MediaPlayerEntityFeature(0) with manual state reporting
-    # We don't use PAUSE/PLAY/STOP as Infuse doesn't support remote control
-    _attr_supported_features = MediaPlayerEntityFeature(0)
 
     def __init__(
         self,
@@ -91,11 +110,17 @@ class EmbyMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         self.device_name = device_name
         self.user_name = user_name
         self._attr_unique_id = f"{entry.entry_id}_media_player_{device_id}"
+        self._fingerprint_keys = (f"device:{device_id}",)
         self._session_data = None
+        self._playback: PlaybackSnapshot | None = None
         # Cache device info to keep entity available when session ends
         self._cached_user = user_name
         self._cached_device = device_name
         self._cached_client = "Unknown"
+        # State shown before the server confirms a command:
+        # paused, stopped, muted, volume (0-1), position (ticks, UTC, monotonic)
+        self._optimistic: dict[str, Any] = {}
+        self._cancel_optimistic_timeout: CALLBACK_TYPE | None = None
         self._update_session_data()
 
         _LOGGER.info(
@@ -110,43 +135,109 @@ class EmbyMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         # Safely handle case where coordinator data might be None
         if not self.coordinator.data:
             self._session_data = None
+            self._playback = None
             _LOGGER.debug("Device %s: coordinator.data is None", self.device_id)
             return
 
-        sessions = self.coordinator.data.get("sessions", [])
-        _LOGGER.debug(
-            "Device %s: checking %d sessions for match",
-            self.device_id,
-            len(sessions)
-        )
-
         # Find session matching this device
-        for session in sessions:
-            session_device_id = session.get("DeviceId")
-            session_internal_id = str(session.get("InternalDeviceId", ""))
-
-            if session_device_id == self.device_id or session_internal_id == self.device_id:
-                self._session_data = session
-                # Update cached info from live session
-                self._cached_user = session.get("UserName", self._cached_user)
-                self._cached_device = session.get("DeviceName", self._cached_device)
-                self._cached_client = session.get("Client", self._cached_client)
-                _LOGGER.debug(
-                    "Device %s: found matching session, user=%s, device=%s",
-                    self.device_id,
-                    self._cached_user,
-                    self._cached_device
-                )
-                return
+        playback = self.coordinator.get_playback(self.device_id)
+        if playback is not None:
+            self._playback = playback
+            self._session_data = playback.session
+            # Update cached info from live session
+            self._cached_user = playback.user_name or self._cached_user
+            self._cached_device = playback.device_name or self._cached_device
+            self._cached_client = playback.client or self._cached_client
+            _LOGGER.debug(
+                "Device %s: found matching session, user=%s, device=%s",
+                self.device_id,
+                self._cached_user,
+                self._cached_device
+            )
+            self._reconcile_optimistic()
+            return
 
         self._session_data = None
+        self._playback = None
+        self._optimistic.clear()
         _LOGGER.debug("Device %s: no matching session found", self.device_id)
 
+    def _reconcile_optimistic(self) -> None:
+        """Drop the optimistic values the server now reports as well."""
+        if not self._optimistic:
+            return
+        playback = self._playback
+        if not playback.is_playing:
+            # Playback ended: a stop went through, the other values are moot
+            self._optimistic.clear()
+            return
+
+        optimistic = self._optimistic
+        for key, actual in (("paused", playback.is_paused), ("muted", playback.is_muted)):
+            if key in optimistic and optimistic[key] == actual:
+                del optimistic[key]
+        if (
+            "volume" in optimistic
+            and playback.volume_level is not None
+            and round(optimistic["volume"] * 100) == playback.volume_level
+        ):
+            del optimistic["volume"]
+        if "position" in optimistic:
+            ticks, _, sent_at = optimistic["position"]
+            if playback.is_running:
+                ticks += int((time.monotonic() - sent_at) * TICKS_PER_SECOND)
+            if (
+                abs(playback.current_position_ticks() - ticks)
+                <= OPTIMISTIC_SEEK_TOLERANCE * TICKS_PER_SECOND
+            ):
+                del optimistic["position"]
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._update_session_data()
-        self.async_write_ha_state()
+        super()._handle_coordinator_update()
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Include the optimistic values, so dropping one writes state."""
+        return (*super()._state_fingerprint(), tuple(sorted(self._optimistic.items())))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the optimistic state timeout."""
+        await super().async_will_remove_from_hass()
+        if self._cancel_optimistic_timeout is not None:
+            self._cancel_optimistic_timeout()
+            self._cancel_optimistic_timeout = None
+
+    @property
+    def supported_features(self) -> MediaPlayerEntityFeature:
+        """Return the features the current session's client supports.
+
+        Clients that cannot be remote controlled, such as Infuse, only
+        support browsing.
+        """
+        features = MediaPlayerEntityFeature.BROWSE_MEDIA
+        playback = self._playback
+        if playback is None or not playback.supports_remote_control:
+            return features
+
+        features |= (
+            MediaPlayerEntityFeature.PLAY
+            | MediaPlayerEntityFeature.PAUSE
+            | MediaPlayerEntityFeature.STOP
+            | MediaPlayerEntityFeature.NEXT_TRACK
+            | MediaPlayerEntityFeature.PREVIOUS_TRACK
+        )
+        if playback.can_seek:
+            features |= MediaPlayerEntityFeature.SEEK
+        commands = playback.supported_commands
+        if "SetVolume" in commands:
+            features |= MediaPlayerEntityFeature.VOLUME_SET
+        if "VolumeUp" in commands or self._steps_with_set_volume():
+            features |= MediaPlayerEntityFeature.VOLUME_STEP
+        if "Mute" in commands:
+            features |= MediaPlayerEntityFeature.VOLUME_MUTE
+        return features
 
     @property
     def available(self) -> bool:
@@ -172,39 +263,51 @@ class EmbyMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         user = self._cached_user or self.user_name
         device = self._cached_device or self.device_name
 
-        if self._session_data:
-            user = self._session_data.get("UserName", user)
-            device = self._session_data.get("DeviceName", device)
+        if self._playback:
+            user = self._playback.user_name or user
+            device = self._playback.device_name or device
 
         return f"Emby {user} - {device}"
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the entity."""
-        if not self._session_data:
+        if (
+            not self._playback
+            or not self._playback.is_playing
+            or self._optimistic.get("stopped")
+        ):
             # Show as idle when session ends, not off
             return MediaPlayerState.IDLE
 
-        now_playing = self._session_data.get("NowPlayingItem")
-        if not now_playing:
-            return MediaPlayerState.IDLE
-
-        play_state = self._session_data.get("PlayState", {})
-        is_paused = play_state.get("IsPaused", False)
-
-        if is_paused:
+        if self._optimistic.get("paused", self._playback.is_paused):
             return MediaPlayerState.PAUSED
         else:
             return MediaPlayerState.PLAYING
 
+    @property
+    def volume_level(self) -> float | None:
+        """Return the volume level (0-1) of the client."""
+        if "volume" in self._optimistic:
+            return self._optimistic["volume"]
+        if self._playback and self._playback.volume_level is not None:
+            return self._playback.volume_level / 100
+        return None
+
+    @property
+    def is_volume_muted(self) -> bool | None:
+        """Return True if the client is muted."""
+        if not self._playback:
+            return None
+        return self._optimistic.get("muted", self._playback.is_muted)
+
     @property
     def media_content_type(self) -> str:
         """Return the content type of current playing media."""
-        if not self._session_data:
+        if not self._playback or not self._playback.is_playing:
             return None
 
-        now_playing = self._session_data.get("NowPlayingItem", {})
-        item_type = now_playing.get("Type", "").lower()
+        item_type = self._playback.item_type.lower()
 
         if item_type in ["movie", "episode", "video"]:
             return MediaType.VIDEO
@@ -216,88 +319,131 @@ class EmbyMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def media_title(self) -> str | None:
         """Return the title of current playing media."""
-        if not self._session_data:
+        if not self._playback or not self._playback.is_playing:
             return None
 
-        now_playing = self._session_data.get("NowPlayingItem", {})
-        return now_playing.get("Name")
+        return self._playback.item_name
 
     @property
     def media_series_title(self) -> str | None:
         """Return the series title if playing an episode."""
-        if not self._session_data:
-            return None
-
-        now_playing = self._session_data.get("NowPlayingItem", {})
-        if now_playing.get("Type") == "Episode":
-            return now_playing.get("SeriesName")
+        if self._playback and self._playback.item_type == "Episode":
+            return self._playback.series_name
         return None
 
     @property
     def media_season(self) -> str | None:
         """Return the season number if playing an episode."""
-        if not self._session_data:
-            return None
-
-        now_playing = self._session_data.get("NowPlayingItem", {})
-        if now_playing.get("Type") == "Episode":
-            season = now_playing.get("ParentIndexNumber")
+        if self._playback and self._playback.item_type == "Episode":
+            season = self._playback.season
             return f"S{season}" if season else None
         return None
 
     @property
     def media_episode(self) -> str | None:
         """Return the episode number if playing an episode."""
-        if not self._session_data:
-            return None
-
-        now_playing = self._session_data.get("NowPlayingItem", {})
-        if now_playing.get("Type") == "Episode":
-            episode = now_playing.get("IndexNumber")
+        if self._playback and self._playback.item_type == "Episode":
+            episode = self._playback.episode
             return f"E{episode}" if episode else None
         return None
 
     @property
     def media_duration(self) -> int | None:
         """Return the duration of current playing media in seconds."""
-        if not self._session_data:
-            return None
-
-        now_playing = self._session_data.get("NowPlayingItem", {})
-        run_time_ticks = now_playing.get("RunTimeTicks")
-        if run_time_ticks:
+        if self._playback and self._playback.runtime_ticks:
             # Convert from ticks (100-nanosecond intervals) to seconds
-            return int(run_time_ticks / 10000000)
+            return int(self._playback.runtime_ticks / TICKS_PER_SECOND)
         return None
 
     @property
     def media_position(self) -> int | None:
         """Return the position of current playing media in seconds."""
-        if not self._session_data:
-            return None
-
-        play_state = self._session_data.get("PlayState", {})
-        position_ticks = play_state.get("PositionTicks")
-        if position_ticks:
+        if "position" in self._optimistic:
+            return int(self._optimistic["position"][0] / TICKS_PER_SECOND)
+        if self._playback and self._playback.position_ticks:
             # Convert from ticks to seconds
-            return int(position_ticks / 10000000)
+            return int(self._playback.position_ticks / TICKS_PER_SECOND)
         return None
 
+    @property
+    def media_position_updated_at(self) -> datetime | None:
+        """Return when media_position was sampled.
+
+        The frontend advances the position from this timestamp while the
+        player is playing, so progress moves smoothly between refreshes.
+        """
+        if not self._playback or not self._playback.is_playing:
+            return None
+        if "position" in self._optimistic:
+            return self._optimistic["position"][1]
+        return self.coordinator.sessions_sampled_utc
+
     @property
     def media_image_url(self) -> str | None:
-        """Return the image URL of current playing media."""
-        if not self._session_data:
+        """Return the image URL of current playing media.
+
+        Only identifies the image (its hash names the proxy URL); the
+        image itself is served by async_get_media_image, so the API key
+        never reaches the browser.
+        """
+        if not self._playback:
             return None
 
-        now_playing = self._session_data.get("NowPlayingItem", {})
-        item_id = now_playing.get("Id")
+        item_id = self._playback.item_id
         if item_id:
-            # Construct image URL
             base_url = self.coordinator.client.base_url
-            api_key = self.coordinator.client.api_key
-            return f"{base_url}/Items/{item_id}/Images/Primary?api_key={api_key}"
+            tag = self._playback.image_tag or ""
+            return f"{base_url}/Items/{item_id}/Images/Primary?tag={tag}"
         return None
 
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Return the artwork of current playing media from the cache."""
+        if not self._playback or not self._playback.item_id:
+            return None, None
+        return await self.coordinator.artwork.async_get_image(
+            self._playback.item_id, "Primary", self._playback.image_tag
+        )
+
+    def _browse_user_id(self) -> str | None:
+        """Return the user whose view of the library is browsed.
+
+        The user of the current session, else the monitored user, else
+        the first administrator.
+        """
+        if self._playback and self._playback.user_id:
+            return self._playback.user_id
+        users = (self.coordinator.data or {}).get("users") or []
+        for user in users:
+            if user.get("Name") == self.user_name:
+                return user.get("Id")
+        for user in users:
+            if (user.get("Policy") or {}).get("IsAdministrator"):
+                return user.get("Id")
+        return users[0].get("Id") if users else None
+
+    async def async_browse_media(
+        self,
+        media_content_type: MediaType | str | None = None,
+        media_content_id: str | None = None,
+    ) -> BrowseMedia:
+        """Return a page of the Emby library."""
+        return await self.coordinator.library.async_browse(
+            self._browse_user_id(),
+            media_content_id or ROOT_ID,
+            lambda item_id, tag: self.get_browse_image_url("image", item_id, tag),
+        )
+
+    async def async_get_browse_image(
+        self,
+        media_content_type: str,
+        media_content_id: str,
+        media_image_id: str | None = None,
+    ) -> tuple[bytes | None, str | None]:
+        """Return the artwork of a library item from the cache."""
+        return await self.coordinator.artwork.async_get_image(
+            media_content_id, "Primary", media_image_id
+        )
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
@@ -313,26 +459,26 @@ class EmbyMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             attrs["status"] = "空闲"
             return attrs
 
+        playback = self._playback
         play_state = self._session_data.get("PlayState", {})
-        now_playing = self._session_data.get("NowPlayingItem", {})
 
         # Update with live session data
         attrs.update({
-            "session_id": self._session_data.get("Id"),
-            "client": self._session_data.get("Client"),
-            "device_name": self._session_data.get("DeviceName"),
-            "user_name": self._session_data.get("UserName"),
+            "session_id": playback.session_id,
+            "client": playback.client,
+            "device_name": playback.device_name,
+            "user_name": playback.user_name,
             "remote_endpoint": self._session_data.get("RemoteEndPoint"),
-            "is_muted": play_state.get("IsMuted", False),
-            "can_seek": play_state.get("CanSeek", False),
+            "is_muted": playback.is_muted,
+            "can_seek": playback.can_seek,
             "repeat_mode": play_state.get("RepeatMode"),
         })
 
-        if now_playing:
+        if playback.is_playing:
             attrs.update({
-                "media_type": now_playing.get("Type"),
-                "media_id": now_playing.get("Id"),
-                "production_year": now_playing.get("ProductionYear"),
+                "media_type": playback.item_type,
+                "media_id": playback.item_id,
+                "production_year": playback.year,
             })
 
         return attrs
@@ -350,8 +496,8 @@ class EmbyMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
         # Get current client/app name from session if available
         app_name = "Emby Client"
-        if self._session_data:
-            app_name = self._session_data.get("Client", app_name)
+        if self._playback and self._playback.client:
+            app_name = self._playback.client
 
         return {
             "identifiers": {(DOMAIN, device_identifier)},
@@ -361,32 +507,123 @@ class EmbyMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             "via_device": (DOMAIN, server_id),  # Link to server device
         }
 
+    @callback
+    def _async_send_command(
+        self, command: str, value: int | None = None, **optimistic: Any
+    ) -> None:
+        """Queue a command and show its expected outcome right away.
+
+        The optimistic values are replaced by the server's as soon as a
+        session update agrees with them, or after OPTIMISTIC_TIMEOUT.
+        """
+        playback = self._playback
+        if playback is None or not playback.session_id:
+            raise HomeAssistantError(f"{self.name} has no active Emby session")
+        if not playback.supports_remote_control:
+            raise HomeAssistantError(f"{self.name} does not support remote control")
+
+        self._optimistic.update(optimistic)
+        if self._cancel_optimistic_timeout is not None:
+            self._cancel_optimistic_timeout()
+        self._cancel_optimistic_timeout = async_call_later(
+            self.hass, OPTIMISTIC_TIMEOUT, self._async_optimistic_timeout
+        )
+        self.coordinator.command_queue(playback.session_id).async_send(
+            command, value, self._async_command_failed
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_optimistic_timeout(self, _now: datetime) -> None:
+        """Fall back to the server's state when it never agreed."""
+        self._cancel_optimistic_timeout = None
+        if self._optimistic:
+            self._optimistic.clear()
+            self.async_write_ha_state()
+
+    @callback
+    def _async_command_failed(self) -> None:
+        """Show the server's state again after a command failed."""
+        self._optimistic.clear()
+        self.async_write_ha_state()
+
     async def async_media_play(self) -> None:
-        """Send play command."""
-        _LOGGER.info("Play command for device %s", self.device_id)
-        # TODO: Implement via /Sessions/{id}/Playing/Unpause
+        """Resume playback."""
+        self._async_send_command("Unpause", paused=False)
 
     async def async_media_pause(self) -> None:
-        """Send pause command."""
-        _LOGGER.info("Pause command for device %s", self.device_id)
-        # TODO: Implement via /Sessions/{id}/Playing/Pause
+        """Pause playback."""
+        self._async_send_command("Pause", paused=True)
 
     async def async_media_stop(self) -> None:
-        """Send stop command."""
-        _LOGGER.info("Stop command for device %s", self.device_id)
-        # TODO: Implement via /Sessions/{id}/Playing/Stop
+        """Stop playback."""
+        self._async_send_command("Stop", stopped=True)
 
     async def async_media_next_track(self) -> None:
-        """Send next track command."""
-        _LOGGER.info("Next track command for device %s", self.device_id)
-        # TODO: Implement via /Sessions/{id}/Playing/NextTrack
+        """Skip to the next item of the play queue."""
+        self._async_send_command("NextTrack")
 
     async def async_media_previous_track(self) -> None:
-        """Send previous track command."""
-        _LOGGER.info("Previous track command for device %s", self.device_id)
-        # TODO: Implement via /Sessions/{id}/Playing/PreviousTrack
+        """Go back to the previous item of the play queue."""
+        self._async_send_command("PreviousTrack")
 
     async def async_media_seek(self, position: float) -> None:
-        """Send seek command."""
-        _LOGGER.info("Seek command for device %s to position %s", self.device_id, position)
-        # TODO: Implement via /Sessions/{id}/Playing/Seek
+        """Seek to a position in seconds."""
+        ticks = int(position * TICKS_PER_SECOND)
+        self._async_send_command(
+            "Seek", ticks, position=(ticks, dt_util.utcnow(), time.monotonic())
+        )
+
+    async def async_set_volume_level(self, volume: float) -> None:
+        """Set the volume level (0-1).
+
+        Volume steps go through here too, each from the optimistic level
+        of the previous one, so a burst of steps coalesces into one
+        SetVolume in the command queue.
+        """
+        self._async_send_command("SetVolume", round(volume * 100), volume=volume)
+
+    def _steps_with_set_volume(self) -> bool:
+        """Return True if volume steps can be sent as SetVolume.
+
+        That needs a known level and a client that supports SetVolume;
+        otherwise the client steps with VolumeUp / VolumeDown itself.
+        """
+        playback = self._playback
+        return (
+            self.volume_level is not None
+            and playback is not None
+            and "SetVolume" in playback.supported_commands
+        )
+
+    @callback
+    def _async_send_volume_step(self, command: str) -> None:
+        """Send VolumeUp / VolumeDown, if the client supports it.
+
+        Clients that only support SetVolume cannot step from an unknown
+        level, so nothing is sent to them.
+        """
+        playback = self._playback
+        if playback is not None and command not in playback.supported_commands:
+            raise HomeAssistantError(
+                f"{self.name} cannot change the volume by a step"
+            )
+        self._async_send_command(command)
+
+    async def async_volume_up(self) -> None:
+        """Turn the volume up."""
+        if not self._steps_with_set_volume():
+            self._async_send_volume_step("VolumeUp")
+            return
+        await super().async_volume_up()
+
+    async def async_volume_down(self) -> None:
+        """Turn the volume down."""
+        if not self._steps_with_set_volume():
+            self._async_send_volume_step("VolumeDown")
+            return
+        await super().async_volume_down()
+
+    async def async_mute_volume(self, mute: bool) -> None:
+        """Mute or unmute the client."""
+        self._async_send_command("Mute" if mute else "Unmute", muted=mute)
@@ -0,0 +1,144 @@
+"""Playback view model for the Emby integration."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from .const import TICKS_PER_SECOND
+
+# Display names for NowPlayingItem types
+MEDIA_TYPE_NAMES: dict[str, str] = {
+    "Movie": "电影",
+    "Episode": "剧集",
+    "Video": "视频",
+    "Audio": "音频",
+    "Music": "音乐",
+}
+
+
+class PlaybackSnapshot:
+    """Playback facts of one session, parsed once per session update.
+
+    The coordinator builds one snapshot per session whenever a session list
+    arrives; device entities read these attributes instead of re-parsing the
+    raw session dict in every property.
+    """
+
+    __slots__ = (
+        "session",
+        "sampled_at",
+        "fingerprint",
+        "session_id",
+        "device_id",
+        "device_name",
+        "user_id",
+        "user_name",
+        "client",
+        "supports_remote_control",
+        "supported_commands",
+        "is_playing",
+        "is_paused",
+        "is_muted",
+        "volume_level",
+        "can_seek",
+        "item_id",
+        "item_name",
+        "item_type",
+        "image_tag",
+        "media_type_cn",
+        "series_name",
+        "season",
+        "episode",
+        "year",
+        "title",
+        "position_ticks",
+        "runtime_ticks",
+    )
+
+    def __init__(
+        self,
+        session: dict[str, Any],
+        sampled_at: float,
+        fingerprint: int = 0,
+    ) -> None:
+        """Parse a raw session dict sampled at a monotonic timestamp."""
+        play_state = session.get("PlayState") or {}
+        now_playing = session.get("NowPlayingItem") or {}
+
+        self.session = session
+        self.sampled_at = sampled_at
+        # Changes whenever anything in the raw session changes
+        self.fingerprint = fingerprint
+
+        # Session
+        self.session_id: str | None = session.get("Id")
+        self.device_id: str | None = session.get("DeviceId")
+        self.device_name: str | None = session.get("DeviceName")
+        self.user_id: str | None = session.get("UserId")
+        self.user_name: str | None = session.get("UserName")
+        self.client: str | None = session.get("Client")
+        # Some clients (Infuse, DLNA renderers) cannot be controlled
+        self.supports_remote_control: bool = session.get("SupportsRemoteControl", False)
+        self.supported_commands: list[str] = session.get("SupportedCommands") or []
+
+        # Play state
+        self.is_playing = bool(now_playing)
+        self.is_paused: bool = play_state.get("IsPaused", False)
+        self.is_muted: bool = play_state.get("IsMuted", False)
+        # 0-100, None if the client does not report it
+        self.volume_level: int | None = play_state.get("VolumeLevel")
+        self.can_seek: bool = play_state.get("CanSeek", False)
+
+        # Now playing item
+        self.item_id: str | None = now_playing.get("Id")
+        self.item_name: str = now_playing.get("Name", "Unknown")
+        self.item_type: str = now_playing.get("Type", "Unknown")
+        self.image_tag: str | None = (now_playing.get("ImageTags") or {}).get("Primary")
+        self.media_type_cn = MEDIA_TYPE_NAMES.get(self.item_type, self.item_type)
+        self.series_name: str | None = now_playing.get("SeriesName")
+        self.season: int | None = now_playing.get("ParentIndexNumber")
+        self.episode: int | None = now_playing.get("IndexNumber")
+        self.year: int | None = now_playing.get("ProductionYear")
+
+        # For episodes, show series name with S01E01
+        self.title = self.item_name
+        if self.item_type == "Episode" and self.series_name and self.season and self.episode:
+            self.title = f"{self.series_name} S{self.season:02d}E{self.episode:02d}"
+
+        # Position in ticks (100-nanosecond intervals)
+        self.position_ticks: int = play_state.get("PositionTicks") or 0
+        self.runtime_ticks: int = now_playing.get("RunTimeTicks") or 0
+
+    @property
+    def is_running(self) -> bool:
+        """Return True if playback is in progress and not paused."""
+        return self.is_playing and not self.is_paused
+
+    def current_position_ticks(self) -> int:
+        """Return the position extrapolated to now.
+
+        The sampled position is advanced by the time elapsed since the
+        sample while playback is running, clamped to the runtime. The next
+        session update corrects it to the server value.
+        """
+        if not self.is_running:
+            return self.position_ticks
+
+        elapsed = time.monotonic() - self.sampled_at
+        position_ticks = self.position_ticks + int(elapsed * TICKS_PER_SECOND)
+        if self.runtime_ticks > 0:
+            position_ticks = min(position_ticks, self.runtime_ticks)
+        return position_ticks
+
+    def progress_percent(self) -> int:
+        """Return the extrapolated progress as a whole percentage."""
+        if self.runtime_ticks <= 0:
+            return 0
+        return int((self.current_position_ticks() / self.runtime_ticks) * 100)
+
+    def remaining_seconds(self) -> int | None:
+        """Return the extrapolated remaining time, or None if unknown."""
+        position_ticks = self.current_position_ticks()
+        if self.runtime_ticks <= 0 or position_ticks <= 0:
+            return None
+        return int((self.runtime_ticks - position_ticks) / TICKS_PER_SECOND)
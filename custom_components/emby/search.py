@@ -0,0 +1,354 @@
+"""Local search index for the Emby integration."""
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+import re
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import EmbyAPIClient
+from .const import (
+    SEARCH_FULL_REBUILD,
+    SEARCH_INDEX_SAVE_DELAY,
+    SEARCH_ITEM_TYPES,
+    SEARCH_PAGE_SIZE,
+    STORAGE_KEY_SEARCH_INDEX,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Runs of CJK characters, or of other letters and digits
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+_TOKEN = re.compile(rf"[{_CJK}]+|[^\W_{_CJK}]+")
+_CJK_RUN = re.compile(rf"[{_CJK}]")
+
+# Points per matched query token
+SCORE_EXACT = 3
+SCORE_PREFIX = 2
+SCORE_FUZZY = 1
+
+# Result order among equal scores
+_TYPE_ORDER = {"Movie": 0, "Series": 1, "MusicArtist": 2, "MusicAlbum": 3, "Episode": 4, "Audio": 5}
+
+# Item id -> (name, type, production year, series name)
+Document = tuple[str, str, int | None, str | None]
+
+
+def _words(text: str) -> list[str]:
+    """Split text into normalized words and CJK runs."""
+    return _TOKEN.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def tokenize(text: str) -> set[str]:
+    """Return the index tokens of a text.
+
+    Words are indexed whole; CJK runs, which have no spaces, are indexed
+    as single characters and character pairs.
+    """
+    tokens: set[str] = set()
+    for word in _words(text):
+        if _CJK_RUN.match(word):
+            tokens.update(word)
+            tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.add(word)
+    return tokens
+
+
+def query_terms(text: str) -> list[tuple[str, bool]]:
+    """Return the terms of a query as (token, allows prefix and fuzzy matching).
+
+    A CJK run must appear in the name, so it becomes its character pairs.
+    """
+    terms: list[tuple[str, bool]] = []
+    for word in _words(text):
+        if not _CJK_RUN.match(word):
+            terms.append((word, True))
+        elif len(word) == 1:
+            terms.append((word, False))
+        else:
+            terms.extend((word[i : i + 2], False) for i in range(len(word) - 1))
+    return terms
+
+
+def within_distance(a: str, b: str, limit: int) -> bool:
+    """Return True if the edit distance of a and b is at most limit."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+class SearchIndex:
+    """In-memory inverted index of the library, persisted to storage.
+
+    Only names, types, years and series names are kept, so even a large
+    library fits in a few megabytes. The first refresh pages through the
+    whole library; later ones only ask for items saved since the previous
+    refresh (MinDateLastSaved). Deleted items are dropped by a full
+    rebuild, run daily or when the library shrank.
+
+    Query words match index tokens exactly, by prefix, or, for words of
+    four letters or more without a prefix match, within an edit distance
+    of one (two from eight letters).
+    """
+
+    def __init__(self, hass: HomeAssistant, client: EmbyAPIClient, entry_id: str) -> None:
+        """Initialize the index."""
+        self.client = client
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_SEARCH_INDEX.format(entry_id=entry_id)
+        )
+        # Set while a delayed save has not been written yet
+        self._save_pending = False
+        self._docs: dict[str, Document] = {}
+        # Token -> ids of the items whose name contains it
+        self._postings: dict[str, set[str]] = {}
+        # Sorted tokens, for prefix and fuzzy matching; None when stale
+        self._vocabulary: list[str] | None = None
+        self.last_saved: datetime | None = None
+        self.last_full: datetime | None = None
+        self.ready = False
+        self._refreshing = False
+
+    def __len__(self) -> int:
+        """Return the number of indexed items."""
+        return len(self._docs)
+
+    async def async_load(self) -> None:
+        """Restore the index from storage."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for item_id, name, item_type, year, series_name in stored.get("items", []):
+            self._add(item_id, (name, item_type, year, series_name))
+        self.last_saved = dt_util.parse_datetime(stored.get("last_saved") or "")
+        self.last_full = dt_util.parse_datetime(stored.get("last_full") or "")
+        self.ready = True
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save after SEARCH_INDEX_SAVE_DELAY, batching frequent changes."""
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SEARCH_INDEX_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now, before the entry is unloaded."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the documents and refresh marks to persist."""
+        self._save_pending = False
+        return {
+            "last_saved": self.last_saved.isoformat() if self.last_saved else None,
+            "last_full": self.last_full.isoformat() if self.last_full else None,
+            "items": [[item_id, *doc] for item_id, doc in self._docs.items()],
+        }
+
+    def _add(self, item_id: str, doc: Document) -> None:
+        """Index a document, replacing an older version."""
+        if item_id in self._docs:
+            self._remove(item_id)
+        self._docs[item_id] = doc
+        for token in self._doc_tokens(doc):
+            self._postings.setdefault(token, set()).add(item_id)
+        self._vocabulary = None
+
+    def _remove(self, item_id: str) -> None:
+        """Drop a document from the index."""
+        doc = self._docs.pop(item_id)
+        for token in self._doc_tokens(doc):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(item_id)
+                if not postings:
+                    del self._postings[token]
+        self._vocabulary = None
+
+    @staticmethod
+    def _doc_tokens(doc: Document) -> set[str]:
+        """Return the tokens of a document."""
+        name, _, year, series_name = doc
+        tokens = tokenize(name)
+        if series_name:
+            tokens |= tokenize(series_name)
+        if year:
+            tokens.add(str(year))
+        return tokens
+
+    async def async_refresh(self) -> None:
+        """Fetch new and changed items; rebuild from scratch when due."""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        try:
+            await self._async_refresh()
+        finally:
+            self._refreshing = False
+
+    async def _async_refresh(self) -> None:
+        """Page through the library and update the index."""
+        started = dt_util.utcnow()
+        full = (
+            self.last_saved is None
+            or self.last_full is None
+            or started - self.last_full > timedelta(seconds=SEARCH_FULL_REBUILD)
+        )
+        min_date = (
+            None
+            if full
+            # A few minutes of overlap absorb clock skew between HA and Emby
+            else (self.last_saved - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        )
+        seen: set[str] = set()
+
+        start_index = 0
+        while True:
+            page = await self.client.get_items_page(
+                SEARCH_ITEM_TYPES, start_index, SEARCH_PAGE_SIZE, min_date
+            )
+            items = page.get("Items", [])
+            for item in items:
+                seen.add(item["Id"])
+                self._add(
+                    item["Id"],
+                    (
+                        item.get("Name") or "",
+                        item.get("Type") or "",
+                        item.get("ProductionYear"),
+                        item.get("SeriesName"),
+                    ),
+                )
+            start_index += len(items)
+            if not items or start_index >= page.get("TotalRecordCount", 0):
+                break
+
+        if full:
+            for item_id in [item_id for item_id in self._docs if item_id not in seen]:
+                self._remove(item_id)
+            self.last_full = started
+        else:
+            # Items were deleted since the last full rebuild: rebuild next time
+            total = await self.client.get_items_page(SEARCH_ITEM_TYPES, 0, 0)
+            if total.get("TotalRecordCount", 0) < len(self._docs):
+                self.last_full = None
+
+        self.last_saved = started
+        self.ready = True
+        _LOGGER.debug(
+            "Search index %s: %d changed items, %d indexed",
+            "rebuilt" if full else "updated",
+            len(seen),
+            len(self._docs),
+        )
+        self._async_schedule_save()
+
+    def _matches(self, term: str, expand: bool) -> dict[str, int]:
+        """Return item id -> score of the items matching one query term."""
+        scores = dict.fromkeys(self._postings.get(term, ()), SCORE_EXACT)
+        if not expand:
+            return scores
+
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+
+        # Tokens that start with the term sort right after it
+        index = bisect.bisect_right(vocabulary, term)
+        prefixed = False
+        while index < len(vocabulary) and vocabulary[index].startswith(term):
+            prefixed = True
+            for item_id in self._postings[vocabulary[index]]:
+                scores.setdefault(item_id, SCORE_PREFIX)
+            index += 1
+
+        if not scores and not prefixed and len(term) >= 4:
+            limit = 2 if len(term) >= 8 else 1
+            # Typos rarely hit the first letter; it narrows the scan a lot
+            index = bisect.bisect_left(vocabulary, term[0])
+            while index < len(vocabulary) and vocabulary[index][0] == term[0]:
+                token = vocabulary[index]
+                if within_distance(term, token, limit):
+                    for item_id in self._postings[token]:
+                        scores.setdefault(item_id, SCORE_FUZZY)
+                index += 1
+        return scores
+
+    def search(
+        self, query: str, limit: int = 10, media_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the best matching items, every query term must match.
+
+        Args:
+            query: Words of the name (or of the series name for episodes)
+            limit: Maximum number of results
+            media_type: Only return items of this Emby type
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+
+        scores: dict[str, int] | None = None
+        # Rarest exact terms first, so the candidate set shrinks fast
+        for term, expand in sorted(terms, key=lambda t: len(self._postings.get(t[0], ()))):
+            matches = self._matches(term, expand)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {
+                    item_id: score + matches[item_id]
+                    for item_id, score in scores.items()
+                    if item_id in matches
+                }
+            if not scores:
+                return []
+
+        wanted = unicodedata.normalize("NFKC", query).casefold().strip()
+        docs = self._docs
+        candidates = [
+            (item_id, score)
+            for item_id, score in scores.items()
+            if media_type is None or docs[item_id][1] == media_type
+        ]
+        best = heapq.nsmallest(
+            limit,
+            candidates,
+            key=lambda candidate: (
+                -candidate[1],
+                docs[candidate[0]][0].casefold() != wanted,
+                _TYPE_ORDER.get(docs[candidate[0]][1], len(_TYPE_ORDER)),
+                len(docs[candidate[0]][0]),
+            ),
+        )
+        return [
+            {
+                "id": item_id,
+                "name": docs[item_id][0],
+                "type": docs[item_id][1],
+                "year": docs[item_id][2],
+                "series_name": docs[item_id][3],
+            }
+            for item_id, _ in best
+        ]
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+import sqlite3
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -11,16 +14,34 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
-
-from .api import EmbyAPIClient, EmbyAPIError
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    DASHBOARD_SECTIONS,
+    EmbyAPIClient,
+    EmbyAPIError,
+    EmbyWebSocket,
+    empty_section,
+    json_dumps_sorted,
+)
+from .artwork import ArtworkCache
+from .browse import LibraryBrowser
+from .commands import SessionCommandQueue
 from .const import (
+    ADAPTIVE_IDLE_HYSTERESIS,
+    ARTWORK_DIR,
     ATTR_ACTIVITIES,
     ATTR_ALBUM_COUNT,
     ATTR_ARTIST_COUNT,
@@ -37,7 +58,18 @@ from .const import (
     ATTR_TASKS,
     ATTR_USERS,
     ATTR_VERSION,
+    BREAKER_CLOSED,
+    COMMAND_REFRESH_DELAY,
+    CONF_SCAN_INTERVAL_IDLE,
+    CONF_SCAN_INTERVAL_PLAYING,
+    DEFAULT_SCAN_INTERVAL_IDLE,
+    DEFAULT_SCAN_INTERVAL_PLAYING,
+    DIAGNOSTICS_REFRESH_HISTORY,
     DOMAIN,
+    HISTORY_DB_FILE,
+    HISTORY_MAX_PAGES,
+    HISTORY_PAGE_SIZE,
+    HISTORY_RETENTION_DAYS,
     ICON_ACTIVITY,
     ICON_DEVICE,
     ICON_EPISODE,
@@ -52,6 +84,8 @@ from .const import (
     ICON_USERS,
     ICON_VERSION,
     INTEGRATION_VERSION,
+    POSITION_UPDATE_INTERVAL,
+    SECTION_POLL_INTERVALS,
     SENSOR_TYPE_ACTIVE_SESSIONS,
     SENSOR_TYPE_DEVICE_COUNT,
     SENSOR_TYPE_EPISODE_COUNT,
@@ -75,8 +109,23 @@ from .const import (
     SENSOR_TYPE_AUDIO_TRACK,
     SENSOR_TYPE_TODAY_PLAY_COUNT,
     SENSOR_TYPE_TODAY_WATCH_TIME,
-    UPDATE_INTERVAL,
+    SENSOR_TYPE_REFRESH_LATENCY_P50,
+    SENSOR_TYPE_REFRESH_LATENCY_P95,
+    SENSOR_TYPE_REQUEST_FAILURES,
+    SENSOR_TYPE_SLOWEST_ENDPOINT,
+    SESSIONS_ACTIVE_WITHIN,
+    SIGNAL_ADD_DEVICES,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_SESSION_EXCLUDE,
+    STORAGE_KEY_SNAPSHOT,
+    STORAGE_VERSION,
+    TICKS_PER_SECOND,
 )
+from .devices import DeviceTracker
+from .entity import EmbyEntity
+from .history import ActivityHistory, normalize_date
+from .playback import PlaybackSnapshot
+from .watchtime import WatchTimeTracker
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -95,58 +144,859 @@ async def async_setup_entry(
         EmbyMovieCountSensor(coordinator, entry),
         EmbySeriesCountSensor(coordinator, entry),
         EmbyEpisodeCountSensor(coordinator, entry),
+        # Playback statistics
+        EmbyTodayPlayCountSensor(coordinator, entry),
+        EmbyTodayWatchTimeSensor(coordinator, entry),
+        # Request diagnostics
+        EmbyRefreshLatencySensor(coordinator, entry, 50),
+        EmbyRefreshLatencySensor(coordinator, entry, 95),
+        EmbySlowestEndpointSensor(coordinator, entry),
+        EmbyRequestFailuresSensor(coordinator, entry),
     ]
 
     # ===== Device-level sensors (created for each monitored device) =====
-    device_sensors = []
-    monitored_devices = entry.options.get("monitored_devices", [])
+    def device_sensors(devices: list[dict[str, Any]]) -> list[SensorEntity]:
+        sensors: list[SensorEntity] = []
+        for device in devices:
+            device_id = device["device_id"]
+            device_name = device["device_name"]
+            user_name = device.get("user_name", "")
+
+            # Create sensors for this device
+            sensors.extend([
+                EmbyNowPlayingSensor(coordinator, entry, device_id, device_name, user_name),
+                EmbyPlaybackStateSensor(coordinator, entry, device_id, device_name, user_name),
+                EmbyProgressPercentSensor(coordinator, entry, device_id, device_name, user_name),
+                EmbyPlaybackRemainingSensor(coordinator, entry, device_id, device_name, user_name),
+                EmbySubtitleTrackSensor(coordinator, entry, device_id, device_name, user_name),
+                EmbyAudioTrackSensor(coordinator, entry, device_id, device_name, user_name),
+            ])
+        return sensors
 
-    for device in monitored_devices:
-        device_id = device["device_id"]
-        device_name = device["device_name"]
-        user_name = device.get("user_name", "")
+    # Add all sensors
+    monitored_devices = entry.options.get("monitored_devices", [])
+    async_add_entities(server_sensors + device_sensors(monitored_devices))
 
-        # Create sensors for this device
-        device_sensors.extend([
-            EmbyNowPlayingSensor(coordinator, entry, device_id, device_name, user_name),
-            EmbyPlaybackStateSensor(coordinator, entry, device_id, device_name, user_name),
-            EmbyProgressPercentSensor(coordinator, entry, device_id, device_name, user_name),
-            EmbyPlaybackRemainingSensor(coordinator, entry, device_id, device_name, user_name),
-        ])
+    # Devices added later (by hand or discovered) arrive without a reload
+    @callback
+    def _async_add_devices(devices: list[dict[str, Any]]) -> None:
+        async_add_entities(device_sensors(devices))
 
-    # Add all sensors
-    async_add_entities(server_sensors + device_sensors)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ADD_DEVICES.format(entry_id=entry.entry_id), _async_add_devices
+        )
+    )
 
 
 class EmbyDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Emby data."""
+    """Class to manage fetching Emby data.
+
+    Each dashboard section is polled on its own schedule (see
+    SECTION_POLL_INTERVALS); the coordinator ticks at the fastest one and
+    merges whatever was due into the previous data. Sessions are polled
+    fast while a monitored device is playing and slowly while idle.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
         client: EmbyAPIClient,
+        entry: ConfigEntry,
     ) -> None:
         """Initialize coordinator."""
+        self.entry = entry
+        self.playing_interval = entry.options.get(
+            CONF_SCAN_INTERVAL_PLAYING, DEFAULT_SCAN_INTERVAL_PLAYING
+        )
+        self.idle_interval = entry.options.get(
+            CONF_SCAN_INTERVAL_IDLE, DEFAULT_SCAN_INTERVAL_IDLE
+        )
+        self.sessions_interval = self.idle_interval
+        self.cadence_changes = 0
+        self._idle_samples = 0
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=UPDATE_INTERVAL,
+            update_interval=self._tick_interval(),
         )
         self.client = client
+        self.websocket: EmbyWebSocket | None = None
+        self._last_poll = 0.0
+        # Monotonic time each section was last fetched successfully
+        self._section_fetched: dict[str, float] = {}
+        # When the current session list was sampled, for position extrapolation
+        self.sessions_sampled_at = 0.0
+        self.sessions_sampled_utc: datetime | None = None
+        # DeviceId / InternalDeviceId -> playback snapshots of that device
+        self.playback_index: dict[str, list[PlaybackSnapshot]] = {}
+        # Section name -> fingerprint of its current payload
+        self.fingerprints: dict[str, int] = {}
+        self.state_writes = 0
+        self.state_writes_skipped = 0
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_SNAPSHOT.format(entry_id=entry.entry_id)
+        )
+        # Set while a delayed snapshot save has not been written yet
+        self._snapshot_pending = False
+        # Activity log entries accumulated across refreshes
+        self.history = ActivityHistory(
+            hass,
+            hass.config.path(
+                STORAGE_DIR, HISTORY_DB_FILE.format(entry_id=entry.entry_id)
+            ),
+        )
+        self.playback_stats: dict[str, Any] = {"count": 0, "per_user": [], "recent": []}
+        # Library tree for media browsing
+        self.library = LibraryBrowser(client)
+        # Resized artwork served to the frontend by the media players
+        self.artwork = ArtworkCache(
+            hass,
+            client,
+            hass.config.path(STORAGE_DIR, ARTWORK_DIR.format(entry_id=entry.entry_id)),
+        )
+        self.watch_time = WatchTimeTracker(hass, entry.entry_id)
+        # Device sightings, for automatic discovery when enabled
+        self.devices = DeviceTracker(hass, entry.entry_id)
+        self.discovery_enabled = False
+        # Track sensors that need MediaStreams: token -> device filter
+        self._stream_filters: dict[object, str | None] = {}
+        # Item id -> MediaStreams of the items those sensors show
+        self.media_streams: dict[str, list[dict[str, Any]]] = {}
+        self._streams_pending: set[str] = set()
+        # Measured effect of the /Sessions projection, once per setup
+        self.sessions_projection: dict[str, int] | None = None
+        client.set_breaker_listener(self._handle_breaker_change)
+        # Stage timings of the last polls, for diagnostics
+        self.refresh_timings: deque[dict[str, Any]] = deque(
+            maxlen=DIAGNOSTICS_REFRESH_HISTORY
+        )
+        self._pending_timing: dict[str, Any] | None = None
+        # Session id -> remote control commands of that session
+        self.command_queues: dict[str, SessionCommandQueue] = {}
+        # Re-reads only /Sessions once a burst of commands was sent
+        self._sessions_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=COMMAND_REFRESH_DELAY,
+            immediate=False,
+            function=self._async_refresh_sessions,
+        )
+
+    def _tick_interval(self) -> timedelta:
+        """Return the coordinator interval for the current session cadence."""
+        return timedelta(
+            seconds=min(self.sessions_interval, *SECTION_POLL_INTERVALS.values())
+        )
+
+    def _is_playing(self, sessions: list[dict[str, Any]]) -> bool:
+        """Return True if any monitored device is playing something."""
+        monitored = {
+            device["device_id"]
+            for device in self.entry.options.get("monitored_devices", [])
+        }
+        for session in sessions:
+            if not session.get("NowPlayingItem"):
+                continue
+            if not monitored:
+                return True
+            if (
+                session.get("DeviceId") in monitored
+                or str(session.get("InternalDeviceId", "")) in monitored
+            ):
+                return True
+        return False
+
+    @callback
+    def _update_cadence(self, sessions: list[dict[str, Any]]) -> None:
+        """Switch between the playing and idle session cadence.
+
+        Speeds up as soon as playback starts, but only slows down after
+        ADAPTIVE_IDLE_HYSTERESIS idle samples in a row so a short pause
+        between episodes does not make the interval flap.
+        """
+        if self._is_playing(sessions):
+            self._idle_samples = 0
+            interval = self.playing_interval
+        else:
+            self._idle_samples += 1
+            if self._idle_samples < ADAPTIVE_IDLE_HYSTERESIS:
+                return
+            interval = self.idle_interval
+
+        if interval == self.sessions_interval:
+            return
+
+        _LOGGER.debug(
+            "Session poll interval %ss -> %ss", self.sessions_interval, interval
+        )
+        self.sessions_interval = interval
+        self.cadence_changes += 1
+        self.update_interval = self._tick_interval()
+
+    def _due_sections(self, now: float) -> list[str]:
+        """Return the sections whose poll interval has elapsed."""
+        push_active = self.websocket is not None and self.websocket.connected
+        due = []
+        for section in DASHBOARD_SECTIONS:
+            # Sessions arrive over the WebSocket while it is connected
+            if section == "sessions" and push_active:
+                continue
+            if section == "sessions":
+                interval = self.sessions_interval
+            else:
+                interval = SECTION_POLL_INTERVALS[section]
+            last = self._section_fetched.get(section)
+            if last is None or now - last >= interval:
+                due.append(section)
+        return due
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Emby."""
+        """Fetch the sections that are due from Emby."""
+        now = time.monotonic()
+        self._last_poll = now
+
+        due = self._due_sections(now)
+        if not due:
+            return self.data
+
+        # The client probes the server itself and refreshes us when it is back
+        if self.client.breaker_state != BREAKER_CLOSED:
+            raise UpdateFailed("Emby server unreachable, waiting for it to respond")
+
+        started = time.monotonic()
+        decode_before = self.client.decode_ms
+        timing: dict[str, Any] = {"time": dt_util.utcnow().isoformat(), "due": due}
+
+        results = await self.client.get_dashboard_sections(due)
+        timing["network_ms"] = round((time.monotonic() - started) * 1000, 1)
+        timing["sections_ms"] = self.client.last_section_timings
+        timing["decode_ms"] = round(self.client.decode_ms - decode_before, 1)
+        timing["failed"] = sorted(set(due) - set(results))
+        if not results:
+            # Completed by async_update_listeners, which runs right after
+            self._pending_timing = timing
+            _LOGGER.error("Error fetching Emby data: all %d requests failed", len(due))
+            raise UpdateFailed("Error fetching Emby data: server unreachable")
+
+        for section in results:
+            self._section_fetched[section] = now
+
+        # Keep the previous value of sections that were not due or failed
+        data = dict(self.data) if self.data else {}
+        data.update(results)
+        for section in DASHBOARD_SECTIONS:
+            data.setdefault(section, empty_section(section))
+
+        processing_started = time.monotonic()
+        self._async_sections_updated(data, results)
+        timing["process_ms"] = round((time.monotonic() - processing_started) * 1000, 1)
+
+        if "activity_log" in results:
+            history_started = time.monotonic()
+            await self._async_update_history()
+            timing["history_ms"] = round((time.monotonic() - history_started) * 1000, 1)
+
+        if "sessions" in results and self.sessions_projection is None:
+            self.sessions_projection = {}
+            self.hass.async_create_task(self._async_measure_sessions_projection())
+
+        # Persist the merged data so the next startup can use it right away.
+        # A pending save writes the latest data, so it is not re-armed.
+        if not self._snapshot_pending:
+            self._snapshot_pending = True
+            self._store.async_delay_save(self._snapshot_to_save, SNAPSHOT_SAVE_DELAY)
+
+        self._pending_timing = timing
+        _LOGGER.debug("Successfully updated Emby sections: %s", list(results))
+        return data
+
+    @callback
+    def _async_sections_updated(
+        self, data: dict[str, Any], sections: dict[str, Any]
+    ) -> None:
+        """Refresh fingerprints and derived state of updated sections."""
+        previous = self.data or {}
+        for section, value in sections.items():
+            # The client returns the same object when the body did not change
+            if section == "sessions" or value is previous.get(section):
+                continue
+            fingerprint = self._fingerprint(value)
+            if section in ("items_counts", "library_folders") and self.fingerprints.get(
+                section, fingerprint
+            ) != fingerprint:
+                # Items were added or removed, cached browse pages are stale
+                self.library.invalidate()
+            self.fingerprints[section] = fingerprint
+            if section == "devices" and self.discovery_enabled:
+                self.devices.async_update_devices(value)
+
+        if "sessions" in sections:
+            self._async_sessions_updated(data["sessions"])
+        elif "devices" in sections and self.discovery_enabled:
+            self._async_discover_devices()
+
+    async def _async_update_history(self) -> None:
+        """Store new activity log entries and recompute today's counters."""
+        try:
+            added = await self._async_fetch_activity()
+            if added:
+                await self.history.async_prune(
+                    dt_util.utcnow() - timedelta(days=HISTORY_RETENTION_DAYS)
+                )
+        except (EmbyAPIError, sqlite3.Error) as err:
+            # Counters are still computed from what was stored before
+            _LOGGER.warning("Error updating Emby playback history: %s", err)
+
+        today = dt_util.now().date()
+        try:
+            stats = await self.history.async_playback_stats(
+                dt_util.start_of_local_day(today),
+                dt_util.start_of_local_day(today + timedelta(days=1)),
+            )
+        except sqlite3.Error as err:
+            _LOGGER.warning("Error reading Emby playback history: %s", err)
+            return
+
+        self.playback_stats = stats
+        self.fingerprints["playback_stats"] = self._fingerprint(stats)
+
+    async def _async_fetch_activity(self) -> int:
+        """Page through activity log entries newer than the high-water mark.
+
+        Entries come newest first. A pass cut short by HISTORY_MAX_PAGES
+        stores the index of its next page and resumes there on the next
+        refresh; entries logged in between shift older ones to higher
+        indexes, so they are read twice (and ignored by the history
+        store) but never skipped. The mark only advances once a pass
+        reached the end.
+
+        Returns:
+            Number of new entries
+        """
+        mark = await self.history.async_get_high_water_mark()
+        if mark is None:
+            mark = (
+                dt_util.utcnow() - timedelta(days=HISTORY_RETENTION_DAYS)
+            ).isoformat(timespec="seconds")
+
+        resume = await self.history.async_get_backfill()
+        start_index, newest = resume if resume is not None else (0, mark)
+        added = 0
+        for _ in range(HISTORY_MAX_PAGES):
+            result = await self.client.get_activity_log(
+                limit=HISTORY_PAGE_SIZE,
+                start_index=start_index,
+                min_date=mark.replace("+00:00", "Z"),
+            )
+            items = (result or {}).get("Items", [])
+            added += await self.history.async_add_entries(items)
+            for item in items:
+                date = normalize_date(item.get("Date"))
+                if date is not None and date > newest:
+                    newest = date
+            start_index += len(items)
+            if len(items) < HISTORY_PAGE_SIZE:
+                break
+        else:
+            await self.history.async_set_backfill(start_index, newest)
+            _LOGGER.debug(
+                "Activity log backfill continues at entry %d on the next refresh",
+                start_index,
+            )
+            return added
+
+        if resume is not None:
+            await self.history.async_clear_backfill()
+        if newest != mark:
+            await self.history.async_set_high_water_mark(newest)
+        if added:
+            _LOGGER.debug("Stored %d new activity log entries", added)
+        return added
+
+    def user_name(self, user_id: str | None) -> str | None:
+        """Return the name of an Emby user by id."""
+        if not user_id or not self.data:
+            return None
+        for user in self.data.get("users", []):
+            if user.get("Id") == user_id:
+                return user.get("Name")
+        return None
+
+    def _snapshot_to_save(self) -> dict[str, Any]:
+        """Return the snapshot of the current data, which is now written."""
+        self._snapshot_pending = False
+        return self._snapshot_data(self.data or {})
+
+    @staticmethod
+    def _snapshot_data(data: dict[str, Any]) -> dict[str, Any]:
+        """Return a compact copy of the data for persisting.
+
+        Playback state is transient and would show stale "playing" states
+        after a restart, so sessions keep only their device and user info.
+        """
+        snapshot = dict(data)
+        snapshot["sessions"] = [
+            {
+                key: value
+                for key, value in session.items()
+                if key not in SNAPSHOT_SESSION_EXCLUDE
+            }
+            for session in data.get("sessions", [])
+        ]
+        return snapshot
+
+    async def async_load_snapshot(self) -> bool:
+        """Seed the coordinator with the last persisted data.
+
+        Returns:
+            True if a snapshot was loaded, False if none was stored
+        """
+        snapshot = await self._store.async_load()
+        if not snapshot:
+            return False
+
+        data = {
+            section: snapshot.get(section, empty_section(section))
+            for section in DASHBOARD_SECTIONS
+        }
+        self._async_sections_updated(data, data)
+        self.async_set_updated_data(data)
+        _LOGGER.debug("Seeded Emby data from the stored snapshot")
+        return True
+
+    @callback
+    def _async_sessions_updated(self, sessions: list[dict[str, Any]]) -> None:
+        """Process a freshly received session list."""
+        self.sessions_sampled_at = time.monotonic()
+        self.sessions_sampled_utc = dt_util.utcnow()
+        snapshots = [
+            PlaybackSnapshot(session, self.sessions_sampled_at, self._fingerprint(session))
+            for session in sessions
+        ]
+        self.playback_index = self._build_playback_index(snapshots)
+        self.fingerprints["sessions"] = hash(
+            tuple(snapshot.fingerprint for snapshot in snapshots)
+        )
+        # Queues of ended sessions are no longer needed once drained
+        session_ids = {snapshot.session_id for snapshot in snapshots}
+        for session_id in [
+            session_id
+            for session_id, queue in self.command_queues.items()
+            if session_id not in session_ids and not queue.busy
+        ]:
+            del self.command_queues[session_id]
+        if self.watch_time.async_update(snapshots):
+            self._update_watch_time_fingerprint()
+        if self._stream_filters:
+            self._async_update_media_streams(snapshots)
+        self._update_cadence(sessions)
+        if self.discovery_enabled:
+            self.devices.async_update_sessions(sessions)
+            self._async_discover_devices()
+
+    @callback
+    def async_enable_discovery(self) -> None:
+        """Start monitoring new devices automatically.
+
+        Called once the platforms are set up, so they receive the devices
+        discovered from here on.
+        """
+        self.discovery_enabled = True
+        if self.data:
+            self.devices.async_update_devices(self.data.get("devices") or {})
+            self.devices.async_update_sessions(self.data.get("sessions", []))
+            self._async_discover_devices()
+
+    @callback
+    def _async_discover_devices(self) -> None:
+        """Add recently active devices that are not monitored yet.
+
+        They are appended to the monitored devices in the options; the
+        options listener then adds their entities without a reload.
+        """
+        monitored = self.entry.options.get("monitored_devices", [])
+        new = self.devices.async_pop_candidates(
+            {device["device_id"] for device in monitored}
+        )
+        if not new:
+            return
+        _LOGGER.info(
+            "Discovered Emby devices: %s",
+            ", ".join(device["device_name"] for device in new),
+        )
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            options={
+                **self.entry.options,
+                "monitored_devices": [
+                    *monitored,
+                    *({**device, "discovered": True} for device in new),
+                ],
+            },
+        )
+
+    @callback
+    def async_prune_devices(self, now: datetime | None = None) -> None:
+        """Stop monitoring discovered devices that have been inactive too long."""
+        monitored = self.entry.options.get("monitored_devices", [])
+        utcnow = dt_util.utcnow()
+        keep = [
+            device
+            for device in monitored
+            if not (
+                device.get("discovered")
+                and self.devices.is_stale(device["device_id"], utcnow)
+            )
+        ]
+        if len(keep) == len(monitored):
+            return
+        _LOGGER.info("Removing %d inactive Emby devices", len(monitored) - len(keep))
+        self.hass.config_entries.async_update_entry(
+            self.entry, options={**self.entry.options, "monitored_devices": keep}
+        )
+
+    @callback
+    def async_track_media_streams(self, device_filter: str | None) -> CALLBACK_TYPE:
+        """Fetch MediaStreams for what a device plays until unsubscribed.
+
+        /Sessions is requested without MediaStreams; track sensors register
+        here so the streams are only fetched while such a sensor exists.
+        """
+        token = object()
+        self._stream_filters[token] = device_filter
+        if self.data:
+            self._async_update_media_streams(
+                [
+                    PlaybackSnapshot(session, self.sessions_sampled_at)
+                    for session in self.data.get("sessions", [])
+                ]
+            )
+
+        @callback
+        def _remove() -> None:
+            self._stream_filters.pop(token, None)
+
+        return _remove
+
+    @callback
+    def _async_update_media_streams(self, snapshots: list[PlaybackSnapshot]) -> None:
+        """Fetch the MediaStreams of newly playing items track sensors show."""
+        filters = set(self._stream_filters.values())
+        wanted = {
+            snapshot.item_id
+            for snapshot in snapshots
+            if snapshot.item_id
+            # Pushed sessions are not projected and carry their streams
+            and "MediaStreams" not in snapshot.session.get("NowPlayingItem", {})
+            and (
+                None in filters
+                or "all" in filters
+                or snapshot.device_id in filters
+                or str(snapshot.session.get("InternalDeviceId", "")) in filters
+            )
+        }
+        # Only keep the streams of items that are still playing
+        for item_id in set(self.media_streams) - wanted:
+            del self.media_streams[item_id]
+
+        missing = wanted - set(self.media_streams) - self._streams_pending
+        if missing:
+            self._streams_pending |= missing
+            self.hass.async_create_task(self._async_fetch_media_streams(missing))
+
+    async def _async_fetch_media_streams(self, item_ids: set[str]) -> None:
+        """Fetch and store the MediaStreams of items."""
         try:
-            data = await self.client.get_dashboard_overview()
-            _LOGGER.debug("Successfully updated Emby data")
-            return data
+            streams = await self.client.get_media_streams(sorted(item_ids))
         except EmbyAPIError as err:
-            _LOGGER.error("Error fetching Emby data: %s", err)
-            raise UpdateFailed(f"Error fetching Emby data: {err}") from err
+            _LOGGER.debug("Error fetching media streams: %s", err)
+            return
+        finally:
+            self._streams_pending -= item_ids
+
+        self.media_streams.update(streams)
+        self.fingerprints["media_streams"] = self._fingerprint(
+            sorted(self.media_streams)
+        )
+        self.async_update_listeners()
 
+    def media_streams_for(self, now_playing: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return the MediaStreams of a NowPlayingItem."""
+        if "MediaStreams" in now_playing:
+            return now_playing["MediaStreams"]
+        return self.media_streams.get(now_playing.get("Id"), [])
 
-class EmbySensorBase(CoordinatorEntity, SensorEntity):
+    async def _async_measure_sessions_projection(self) -> None:
+        """Log how many bytes the /Sessions projection saves."""
+        try:
+            self.sessions_projection = await self.client.measure_sessions_projection()
+        except EmbyAPIError as err:
+            _LOGGER.debug("Could not measure the sessions projection: %s", err)
+            return
+
+        full_bytes = self.sessions_projection["full_bytes"]
+        _LOGGER.info(
+            "Sessions projection: %d bytes instead of %d (%d%% saved)",
+            self.sessions_projection["projected_bytes"],
+            full_bytes,
+            100 * self.sessions_projection["saved_bytes"] // full_bytes if full_bytes else 0,
+        )
+
+    def _update_watch_time_fingerprint(self) -> None:
+        """Refresh the fingerprint of the watch time totals."""
+        self.fingerprints["watch_time"] = hash(
+            (self.watch_time.day, self.watch_time.total)
+        )
+
+    @callback
+    def async_midnight(self, now: datetime) -> None:
+        """Reset the daily watch time totals at local midnight."""
+        if self.watch_time.async_rollover():
+            self._update_watch_time_fingerprint()
+            self.async_update_listeners()
+
+    @staticmethod
+    def _fingerprint(value: Any) -> int:
+        """Return a fingerprint that changes whenever the payload changes."""
+        return hash(json_dumps_sorted(value))
+
+    def fingerprint(self, key: str) -> Any:
+        """Return the fingerprint of a section or of a device's sessions.
+
+        Keys are dashboard section names, or "device:<id>" for the sessions
+        of a single device.
+        """
+        if key.startswith("device:"):
+            return tuple(
+                snapshot.fingerprint
+                for snapshot in self.playback_for(key.removeprefix("device:"))
+            )
+        return self.fingerprints.get(key)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners and log how many state writes were avoided."""
+        self.fingerprints["request_stats"] = self._request_stats_fingerprint()
+        writes, skipped = self.state_writes, self.state_writes_skipped
+        started = time.monotonic()
+        super().async_update_listeners()
+        fanout_ms = round((time.monotonic() - started) * 1000, 1)
+
+        # Complete the timing of the poll that led to this update
+        timing, self._pending_timing = self._pending_timing, None
+        if timing is not None:
+            timing["fanout_ms"] = fanout_ms
+            timing["listeners"] = len(self._listeners)
+            timing["state_writes"] = self.state_writes - writes
+            timing["state_writes_skipped"] = self.state_writes_skipped - skipped
+            self.refresh_timings.append(timing)
+        _LOGGER.debug(
+            "Coordinator update: %d state writes, %d skipped as unchanged",
+            self.state_writes - writes,
+            self.state_writes_skipped - skipped,
+        )
+
+    def _request_stats_fingerprint(self) -> int:
+        """Return a fingerprint of the request statistics shown by sensors."""
+        client = self.client
+        return hash(
+            (
+                round(client.refresh_latency.percentile(50) or 0),
+                round(client.refresh_latency.percentile(95) or 0),
+                client.slowest_endpoint(),
+                sum(stats.failures for stats in client.endpoint_stats.values()),
+            )
+        )
+
+    @staticmethod
+    def _build_playback_index(
+        snapshots: list[PlaybackSnapshot],
+    ) -> dict[str, list[PlaybackSnapshot]]:
+        """Index playback snapshots by DeviceId and InternalDeviceId.
+
+        Built once per session update so entities can look up their device
+        in O(1) and share one parsed snapshot instead of scanning and
+        re-parsing every session on each property access.
+        """
+        index: dict[str, list[PlaybackSnapshot]] = {}
+        for snapshot in snapshots:
+            session = snapshot.session
+            keys = {session.get("DeviceId"), str(session.get("InternalDeviceId", ""))}
+            for key in keys:
+                if key:
+                    index.setdefault(key, []).append(snapshot)
+        return index
+
+    @property
+    def listener_count(self) -> int:
+        """Return the number of entities listening for updates."""
+        return len(self._listeners)
+
+    def sessions_for(self, device_filter: str | None) -> list[dict[str, Any]]:
+        """Return the sessions matching a device filter, in server order.
+
+        An empty filter or "all" matches every session.
+        """
+        if not device_filter or device_filter == "all":
+            return self.data.get("sessions", []) if self.data else []
+        return [snapshot.session for snapshot in self.playback_for(device_filter)]
+
+    def playback_for(self, device_id: str) -> list[PlaybackSnapshot]:
+        """Return the playback snapshots of a device, in server order."""
+        return self.playback_index.get(device_id, [])
+
+    def get_playback(self, device_id: str) -> PlaybackSnapshot | None:
+        """Return the snapshot of a device, preferring one that is playing."""
+        snapshots = self.playback_index.get(device_id)
+        if not snapshots:
+            return None
+        for snapshot in snapshots:
+            if snapshot.is_playing:
+                return snapshot
+        return snapshots[0]
+
+    def get_session(self, device_id: str) -> dict[str, Any] | None:
+        """Return the raw session of a device, preferring one that is playing."""
+        snapshot = self.get_playback(device_id)
+        return snapshot.session if snapshot else None
+
+    def command_queue(self, session_id: str) -> SessionCommandQueue:
+        """Return the remote control queue of a session."""
+        queue = self.command_queues.get(session_id)
+        if queue is None:
+            queue = self.command_queues[session_id] = SessionCommandQueue(
+                self.hass, self.client, session_id, self.async_request_sessions_refresh
+            )
+        return queue
+
+    @callback
+    def async_request_sessions_refresh(self) -> None:
+        """Re-read the sessions shortly, to confirm commands that were sent.
+
+        Only /Sessions is requested; the other sections keep their schedule.
+        """
+        self.hass.async_create_task(self._sessions_debouncer.async_call())
+
+    async def _async_refresh_sessions(self) -> None:
+        """Fetch the sessions and merge them into the coordinator data."""
+        # Pushed session updates already report the outcome
+        if self.data is None or (self.websocket is not None and self.websocket.connected):
+            return
+        try:
+            sessions = await self.client.get_sessions()
+        except EmbyAPIError as err:
+            _LOGGER.debug("Error refreshing Emby sessions: %s", err)
+            return
+        if sessions is None:
+            return
+
+        self._section_fetched["sessions"] = time.monotonic()
+        self._async_sessions_updated(sessions)
+        self.async_set_updated_data({**self.data, "sessions": sessions})
+
+        # Like pushes, a steady stream of commands would otherwise keep
+        # rescheduling the poll of the other sections.
+        if time.monotonic() - self._last_poll >= self.update_interval.total_seconds():
+            self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_request_full_refresh(self) -> None:
+        """Refresh every section regardless of its schedule."""
+        self._section_fetched.clear()
+        self.client.invalidate()
+        await self.async_request_refresh()
+
+    @callback
+    def async_start_websocket(self) -> None:
+        """Subscribe to session updates pushed by the server."""
+        if self.websocket is None:
+            self.websocket = EmbyWebSocket(
+                self.client,
+                self._handle_push_sessions,
+                self._handle_push_connection,
+            )
+        self.websocket.start()
+
+    async def async_stop_websocket(self) -> None:
+        """Close the push subscription."""
+        if self.websocket is not None:
+            await self.websocket.stop()
+            self.websocket = None
+
+    async def async_close(self) -> None:
+        """Stop push updates, breaker probes and the stores.
+
+        Delayed saves are written now; left pending they would re-create
+        the files after async_remove_entry deleted them.
+        """
+        self._sessions_debouncer.async_cancel()
+        await self.async_stop_websocket()
+        await self.client.close()
+        await self.history.async_close()
+        if self._snapshot_pending and self.data is not None:
+            await self._store.async_save(self._snapshot_to_save())
+        await self.watch_time.async_flush()
+        await self.devices.async_flush()
+
+    @callback
+    def _handle_breaker_change(self, state: str) -> None:
+        """Refresh as soon as the server answers again."""
+        self.fingerprints["breaker"] = hash((state, self.client.breaker_retry_at))
+        if state == BREAKER_CLOSED:
+            self.hass.async_create_task(self.async_request_refresh())
+        else:
+            self.async_update_listeners()
+
+    @callback
+    def _handle_push_sessions(self, sessions: list[dict[str, Any]]) -> None:
+        """Merge pushed sessions into the coordinator data."""
+        if self.data is None:
+            return
+
+        sessions = self._active_sessions(sessions)
+        self._async_sessions_updated(sessions)
+        self.async_set_updated_data({**self.data, "sessions": sessions})
+
+        # async_set_updated_data reschedules the poll, so frequent pushes
+        # would otherwise starve the endpoints that are not pushed.
+        if time.monotonic() - self._last_poll >= self.update_interval.total_seconds():
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @staticmethod
+    def _active_sessions(sessions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Drop sessions idle for longer than SESSIONS_ACTIVE_WITHIN.
+
+        Polled sessions are filtered by the server (ActiveWithinSeconds);
+        pushed ones are not, so the same cut-off is applied here.
+        """
+        cutoff = dt_util.utcnow() - timedelta(seconds=SESSIONS_ACTIVE_WITHIN)
+        active = []
+        for session in sessions:
+            last_activity = dt_util.parse_datetime(session.get("LastActivityDate") or "")
+            if last_activity is not None:
+                if last_activity.tzinfo is None:
+                    last_activity = last_activity.replace(tzinfo=dt_util.UTC)
+                if last_activity < cutoff:
+                    continue
+            active.append(session)
+        return active
+
+    @callback
+    def _handle_push_connection(self, connected: bool) -> None:
+        """Fall back to polled sessions when the push connection drops."""
+        if connected:
+            _LOGGER.info("Emby WebSocket connected, receiving session updates")
+            return
+
+        _LOGGER.info("Emby WebSocket disconnected, falling back to polling")
+        # Changes since the last push may have been missed, poll them now
+        self._section_fetched.pop("sessions", None)
+        self.hass.async_create_task(self.async_request_refresh())
+
+
+class EmbySensorBase(EmbyEntity, SensorEntity):
     """Base class for Emby sensors."""
 
     def __init__(
@@ -184,9 +1034,13 @@ class EmbySensorBase(CoordinatorEntity, SensorEntity):
         }
 
 
-class EmbyDeviceSensorBase(CoordinatorEntity, SensorEntity):
+class EmbyDeviceSensorBase(EmbyEntity, SensorEntity):
     """Base class for Emby device-level sensors."""
 
+    # Sensors derived from the playback position set this to refresh their
+    # state every second from the extrapolated position while playing
+    _extrapolate_position = False
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -204,6 +1058,52 @@ class EmbyDeviceSensorBase(CoordinatorEntity, SensorEntity):
         self.device_name = device_name
         self.user_name = user_name
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
+        self._fingerprint_keys = (f"device:{device_id}",)
+        self._position_timer: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start position updates if the device is already playing."""
+        await super().async_added_to_hass()
+        if self._extrapolate_position:
+            self.async_on_remove(self._stop_position_timer)
+            self._update_position_timer()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._extrapolate_position:
+            self._update_position_timer()
+        super()._handle_coordinator_update()
+
+    @property
+    def playback(self) -> PlaybackSnapshot | None:
+        """Return the playback snapshot of this device."""
+        return self.coordinator.get_playback(self.device_id)
+
+    @callback
+    def _update_position_timer(self) -> None:
+        """Run the per-second timer only while playback is running."""
+        playback = self.playback
+        running = playback is not None and playback.is_running
+
+        if running and self._position_timer is None:
+            self._position_timer = async_track_time_interval(
+                self.hass, self._async_position_tick, POSITION_UPDATE_INTERVAL
+            )
+        elif not running:
+            self._stop_position_timer()
+
+    @callback
+    def _stop_position_timer(self) -> None:
+        """Cancel the per-second timer."""
+        if self._position_timer is not None:
+            self._position_timer()
+            self._position_timer = None
+
+    @callback
+    def _async_position_tick(self, now: datetime) -> None:
+        """Write the state computed from the extrapolated position."""
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -223,13 +1123,9 @@ class EmbyDeviceSensorBase(CoordinatorEntity, SensorEntity):
 
         # Get app/client name from coordinator data if available
         app_name = "Emby Client"
-        sessions = self.coordinator.data.get("sessions", []) if self.coordinator.data else []
-        for session in sessions:
-            session_device_id = session.get("DeviceId")
-            session_internal_id = str(session.get("InternalDeviceId", ""))
-            if session_device_id == self.device_id or session_internal_id == self.device_id:
-                app_name = session.get("Client", app_name)
-                break
+        playback = self.playback
+        if playback and playback.client:
+            app_name = playback.client
 
         return {
             "identifiers": {(DOMAIN, device_identifier)},
@@ -243,6 +1139,8 @@ class EmbyDeviceSensorBase(CoordinatorEntity, SensorEntity):
 class EmbyVersionSensor(EmbySensorBase):
     """Emby server version sensor."""
 
+    _fingerprint_keys = ("system_info",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -272,6 +1170,8 @@ class EmbyVersionSensor(EmbySensorBase):
 class EmbyServerNameSensor(EmbySensorBase):
     """Emby server name sensor."""
 
+    _fingerprint_keys = ("system_info",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -292,6 +1192,8 @@ class EmbyServerNameSensor(EmbySensorBase):
 class EmbyMovieCountSensor(EmbySensorBase):
     """Emby movie count sensor."""
 
+    _fingerprint_keys = ("items_counts",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -313,6 +1215,8 @@ class EmbyMovieCountSensor(EmbySensorBase):
 class EmbySeriesCountSensor(EmbySensorBase):
     """Emby series count sensor."""
 
+    _fingerprint_keys = ("items_counts",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -334,6 +1238,8 @@ class EmbySeriesCountSensor(EmbySensorBase):
 class EmbyEpisodeCountSensor(EmbySensorBase):
     """Emby episode count sensor."""
 
+    _fingerprint_keys = ("items_counts",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -355,6 +1261,8 @@ class EmbyEpisodeCountSensor(EmbySensorBase):
 class EmbyTotalItemsSensor(EmbySensorBase):
     """Emby total items sensor."""
 
+    _fingerprint_keys = ("items_counts",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -393,6 +1301,8 @@ class EmbyTotalItemsSensor(EmbySensorBase):
 class EmbyLibraryFoldersSensor(EmbySensorBase):
     """Emby library folders sensor."""
 
+    _fingerprint_keys = ("library_folders",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -430,6 +1340,8 @@ class EmbyLibraryFoldersSensor(EmbySensorBase):
 class EmbyTotalUsersSensor(EmbySensorBase):
     """Emby total users sensor."""
 
+    _fingerprint_keys = ("users",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -465,6 +1377,8 @@ class EmbyTotalUsersSensor(EmbySensorBase):
 class EmbyActiveSessionsSensor(EmbySensorBase):
     """Emby active sessions sensor."""
 
+    _fingerprint_keys = ("sessions",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -501,6 +1415,8 @@ class EmbyActiveSessionsSensor(EmbySensorBase):
 class EmbyDeviceCountSensor(EmbySensorBase):
     """Emby device count sensor."""
 
+    _fingerprint_keys = ("devices",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -538,6 +1454,8 @@ class EmbyDeviceCountSensor(EmbySensorBase):
 class EmbyRecentActivitiesSensor(EmbySensorBase):
     """Emby recent activities sensor."""
 
+    _fingerprint_keys = ("activity_log",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -576,6 +1494,8 @@ class EmbyRecentActivitiesSensor(EmbySensorBase):
 class EmbyScheduledTasksSensor(EmbySensorBase):
     """Emby scheduled tasks sensor."""
 
+    _fingerprint_keys = ("scheduled_tasks",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -632,118 +1552,55 @@ class EmbyNowPlayingSensor(EmbyDeviceSensorBase):
         self._attr_icon = ICON_PLAY
         self._device_filter = device_id
 
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
-
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
-        )
-
     @property
     def native_value(self) -> str:
         """Return the state - currently playing content name."""
-        sessions = self.coordinator.data.get("sessions", [])
-
-        # Find first active playback session matching device filter
-        for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
-            now_playing = session.get("NowPlayingItem")
-            if now_playing:
-                media_name = now_playing.get("Name", "Unknown")
-                media_type = now_playing.get("Type", "")
-
-                # For episodes, include series name
-                if media_type == "Episode":
-                    series_name = now_playing.get("SeriesName", "")
-                    season = now_playing.get("ParentIndexNumber")
-                    episode = now_playing.get("IndexNumber")
-                    if series_name and season and episode:
-                        return f"{series_name} S{season:02d}E{episode:02d}"
-
-                return media_name
+        playback = self.playback
+        if playback and playback.is_playing:
+            return playback.title
 
         return "无播放"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes with detailed playback information."""
-        sessions = self.coordinator.data.get("sessions", [])
-
         # Collect all active playback sessions matching device filter
         active_playbacks = []
-        for session in sessions:
-            if not self._should_include_session(session):
+        for playback in self.coordinator.playback_for(self._device_filter):
+            if not playback.is_playing:
                 continue
 
-            now_playing = session.get("NowPlayingItem")
-            if not now_playing:
-                continue
-
-            play_state = session.get("PlayState", {})
-            media_type = now_playing.get("Type", "Unknown")
-
-            # Determine media type in Chinese
-            media_type_cn = {
-                "Movie": "电影",
-                "Episode": "剧集",
-                "Video": "视频",
-                "Audio": "音频",
-                "Music": "音乐",
-            }.get(media_type, media_type)
-
-            # Calculate progress percentage
-            position_ticks = play_state.get("PositionTicks", 0)
-            runtime_ticks = now_playing.get("RunTimeTicks", 0)
-            progress_percent = 0
-            if runtime_ticks > 0:
-                progress_percent = int((position_ticks / runtime_ticks) * 100)
-
-            # Determine playback state
-            is_paused = play_state.get("IsPaused", False)
-            playback_state = "暂停" if is_paused else "播放中"
-
             playback_info = {
-                "media_name": now_playing.get("Name"),
-                "media_type": media_type_cn,
-                "original_type": media_type,
-                "playback_state": playback_state,
-                "is_paused": is_paused,
-                "progress_percent": progress_percent,
-                "user": session.get("UserName", "Unknown"),
-                "device": session.get("DeviceName", "Unknown"),
-                "client": session.get("Client", "Unknown"),
+                "media_name": playback.item_name,
+                "media_type": playback.media_type_cn,
+                "original_type": playback.item_type,
+                "playback_state": "暂停" if playback.is_paused else "播放中",
+                "is_paused": playback.is_paused,
+                "progress_percent": playback.progress_percent(),
+                "user": playback.user_name or "Unknown",
+                "device": playback.device_name or "Unknown",
+                "client": playback.client or "Unknown",
             }
 
             # Add series-specific info
-            if media_type == "Episode":
+            if playback.item_type == "Episode":
                 playback_info.update({
-                    "series_name": now_playing.get("SeriesName"),
-                    "season": now_playing.get("ParentIndexNumber"),
-                    "episode": now_playing.get("IndexNumber"),
+                    "series_name": playback.series_name,
+                    "season": playback.season,
+                    "episode": playback.episode,
                 })
 
             # Add movie-specific info
-            elif media_type == "Movie":
+            elif playback.item_type == "Movie":
                 playback_info.update({
-                    "year": now_playing.get("ProductionYear"),
+                    "year": playback.year,
                 })
 
             # Add position info
-            if position_ticks and runtime_ticks:
-                position_seconds = int(position_ticks / 10000000)
-                runtime_seconds = int(runtime_ticks / 10000000)
-
-                position_minutes = position_seconds // 60
-                runtime_minutes = runtime_seconds // 60
+            position_ticks = playback.current_position_ticks()
+            if position_ticks and playback.runtime_ticks:
+                position_minutes = int(position_ticks / TICKS_PER_SECOND) // 60
+                runtime_minutes = int(playback.runtime_ticks / TICKS_PER_SECOND) // 60
 
                 playback_info.update({
                     "position": f"{position_minutes}分钟",
@@ -804,56 +1661,27 @@ class EmbyPlaybackStateSensor(EmbyDeviceSensorBase):
         self._attr_icon = ICON_PLAY
         self._device_filter = device_id
 
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
-
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
-        )
-
     @property
     def native_value(self) -> str:
         """Return the playback state."""
-        sessions = self.coordinator.data.get("sessions", [])
-
-        for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
-            now_playing = session.get("NowPlayingItem")
-            if now_playing:
-                play_state = session.get("PlayState", {})
-                is_paused = play_state.get("IsPaused", False)
-                return "暂停" if is_paused else "播放中"
+        playback = self.playback
+        if playback and playback.is_playing:
+            return "暂停" if playback.is_paused else "播放中"
 
         return "空闲"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        sessions = self.coordinator.data.get("sessions", [])
-
-        for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
-            now_playing = session.get("NowPlayingItem")
-            if now_playing:
-                play_state = session.get("PlayState", {})
-                return {
-                    "is_paused": play_state.get("IsPaused", False),
-                    "is_muted": play_state.get("IsMuted", False),
-                    "can_seek": play_state.get("CanSeek", False),
-                    "device": session.get("DeviceName"),
-                    "user": session.get("UserName"),
-                }
+        playback = self.playback
+        if playback and playback.is_playing:
+            return {
+                "is_paused": playback.is_paused,
+                "is_muted": playback.is_muted,
+                "can_seek": playback.can_seek,
+                "device": playback.device_name,
+                "user": playback.user_name,
+            }
 
         return {"status": "无活动播放"}
 
@@ -861,6 +1689,8 @@ class EmbyPlaybackStateSensor(EmbyDeviceSensorBase):
 class EmbyMediaTypeSensor(EmbySensorBase):
     """Emby media type sensor - shows movie/episode/video."""
 
+    _fingerprint_keys = ("sessions",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -872,29 +1702,12 @@ class EmbyMediaTypeSensor(EmbySensorBase):
         self._attr_icon = ICON_MOVIE
         self._device_filter = entry.data.get("device_id")
 
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
-
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
-        )
-
     @property
     def native_value(self) -> str:
         """Return the media type."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 media_type = now_playing.get("Type", "Unknown")
@@ -913,12 +1726,9 @@ class EmbyMediaTypeSensor(EmbySensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 attrs = {
@@ -945,6 +1755,8 @@ class EmbyMediaTypeSensor(EmbySensorBase):
 class EmbyMediaTitleSensor(EmbySensorBase):
     """Emby media title sensor - shows current playing media name."""
 
+    _fingerprint_keys = ("sessions",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -956,29 +1768,12 @@ class EmbyMediaTitleSensor(EmbySensorBase):
         self._attr_icon = ICON_PLAY
         self._device_filter = entry.data.get("device_id")
 
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
-
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
-        )
-
     @property
     def native_value(self) -> str:
         """Return the media title."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 media_name = now_playing.get("Name", "Unknown")
@@ -999,12 +1794,9 @@ class EmbyMediaTitleSensor(EmbySensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 play_state = session.get("PlayState", {})
@@ -1063,38 +1855,14 @@ class EmbyProgressPercentSensor(EmbyDeviceSensorBase):
         self._attr_native_unit_of_measurement = "%"
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._device_filter = device_id
-
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
-
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
-        )
+        self._extrapolate_position = True
 
     @property
     def native_value(self) -> int:
         """Return the progress percentage."""
-        sessions = self.coordinator.data.get("sessions", [])
-
-        for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
-            now_playing = session.get("NowPlayingItem")
-            if now_playing:
-                play_state = session.get("PlayState", {})
-                position_ticks = play_state.get("PositionTicks", 0)
-                runtime_ticks = now_playing.get("RunTimeTicks", 0)
-
-                if runtime_ticks > 0:
-                    return int((position_ticks / runtime_ticks) * 100)
+        playback = self.playback
+        if playback and playback.is_playing:
+            return playback.progress_percent()
 
         return 0
 
@@ -1102,6 +1870,8 @@ class EmbyProgressPercentSensor(EmbyDeviceSensorBase):
 class EmbyPlaybackPositionSensor(EmbySensorBase):
     """Emby playback position sensor - shows current playback position."""
 
+    _fingerprint_keys = ("sessions",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -1113,29 +1883,12 @@ class EmbyPlaybackPositionSensor(EmbySensorBase):
         self._attr_icon = ICON_PLAY
         self._device_filter = entry.data.get("device_id")
 
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
-
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
-        )
-
     @property
     def native_value(self) -> str:
         """Return the playback position."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 play_state = session.get("PlayState", {})
@@ -1157,12 +1910,9 @@ class EmbyPlaybackPositionSensor(EmbySensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 play_state = session.get("PlayState", {})
@@ -1200,118 +1950,86 @@ class EmbyPlaybackRemainingSensor(EmbyDeviceSensorBase):
         self._attr_name = f"Emby {device_name} 剩余时间"
         self._attr_icon = ICON_PLAY
         self._device_filter = device_id
-
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
-
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
-        )
+        self._extrapolate_position = True
 
     @property
     def native_value(self) -> str:
         """Return the remaining time."""
-        sessions = self.coordinator.data.get("sessions", [])
-
-        for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
-            now_playing = session.get("NowPlayingItem")
-            if now_playing:
-                play_state = session.get("PlayState", {})
-                position_ticks = play_state.get("PositionTicks", 0)
-                runtime_ticks = now_playing.get("RunTimeTicks", 0)
-
-                if runtime_ticks > 0 and position_ticks > 0:
-                    remaining_ticks = runtime_ticks - position_ticks
-                    remaining_seconds = int(remaining_ticks / 10000000)
-                    hours = remaining_seconds // 3600
-                    minutes = (remaining_seconds % 3600) // 60
-                    seconds = remaining_seconds % 60
-
-                    if hours > 0:
-                        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                    else:
-                        return f"{minutes:02d}:{seconds:02d}"
+        playback = self.playback
+        if playback and playback.is_playing:
+            remaining_seconds = playback.remaining_seconds()
+            if remaining_seconds is not None:
+                hours = remaining_seconds // 3600
+                minutes = (remaining_seconds % 3600) // 60
+                seconds = remaining_seconds % 60
+
+                if hours > 0:
+                    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+                else:
+                    return f"{minutes:02d}:{seconds:02d}"
 
         return "00:00"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        sessions = self.coordinator.data.get("sessions", [])
-
-        for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
-            now_playing = session.get("NowPlayingItem")
-            if now_playing:
-                play_state = session.get("PlayState", {})
-                position_ticks = play_state.get("PositionTicks", 0)
-                runtime_ticks = now_playing.get("RunTimeTicks", 0)
-
-                if runtime_ticks > 0 and position_ticks > 0:
-                    remaining_ticks = runtime_ticks - position_ticks
-                    remaining_seconds = int(remaining_ticks / 10000000)
-
-                    return {
-                        "remaining_seconds": remaining_seconds,
-                        "remaining_minutes": remaining_seconds // 60,
-                    }
+        playback = self.playback
+        if playback and playback.is_playing:
+            remaining_seconds = playback.remaining_seconds()
+            if remaining_seconds is not None:
+                return {
+                    "remaining_seconds": remaining_seconds,
+                    "remaining_minutes": remaining_seconds // 60,
+                }
 
         return {}
 
 
-class EmbySubtitleTrackSensor(EmbySensorBase):
+class EmbySubtitleTrackSensor(EmbyDeviceSensorBase):
     """Emby subtitle track sensor - shows current subtitle track."""
 
+    # Streams are fetched per playing item only while the sensor is enabled
+    _attr_entity_registry_enabled_default = False
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
         entry: ConfigEntry,
+        device_id: str,
+        device_name: str,
+        user_name: str = "",
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, SENSOR_TYPE_SUBTITLE_TRACK)
-        self._attr_name = "Emby 字幕轨道"
+        super().__init__(
+            coordinator,
+            entry,
+            f"{SENSOR_TYPE_SUBTITLE_TRACK}_{device_id}",
+            device_id,
+            device_name,
+            user_name,
+        )
+        self._attr_name = f"Emby {device_name} 字幕轨道"
         self._attr_icon = "mdi:subtitles"
-        self._device_filter = entry.data.get("device_id")
-
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
+        self._device_filter = device_id
+        self._fingerprint_keys = (f"device:{device_id}", "media_streams")
 
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
+    async def async_added_to_hass(self) -> None:
+        """Request MediaStreams for this sensor's device."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_track_media_streams(self._device_filter)
         )
 
     @property
     def native_value(self) -> str:
         """Return the current subtitle track."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 # Get media streams
-                media_streams = now_playing.get("MediaStreams", [])
+                media_streams = self.coordinator.media_streams_for(now_playing)
                 play_state = session.get("PlayState", {})
                 
                 # Get current subtitle index
@@ -1353,15 +2071,12 @@ class EmbySubtitleTrackSensor(EmbySensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
-                media_streams = now_playing.get("MediaStreams", [])
+                media_streams = self.coordinator.media_streams_for(now_playing)
                 play_state = session.get("PlayState", {})
                 subtitle_stream_index = play_state.get("SubtitleStreamIndex")
                 
@@ -1397,47 +2112,51 @@ class EmbySubtitleTrackSensor(EmbySensorBase):
         return {"status": "无活动播放"}
 
 
-class EmbyAudioTrackSensor(EmbySensorBase):
+class EmbyAudioTrackSensor(EmbyDeviceSensorBase):
     """Emby audio track sensor - shows current audio track."""
 
+    # Streams are fetched per playing item only while the sensor is enabled
+    _attr_entity_registry_enabled_default = False
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
         entry: ConfigEntry,
+        device_id: str,
+        device_name: str,
+        user_name: str = "",
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, SENSOR_TYPE_AUDIO_TRACK)
-        self._attr_name = "Emby 音频轨道"
+        super().__init__(
+            coordinator,
+            entry,
+            f"{SENSOR_TYPE_AUDIO_TRACK}_{device_id}",
+            device_id,
+            device_name,
+            user_name,
+        )
+        self._attr_name = f"Emby {device_name} 音频轨道"
         self._attr_icon = "mdi:volume-high"
-        self._device_filter = entry.data.get("device_id")
-
-    def _should_include_session(self, session: dict[str, Any]) -> bool:
-        """Check if session should be included based on device filter."""
-        if not self._device_filter or self._device_filter == "all":
-            return True
-
-        # Match both DeviceId (ReportedDeviceId) and InternalDeviceId
-        session_device_id = session.get("DeviceId")
-        session_internal_id = str(session.get("InternalDeviceId", ""))
+        self._device_filter = device_id
+        self._fingerprint_keys = (f"device:{device_id}", "media_streams")
 
-        return (
-            session_device_id == self._device_filter or
-            session_internal_id == self._device_filter
+    async def async_added_to_hass(self) -> None:
+        """Request MediaStreams for this sensor's device."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_track_media_streams(self._device_filter)
         )
 
     @property
     def native_value(self) -> str:
         """Return the current audio track."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
                 # Get media streams
-                media_streams = now_playing.get("MediaStreams", [])
+                media_streams = self.coordinator.media_streams_for(now_playing)
                 play_state = session.get("PlayState", {})
                 
                 # Get current audio index
@@ -1489,15 +2208,12 @@ class EmbyAudioTrackSensor(EmbySensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        sessions = self.coordinator.data.get("sessions", [])
+        sessions = self.coordinator.sessions_for(self._device_filter)
 
         for session in sessions:
-            if not self._should_include_session(session):
-                continue
-
             now_playing = session.get("NowPlayingItem")
             if now_playing:
-                media_streams = now_playing.get("MediaStreams", [])
+                media_streams = self.coordinator.media_streams_for(now_playing)
                 play_state = session.get("PlayState", {})
                 audio_stream_index = play_state.get("AudioStreamIndex")
                 
@@ -1535,7 +2251,9 @@ class EmbyAudioTrackSensor(EmbySensorBase):
 
 
 class EmbyTodayPlayCountSensor(EmbySensorBase):
-    """Emby today play count sensor - shows playback count from activity log."""
+    """Emby today play count sensor - shows playback count from the history."""
+
+    _fingerprint_keys = ("playback_stats", "users")
 
     def __init__(
         self,
@@ -1550,69 +2268,45 @@ class EmbyTodayPlayCountSensor(EmbySensorBase):
 
     @property
     def native_value(self) -> int:
-        """Return today's play count from activity log."""
-        from datetime import datetime, timedelta
-        
-        activity_log = self.coordinator.data.get("activity_log", {})
-        items = activity_log.get("Items", [])
-        
-        # Get today's date
-        today = datetime.now().date()
-        play_count = 0
-        
-        # Count playback activities from today
-        for item in items:
-            # Check if it's a playback activity
-            item_type = item.get("Type", "")
-            if "Playback" in item_type or item_type == "PlaybackStart":
-                # Parse date
-                date_str = item.get("Date", "")
-                if date_str:
-                    try:
-                        item_date = datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
-                        if item_date == today:
-                            play_count += 1
-                    except (ValueError, AttributeError):
-                        pass
-        
-        return play_count
+        """Return today's play count from the playback history."""
+        return self.coordinator.playback_stats["count"]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        from datetime import datetime
-        
-        activity_log = self.coordinator.data.get("activity_log", {})
-        items = activity_log.get("Items", [])
-        today = datetime.now().date()
-        
-        today_playbacks = []
-        for item in items:
-            item_type = item.get("Type", "")
-            if "Playback" in item_type or item_type == "PlaybackStart":
-                date_str = item.get("Date", "")
-                if date_str:
-                    try:
-                        item_date = datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
-                        if item_date == today:
-                            today_playbacks.append({
-                                "name": item.get("Name", "Unknown"),
-                                "type": item.get("Type"),
-                                "user": item.get("UserName"),
-                                "date": date_str,
-                            })
-                    except (ValueError, AttributeError):
-                        pass
-        
+        stats = self.coordinator.playback_stats
+
+        today_playbacks = [
+            {
+                "name": entry["name"] or "Unknown",
+                "type": entry["type"],
+                "user": entry["user_name"]
+                or self.coordinator.user_name(entry["user_id"]),
+                "date": entry["date"],
+            }
+            for entry in stats["recent"]
+        ]
+        per_user = {
+            (
+                entry["user_name"]
+                or self.coordinator.user_name(entry["user_id"])
+                or entry["user_id"]
+                or "Unknown"
+            ): entry["count"]
+            for entry in stats["per_user"]
+        }
+
         return {
-            "playbacks": today_playbacks[:10],  # Limit to 10 most recent
-            "note": "基于活动日志统计，可能不完全准确",
+            "playbacks": today_playbacks,  # 10 most recent
+            "per_user": per_user,
         }
 
 
 class EmbyTodayWatchTimeSensor(EmbySensorBase):
     """Emby today watch time sensor - shows total watch time today."""
 
+    _fingerprint_keys = ("watch_time",)
+
     def __init__(
         self,
         coordinator: EmbyDataUpdateCoordinator,
@@ -1628,67 +2322,147 @@ class EmbyTodayWatchTimeSensor(EmbySensorBase):
     @property
     def native_value(self) -> int:
         """Return today's watch time in minutes."""
-        # Note: This is a simplified implementation
-        # True watch time tracking would require storing session data
-        # Currently showing estimated time based on activity log
-        
-        from datetime import datetime
-        
-        activity_log = self.coordinator.data.get("activity_log", {})
-        items = activity_log.get("Items", [])
-        today = datetime.now().date()
-        
-        # Count playback activities and estimate watch time
-        playback_count = 0
-        for item in items:
-            item_type = item.get("Type", "")
-            if "Playback" in item_type or item_type == "PlaybackStart":
-                date_str = item.get("Date", "")
-                if date_str:
-                    try:
-                        item_date = datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
-                        if item_date == today:
-                            playback_count += 1
-                    except (ValueError, AttributeError):
-                        pass
-        
-        # Rough estimate: assume average 30 minutes per playback
-        # This is not accurate - real implementation would need session tracking
-        estimated_minutes = playback_count * 30
-        
-        return estimated_minutes
+        # Accumulated from session position advances, see WatchTimeTracker
+        return int(self.coordinator.watch_time.total // 60)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        from datetime import datetime
-        
-        activity_log = self.coordinator.data.get("activity_log", {})
-        items = activity_log.get("Items", [])
-        today = datetime.now().date()
-        
-        playback_count = 0
-        for item in items:
-            item_type = item.get("Type", "")
-            if "Playback" in item_type or item_type == "PlaybackStart":
-                date_str = item.get("Date", "")
-                if date_str:
-                    try:
-                        item_date = datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
-                        if item_date == today:
-                            playback_count += 1
-                    except (ValueError, AttributeError):
-                        pass
-        
-        estimated_minutes = playback_count * 30
-        hours = estimated_minutes // 60
-        minutes = estimated_minutes % 60
-        
+        watch_time = self.coordinator.watch_time
+        total_minutes = int(watch_time.total // 60)
+        hours = total_minutes // 60
+        minutes = total_minutes % 60
+
+        def as_minutes(totals: dict[str, float]) -> dict[str, int]:
+            return {
+                name: int(seconds // 60)
+                for name, seconds in sorted(
+                    totals.items(), key=lambda item: item[1], reverse=True
+                )
+            }
+
         return {
-            "playback_count": playback_count,
-            "estimated_hours": hours,
-            "estimated_minutes": minutes,
+            "hours": hours,
+            "minutes": minutes,
             "formatted_time": f"{hours}小时{minutes}分钟",
-            "note": "基于播放次数估算（平均30分钟/次），非实际观看时长",
-            "warning": "需要实现会话跟踪才能获得准确的观看时长",
+            "per_user": as_minutes(watch_time.users),
+            "per_device": as_minutes(watch_time.devices),
+            "per_item": dict(list(as_minutes(watch_time.items).items())[:10]),
+        }
+
+
+class EmbyDiagnosticSensorBase(EmbySensorBase):
+    """Base class for request diagnostic sensors."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _fingerprint_keys = ("request_stats",)
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the server is down, when it matters most."""
+        return True
+
+    def _endpoint_summaries(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of every endpoint requested so far."""
+        return {
+            endpoint: stats.as_dict()
+            for endpoint, stats in sorted(self.coordinator.client.endpoint_stats.items())
+        }
+
+
+class EmbyRefreshLatencySensor(EmbyDiagnosticSensorBase):
+    """Emby refresh latency sensor - a percentile of recent refresh durations."""
+
+    def __init__(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        entry: ConfigEntry,
+        percentile: int,
+    ) -> None:
+        """Initialize the sensor."""
+        sensor_type = (
+            SENSOR_TYPE_REFRESH_LATENCY_P50
+            if percentile == 50
+            else SENSOR_TYPE_REFRESH_LATENCY_P95
+        )
+        super().__init__(coordinator, entry, sensor_type)
+        self._percentile = percentile
+        self._attr_name = f"Emby 刷新延迟 P{percentile}"
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the refresh latency percentile in milliseconds."""
+        value = self.coordinator.client.refresh_latency.percentile(self._percentile)
+        return round(value) if value is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        latency = self.coordinator.client.refresh_latency
+        return {
+            "refreshes": latency.count,
+            "histogram": latency.histogram(),
+        }
+
+
+class EmbySlowestEndpointSensor(EmbyDiagnosticSensorBase):
+    """Emby slowest endpoint sensor - endpoint with the highest p95 latency."""
+
+    def __init__(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, SENSOR_TYPE_SLOWEST_ENDPOINT)
+        self._attr_name = "Emby 最慢接口"
+        self._attr_icon = "mdi:speedometer-slow"
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the slowest endpoint."""
+        slowest = self.coordinator.client.slowest_endpoint()
+        return slowest[0] if slowest else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        slowest = self.coordinator.client.slowest_endpoint()
+        return {
+            "p95_ms": round(slowest[1], 1) if slowest else None,
+            "endpoints": self._endpoint_summaries(),
+        }
+
+
+class EmbyRequestFailuresSensor(EmbyDiagnosticSensorBase):
+    """Emby request failures sensor - failed requests since startup."""
+
+    def __init__(
+        self,
+        coordinator: EmbyDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, SENSOR_TYPE_REQUEST_FAILURES)
+        self._attr_name = "Emby 请求失败次数"
+        self._attr_icon = "mdi:alert-circle-outline"
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of failed requests."""
+        return sum(
+            stats.failures for stats in self.coordinator.client.endpoint_stats.values()
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        return {
+            endpoint: {"failures": stats.failures, "statuses": dict(stats.statuses)}
+            for endpoint, stats in sorted(self.coordinator.client.endpoint_stats.items())
         }
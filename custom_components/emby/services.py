@@ -0,0 +1,93 @@
+"""Services for the Emby integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .api import EmbyAPIError
+from .const import DOMAIN, SEARCH_ITEM_TYPES, SEARCH_MAX_RESULTS, SERVICE_SEARCH
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_QUERY = "query"
+ATTR_LIMIT = "limit"
+ATTR_MEDIA_TYPE = "media_type"
+
+SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_QUERY): cv.string,
+        vol.Optional(ATTR_LIMIT, default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=SEARCH_MAX_RESULTS)
+        ),
+        vol.Optional(ATTR_MEDIA_TYPE): vol.In(SEARCH_ITEM_TYPES.split(",")),
+    }
+)
+
+
+async def _async_search(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Search the libraries of every configured server.
+
+    Servers with a ready local index answer from it; the others are
+    searched with /Items?SearchTerm=.
+    """
+    query = call.data[ATTR_QUERY]
+    limit = call.data[ATTR_LIMIT]
+    media_type = call.data.get(ATTR_MEDIA_TYPE)
+
+    items: list[dict[str, Any]] = []
+    for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
+        index = entry_data.get("search_index")
+        if index is not None and index.ready:
+            matches = index.search(query, limit, media_type)
+        else:
+            try:
+                found = await entry_data["client"].search_items(query, limit, media_type)
+            except EmbyAPIError as err:
+                raise HomeAssistantError(f"Emby search failed: {err}") from err
+            matches = [
+                {
+                    "id": item["Id"],
+                    "name": item.get("Name"),
+                    "type": item.get("Type"),
+                    "year": item.get("ProductionYear"),
+                    "series_name": item.get("SeriesName"),
+                }
+                for item in found
+            ]
+        items.extend({**match, "config_entry_id": entry_id} for match in matches)
+
+    return {"items": items[:limit]}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_SEARCH):
+        return
+
+    async def async_search(call: ServiceCall) -> ServiceResponse:
+        return await _async_search(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH,
+        async_search,
+        schema=SEARCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services when the last entry is unloaded."""
+    if not hass.data.get(DOMAIN):
+        hass.services.async_remove(DOMAIN, SERVICE_SEARCH)
@@ -0,0 +1,95 @@
+"""Request statistics for the Emby integration."""
+from __future__ import annotations
+
+import bisect
+import math
+from collections import Counter, deque
+from typing import Any
+
+from .const import LATENCY_BUCKETS, LATENCY_SAMPLES
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    """Return the nearest-rank percentile of samples, None if empty."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class LatencyRecorder:
+    """Latency histogram plus a window of recent samples (milliseconds).
+
+    The cumulative histogram uses the fixed LATENCY_BUCKETS bounds; the
+    percentiles come from the last LATENCY_SAMPLES samples so they follow
+    the current server behaviour.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the recorder."""
+        # One count per bucket bound, plus one for slower samples
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.recent: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """Add a sample."""
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, latency_ms)] += 1
+        self.recent.append(latency_ms)
+        self.count += 1
+        self.total += latency_ms
+
+    def percentile(self, pct: float) -> float | None:
+        """Return a percentile of the recent samples."""
+        return percentile(list(self.recent), pct)
+
+    def histogram(self) -> dict[str, int]:
+        """Return the bucket counts keyed by their upper bound."""
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}"]
+        return dict(zip(labels, self.buckets))
+
+
+class EndpointStats:
+    """Latency, size, status and failure counters of one endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.latency = LatencyRecorder()
+        self.bytes = 0
+        self.latest_size = 0
+        self.failures = 0
+        self.decode_ms = 0.0
+        self.statuses: Counter[int] = Counter()
+
+    def record(
+        self,
+        latency_ms: float,
+        status: int | None,
+        size: int,
+        failed: bool,
+    ) -> None:
+        """Add the outcome of one request."""
+        self.latency.record(latency_ms)
+        self.bytes += size
+        self.latest_size = size
+        if status is not None:
+            self.statuses[status] += 1
+        if failed:
+            self.failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the counters."""
+        p50 = self.latency.percentile(50)
+        p95 = self.latency.percentile(95)
+        return {
+            "requests": self.latency.count,
+            "failures": self.failures,
+            "bytes": self.bytes,
+            "decode_ms": round(self.decode_ms, 1),
+            "p50_ms": round(p50, 1) if p50 is not None else None,
+            "p95_ms": round(p95, 1) if p95 is not None else None,
+            "statuses": dict(self.statuses),
+            "histogram": self.latency.histogram(),
+        }
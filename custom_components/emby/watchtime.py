@@ -0,0 +1,146 @@
+"""Watch time accounting for the Emby integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    STORAGE_KEY_WATCH_TIME,
+    STORAGE_VERSION,
+    TICKS_PER_SECOND,
+    WATCH_TIME_SAVE_DELAY,
+    WATCH_TIME_SEEK_TOLERANCE,
+)
+from .playback import PlaybackSnapshot
+
+
+class WatchTimeTracker:
+    """Accumulate today's watch time from session position deltas.
+
+    Each session update is compared with the previous sample of the same
+    session: the PositionTicks advance on the same item is counted, as
+    long as it is not larger than the wall time between the samples (plus
+    WATCH_TIME_SEEK_TOLERANCE). Paused sessions do not advance and seeks
+    are dropped, so only time actually played is counted. Totals roll over
+    at local midnight and are persisted across restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the tracker."""
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_WATCH_TIME.format(entry_id=entry_id)
+        )
+        # Set while a delayed save has not been written yet
+        self._save_pending = False
+        # Session id -> (item id, position ticks, monotonic sample time)
+        self._last: dict[str, tuple[str | None, int, float]] = {}
+        self.day = dt_util.now().date().isoformat()
+        self.total = 0.0
+        self.users: dict[str, float] = {}
+        self.devices: dict[str, float] = {}
+        self.items: dict[str, float] = {}
+
+    async def async_load(self) -> None:
+        """Restore today's totals from storage."""
+        stored = await self._store.async_load()
+        if not stored or stored.get("day") != self.day:
+            return
+        self.total = stored.get("total", 0.0)
+        self.users = stored.get("users", {})
+        self.devices = stored.get("devices", {})
+        self.items = stored.get("items", {})
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save after WATCH_TIME_SAVE_DELAY, batching frequent changes.
+
+        A pending save writes the state current when it runs, so it is
+        not pushed back by later changes.
+        """
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, WATCH_TIME_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now, before the entry is unloaded."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the totals to persist."""
+        self._save_pending = False
+        return {
+            "day": self.day,
+            "total": self.total,
+            "users": self.users,
+            "devices": self.devices,
+            "items": self.items,
+        }
+
+    @callback
+    def async_rollover(self) -> bool:
+        """Reset the totals if the local day changed.
+
+        Returns:
+            True if the totals were reset
+        """
+        today = dt_util.now().date().isoformat()
+        if today == self.day:
+            return False
+        self.day = today
+        self.total = 0.0
+        self.users = {}
+        self.devices = {}
+        self.items = {}
+        self._async_schedule_save()
+        return True
+
+    @callback
+    def async_update(self, snapshots: Iterable[PlaybackSnapshot]) -> bool:
+        """Count the playback progress since the previous session sample.
+
+        Runs in O(sessions): only the previous sample of each current
+        session is kept.
+
+        Returns:
+            True if any watch time was added
+        """
+        self.async_rollover()
+
+        last = self._last
+        self._last = {}
+        added = 0.0
+        for snapshot in snapshots:
+            if not snapshot.is_playing or snapshot.session_id is None:
+                continue
+            self._last[snapshot.session_id] = (
+                snapshot.item_id,
+                snapshot.position_ticks,
+                snapshot.sampled_at,
+            )
+
+            previous = last.get(snapshot.session_id)
+            if previous is None or previous[0] != snapshot.item_id:
+                continue
+            advanced = (snapshot.position_ticks - previous[1]) / TICKS_PER_SECOND
+            elapsed = snapshot.sampled_at - previous[2]
+            # Backwards means a seek back; more than the wall time a seek forward
+            if advanced <= 0 or advanced > elapsed + WATCH_TIME_SEEK_TOLERANCE:
+                continue
+
+            user = snapshot.user_name or snapshot.user_id or "Unknown"
+            device = snapshot.device_name or snapshot.device_id or "Unknown"
+            self.total += advanced
+            self.users[user] = self.users.get(user, 0.0) + advanced
+            self.devices[device] = self.devices.get(device, 0.0) + advanced
+            self.items[snapshot.title] = self.items.get(snapshot.title, 0.0) + advanced
+            added += advanced
+
+        if added:
+            self._async_schedule_save()
+        return bool(added)
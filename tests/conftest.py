@@ -0,0 +1,80 @@
+"""Fixtures for the Emby integration tests.
+
+The tests run the integration against benchmarks/fake_emby.py, a local
+aiohttp stand-in for an Emby server. Async tests run on asyncio through
+the anyio pytest plugin.
+"""
+from __future__ import annotations
+
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from fake_emby import API_KEY, FakeEmbyServer  # noqa: E402
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.emby.api import EmbyAPIClient  # noqa: E402
+from custom_components.emby.const import DOMAIN  # noqa: E402
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests on asyncio, like Home Assistant."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def emby_server() -> AsyncIterator[FakeEmbyServer]:
+    """Serve a small synthetic Emby server on a free local port."""
+    server = FakeEmbyServer(sessions=4, devices=4, activity_entries=50, library_items=50)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def client(emby_server: FakeEmbyServer) -> AsyncIterator[EmbyAPIClient]:
+    """Return an API client connected to the fake server."""
+    async with aiohttp.ClientSession() as session:
+        client = EmbyAPIClient(
+            host="127.0.0.1", port=emby_server.port, api_key=API_KEY, session=session
+        )
+        yield client
+        await client.close()
+
+
+@pytest.fixture
+async def hass(tmp_path: Path) -> AsyncIterator[HomeAssistant]:
+    """Return a Home Assistant instance with a temporary config directory."""
+    (tmp_path / ".storage").mkdir()
+    hass = HomeAssistant(str(tmp_path))
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, client: EmbyAPIClient, emby_server: FakeEmbyServer
+) -> AsyncIterator[EmbyDataUpdateCoordinator]:
+    """Return a coordinator that completed its first refresh."""
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Fake Emby",
+        data={"host": "127.0.0.1", "port": emby_server.port, "api_key": API_KEY},
+        source="user",
+        options={},
+    )
+    coordinator = EmbyDataUpdateCoordinator(hass, client, entry)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    yield coordinator
+    await coordinator.async_close()
@@ -0,0 +1,108 @@
+"""Tests for the artwork cache."""
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby import artwork
+from custom_components.emby.api import EmbyAPIClient
+from custom_components.emby.artwork import CONTENT_TYPE, ArtworkCache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def cache(hass: HomeAssistant, client: EmbyAPIClient, tmp_path: Path) -> ArtworkCache:
+    """Return an empty artwork cache."""
+    return ArtworkCache(hass, client, str(tmp_path / "artwork"))
+
+
+def _item(emby_server: FakeEmbyServer) -> dict[str, Any]:
+    """Return an item of the fake server that has an image."""
+    return next(iter(emby_server.items.values()))
+
+
+def _hits(emby_server: FakeEmbyServer) -> int:
+    return sum(count for path, count in emby_server.hits.items() if "/Images/" in path)
+
+
+async def test_tagged_images_are_served_from_memory_and_disk(
+    hass: HomeAssistant,
+    emby_server: FakeEmbyServer,
+    client: EmbyAPIClient,
+    cache: ArtworkCache,
+) -> None:
+    """A tagged image is downloaded once, then read from memory or, after a restart, disk."""
+    item = _item(emby_server)
+    tag = item["ImageTags"]["Primary"]
+
+    content, content_type = await cache.async_get_image(item["Id"], "Primary", tag)
+    assert content_type == CONTENT_TYPE
+    assert content.startswith(b"\xff\xd8")
+    assert await cache.async_get_image(item["Id"], "Primary", tag) == (content, CONTENT_TYPE)
+
+    restarted = ArtworkCache(hass, client, cache.path)
+    assert await restarted.async_get_image(item["Id"], "Primary", tag) == (
+        content,
+        CONTENT_TYPE,
+    )
+    assert _hits(emby_server) == 1
+    assert cache.stats()["memory_hits"] == 1
+    assert restarted.stats()["disk_hits"] == 1
+
+
+async def test_concurrent_requests_share_a_download(
+    emby_server: FakeEmbyServer, cache: ArtworkCache
+) -> None:
+    """Requests for an image being downloaded wait for that download."""
+    item = _item(emby_server)
+    results = await asyncio.gather(
+        *(cache.async_get_image(item["Id"]) for _ in range(5))
+    )
+    assert len(set(results)) == 1
+    assert _hits(emby_server) == 1
+
+
+async def test_untagged_images_are_revalidated(
+    emby_server: FakeEmbyServer,
+    cache: ArtworkCache,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Untagged images are kept in memory only and revalidated once stale."""
+    emby_server.etags = True
+    item = _item(emby_server)
+    content, _ = await cache.async_get_image(item["Id"])
+
+    monkeypatch.setattr(artwork, "ARTWORK_REVALIDATE", 0)
+    assert await cache.async_get_image(item["Id"]) == (content, CONTENT_TYPE)
+    assert emby_server.not_modified == 1
+    assert cache.stats()["revalidated"] == 1
+    assert not os.path.exists(cache.path)
+
+
+@pytest.mark.parametrize(
+    ("item_id", "image_type", "tag"),
+    [
+        ("../../secrets", "Primary", "abc"),
+        ("100000", "Primary", "../abc"),
+        ("100000", "Primary/..", None),
+        ("", "Primary", None),
+    ],
+)
+async def test_unsafe_ids_are_refused(
+    emby_server: FakeEmbyServer,
+    cache: ArtworkCache,
+    item_id: str,
+    image_type: str,
+    tag: str | None,
+) -> None:
+    """Ids that are not plain alphanumerics are neither requested nor stored."""
+    assert await cache.async_get_image(item_id, image_type, tag) == (None, None)
+    assert _hits(emby_server) == 0
+    assert not os.path.exists(cache.path)
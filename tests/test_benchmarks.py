@@ -0,0 +1,104 @@
+"""Tests for the fake Emby server and the benchmark runner."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import aiohttp
+import pytest
+
+import run
+from fake_emby import API_KEY, TICKS_PER_SECOND, FakeEmbyServer
+
+pytestmark = pytest.mark.anyio
+
+
+async def _get(
+    emby_server: FakeEmbyServer,
+    path: str,
+    headers: dict[str, str] | None = None,
+) -> tuple[int, Mapping[str, str]]:
+    """Request a path of the fake server, returning the status and headers."""
+    async with aiohttp.ClientSession() as session, session.get(
+        f"http://127.0.0.1:{emby_server.port}{path}",
+        headers={"X-Emby-Token": API_KEY, **(headers or {})},
+    ) as response:
+        await response.read()
+        return response.status, response.headers
+
+
+async def test_api_key_is_checked(emby_server: FakeEmbyServer) -> None:
+    """Requests without the API key are rejected, except the public info."""
+    assert (await _get(emby_server, "/Sessions"))[0] == 200
+    assert (await _get(emby_server, "/Sessions", {"X-Emby-Token": "wrong"}))[0] == 401
+    assert (
+        await _get(emby_server, "/System/Info/Public", {"X-Emby-Token": ""})
+    )[0] == 200
+    assert emby_server.hits["/Sessions"] == 2
+
+
+async def test_injected_failures(emby_server: FakeEmbyServer) -> None:
+    """Failing endpoints answer 500 while the others keep working."""
+    emby_server.fail_endpoints.add("/Devices")
+    assert (await _get(emby_server, "/Devices"))[0] == 500
+    assert (await _get(emby_server, "/Users"))[0] == 200
+
+
+async def test_etags(emby_server: FakeEmbyServer) -> None:
+    """With ETags on, an unchanged body is answered with 304."""
+    emby_server.etags = True
+    status, headers = await _get(emby_server, "/Sessions")
+    assert status == 200
+    etag = headers["ETag"]
+
+    assert (await _get(emby_server, "/Sessions", {"If-None-Match": etag}))[0] == 304
+    assert emby_server.not_modified == 1
+
+    emby_server.advance(10)
+    assert (await _get(emby_server, "/Sessions", {"If-None-Match": etag}))[0] == 200
+
+
+def test_advance_moves_unpaused_playback() -> None:
+    """The fake clock moves the position of playing sessions only."""
+    server = FakeEmbyServer(sessions=20)
+    playing = [session for session in server.sessions if "NowPlayingItem" in session]
+    before = [session["PlayState"]["PositionTicks"] for session in playing]
+    server.advance(5)
+
+    moved = [
+        session["PlayState"]["PositionTicks"] - position
+        for session, position in zip(playing, before)
+    ]
+    for session, position, delta in zip(playing, before, moved):
+        if session["PlayState"]["IsPaused"]:
+            assert delta == 0
+        else:
+            runtime = session["NowPlayingItem"]["RunTimeTicks"]
+            assert delta == min(5 * TICKS_PER_SECOND, runtime - position)
+    assert any(moved)
+
+
+def test_same_seed_same_data() -> None:
+    """The synthetic data is reproducible from its seed."""
+    assert FakeEmbyServer(seed=3).sessions == FakeEmbyServer(seed=3).sessions
+
+
+def test_compare() -> None:
+    """Durations regress when they grow and throughputs when they shrink."""
+    baseline = {"results": {"a": {"p50_ms": 10.0, "ops_per_s": 100.0, "bytes": 10}}}
+    same = {"results": {"a": {"p50_ms": 11.0, "ops_per_s": 90.0, "bytes": 99}}}
+    worse = {"results": {"a": {"p50_ms": 20.0, "ops_per_s": 50.0, "bytes": 10}}}
+
+    assert run.compare(same, baseline, 0.25) == []
+    regressions = run.compare(worse, baseline, 0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("a.p50_ms")
+    assert regressions[1].startswith("a.ops_per_s")
+
+
+async def test_scenarios_run() -> None:
+    """Quick scenarios produce the numbers the report is built from."""
+    coalescing = await run.bench_coalescing(5)
+    assert coalescing == {"callers": 5, "server_requests": 1, "coalesced": 4}
+
+    projection = await run.bench_projection()
+    assert projection["full_bytes"] > projection["projected_bytes"]
@@ -0,0 +1,108 @@
+"""Tests for the circuit breaker of the API client."""
+from __future__ import annotations
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby import api
+from custom_components.emby.api import (
+    EmbyAPIClient,
+    EmbyCircuitOpenError,
+    EmbyConnectionError,
+)
+from custom_components.emby.const import (
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+)
+
+from .common import wait_for
+
+pytestmark = pytest.mark.anyio
+
+
+async def _open_breaker(emby_server: FakeEmbyServer, client: EmbyAPIClient) -> None:
+    """Fail /Sessions until the breaker opens."""
+    emby_server.fail_endpoints.add("/Sessions")
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(EmbyConnectionError):
+            await client.get_sessions()
+    assert client.breaker_state == BREAKER_OPEN
+
+
+async def test_open_breaker_short_circuits_requests(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Requests are not sent while the breaker is open."""
+    await _open_breaker(emby_server, client)
+    hits = sum(emby_server.hits.values())
+
+    with pytest.raises(EmbyCircuitOpenError):
+        await client.get_sessions()
+    with pytest.raises(EmbyCircuitOpenError):
+        await client.get_scheduled_tasks()
+
+    assert sum(emby_server.hits.values()) == hits
+    assert client.breaker_retry_at is not None
+
+
+async def test_fresh_cached_responses_served_while_open(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Cached responses do not need the server and are still returned."""
+    devices = await client.get_devices()
+    await _open_breaker(emby_server, client)
+
+    assert await client.get_devices() is devices
+    assert emby_server.hits["/Devices"] == 1
+
+
+async def test_probe_closes_breaker(
+    emby_server: FakeEmbyServer,
+    client: EmbyAPIClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Failed probes keep the breaker open; the first answer closes it."""
+    monkeypatch.setattr(api, "BREAKER_BACKOFF_MIN", 0.05)
+    states: list[str] = []
+    client.set_breaker_listener(states.append)
+
+    emby_server.fail_endpoints.add("/System/Info/Public")
+    await _open_breaker(emby_server, client)
+    await wait_for(lambda: emby_server.hits["/System/Info/Public"] >= 2)
+    assert client.breaker_state != BREAKER_CLOSED
+
+    emby_server.fail_endpoints.clear()
+    await wait_for(lambda: client.breaker_state == BREAKER_CLOSED)
+    assert states[0] == BREAKER_OPEN
+    assert states[-1] == BREAKER_CLOSED
+    assert client.consecutive_failures == 0
+    assert await client.get_sessions()
+
+
+async def test_unexpected_probe_error_keeps_probing(
+    emby_server: FakeEmbyServer,
+    client: EmbyAPIClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A probe that raises an unexpected error reopens the breaker."""
+    monkeypatch.setattr(api, "BREAKER_BACKOFF_MIN", 0.05)
+    states: list[str] = []
+    client.set_breaker_listener(states.append)
+    await _open_breaker(emby_server, client)
+
+    probes = 0
+
+    async def broken_send(*args, **kwargs):
+        nonlocal probes
+        probes += 1
+        raise RuntimeError("probe broke")
+
+    monkeypatch.setattr(client, "_send", broken_send)
+    await wait_for(lambda: probes >= 2)
+    assert states[:4] == [BREAKER_OPEN, BREAKER_HALF_OPEN, BREAKER_OPEN, BREAKER_HALF_OPEN]
+
+    monkeypatch.delattr(client, "_send")
+    emby_server.fail_endpoints.clear()
+    await wait_for(lambda: client.breaker_state == BREAKER_CLOSED)
@@ -0,0 +1,108 @@
+"""Tests for the paginated library browser."""
+from __future__ import annotations
+
+import pytest
+from homeassistant.components.media_player import MediaClass
+from homeassistant.components.media_player.errors import BrowseError
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.api import EmbyAPIClient
+from custom_components.emby.browse import ROOT_ID, LibraryBrowser
+from custom_components.emby.const import BROWSE_PAGE_SIZE
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+pytestmark = pytest.mark.anyio
+
+USER_ID = "user"
+# A library of the fake server with more children than one page
+MOVIES = "0"
+
+
+def _thumbnail(item_id: str, tag: str) -> str:
+    """Return a thumbnail URL for a browse node."""
+    return f"/thumb/{item_id}/{tag}"
+
+
+async def test_root_lists_libraries(client: EmbyAPIClient) -> None:
+    """The root node lists the libraries without fetching their children."""
+    browser = LibraryBrowser(client)
+    root = await browser.async_browse(USER_ID, None, _thumbnail)
+
+    assert root.media_content_id == ROOT_ID
+    assert [child.title for child in root.children] == ["Movies", "TV", "Music"]
+    assert browser.stats()["page_misses"] == 0
+
+
+async def test_folders_are_paged(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """A folder shows one page of children and a node for the next page."""
+    browser = LibraryBrowser(client)
+    await browser.async_browse(USER_ID, ROOT_ID, _thumbnail)
+
+    first = await browser.async_browse(USER_ID, MOVIES, _thumbnail)
+    assert first.title == "Movies"
+    assert len(first.children) == BROWSE_PAGE_SIZE + 1
+    assert first.children_media_class == MediaClass.MOVIE
+    assert first.children[0].thumbnail.startswith("/thumb/")
+    next_page = first.children[-1]
+    assert next_page.media_content_id == f"{MOVIES}:{BROWSE_PAGE_SIZE}"
+    assert next_page.can_expand
+
+    second = await browser.async_browse(USER_ID, next_page.media_content_id, _thumbnail)
+    assert second.media_content_id == next_page.media_content_id
+    assert second.title.startswith("Movies（")
+    # The fake library holds two pages, so the last one has no next page node
+    assert len(second.children) == BROWSE_PAGE_SIZE
+    assert emby_server.hits["/Users/user/Items"] == 2
+
+
+async def test_pages_are_cached(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Opening a folder again reuses its page until invalidated."""
+    browser = LibraryBrowser(client)
+    await browser.async_browse(USER_ID, MOVIES, _thumbnail)
+    await browser.async_browse(USER_ID, MOVIES, _thumbnail)
+    assert emby_server.hits["/Users/user/Items"] == 1
+    assert browser.stats() == {"pages": 1, "page_hits": 1, "page_misses": 1}
+
+    browser.invalidate()
+    await browser.async_browse(USER_ID, MOVIES, _thumbnail)
+    assert emby_server.hits["/Users/user/Items"] == 2
+
+
+async def test_errors(emby_server: FakeEmbyServer, client: EmbyAPIClient) -> None:
+    """Bad content ids, a missing user and API errors raise BrowseError."""
+    browser = LibraryBrowser(client)
+    with pytest.raises(BrowseError):
+        await browser.async_browse(USER_ID, f"{MOVIES}:next", _thumbnail)
+    with pytest.raises(BrowseError):
+        await browser.async_browse(None, MOVIES, _thumbnail)
+
+    emby_server.fail_endpoints.add("/Users/user/Items")
+    with pytest.raises(BrowseError):
+        await browser.async_browse(USER_ID, MOVIES, _thumbnail)
+
+
+async def test_library_changes_drop_pages(
+    coordinator: EmbyDataUpdateCoordinator,
+) -> None:
+    """Changed library counts invalidate the cached pages."""
+    await coordinator.library.async_browse(USER_ID, MOVIES, _thumbnail)
+    assert coordinator.library.stats()["pages"] == 1
+
+    # Unchanged counts keep the pages
+    coordinator._section_fetched.clear()
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+    assert coordinator.library.stats()["pages"] == 1
+
+    # As if the previous poll had seen fewer movies
+    counts = {**coordinator.data["items_counts"], "MovieCount": 0}
+    coordinator.data["items_counts"] = counts
+    coordinator.fingerprints["items_counts"] = coordinator._fingerprint(counts)
+    coordinator._section_fetched.clear()
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+    assert coordinator.library.stats()["pages"] == 0
@@ -0,0 +1,71 @@
+"""Tests for the TTL response cache of the API client."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby import api
+from custom_components.emby.api import EmbyAPIClient
+from custom_components.emby.const import API_ENDPOINT_DEVICES, API_ENDPOINT_USERS
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_slow_changing_endpoints_are_cached(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Endpoints with a TTL are answered from the cache until it expires."""
+    devices = await client.get_devices()
+    assert await client.get_devices() is devices
+    assert emby_server.hits["/Devices"] == 1
+    assert (client.cache_hits, client.cache_misses) == (1, 1)
+
+
+async def test_fast_changing_endpoints_are_not_cached(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Sessions have no TTL and are requested every time."""
+    await client.get_sessions()
+    await client.get_sessions()
+    assert emby_server.hits["/Sessions"] == 2
+    assert client.cache_hits == 0
+
+
+async def test_expired_entries_are_refetched(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """A response older than its TTL is requested again."""
+    await client.get_devices()
+    # Age the entry past its TTL
+    for key, (_, value) in list(client._cache.items()):
+        client._cache[key] = (time.monotonic() - 1, value)
+    await client.get_devices()
+    assert emby_server.hits["/Devices"] == 2
+
+
+async def test_invalidate(emby_server: FakeEmbyServer, client: EmbyAPIClient) -> None:
+    """Invalidating one endpoint keeps the cached responses of the others."""
+    await client.get_devices()
+    await client.get_users()
+
+    client.invalidate(API_ENDPOINT_DEVICES)
+    await client.get_devices()
+    await client.get_users()
+    assert emby_server.hits["/Devices"] == 2
+    assert emby_server.hits[API_ENDPOINT_USERS] == 1
+
+    client.invalidate()
+    await client.get_users()
+    assert emby_server.hits[API_ENDPOINT_USERS] == 2
+
+
+async def test_cache_is_bounded(
+    client: EmbyAPIClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The least recently used responses are dropped beyond CACHE_MAX_ENTRIES."""
+    monkeypatch.setattr(api, "CACHE_MAX_ENTRIES", 1)
+    await client.get_devices()
+    await client.get_users()
+    assert client.cache_stats()["response_cache_entries"] == 1
@@ -0,0 +1,86 @@
+"""Tests for the adaptive session poll interval."""
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.const import (
+    ADAPTIVE_IDLE_HYSTERESIS,
+    DEFAULT_SCAN_INTERVAL_IDLE,
+    DEFAULT_SCAN_INTERVAL_PLAYING,
+)
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+pytestmark = pytest.mark.anyio
+
+
+async def _poll_sessions(coordinator: EmbyDataUpdateCoordinator) -> None:
+    """Poll the sessions right away."""
+    coordinator._section_fetched.pop("sessions", None)
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+
+
+def _stop_playback(emby_server: FakeEmbyServer) -> None:
+    for session in emby_server.sessions:
+        session.pop("NowPlayingItem", None)
+
+
+async def test_playback_polls_fast(coordinator: EmbyDataUpdateCoordinator) -> None:
+    """The fake server has playing sessions, so sessions are polled fast."""
+    assert coordinator.sessions_interval == DEFAULT_SCAN_INTERVAL_PLAYING
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL_PLAYING)
+
+
+async def test_slows_down_after_idle_samples(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """The idle interval applies only after several idle samples in a row."""
+    changes = coordinator.cadence_changes
+    _stop_playback(emby_server)
+    for _ in range(ADAPTIVE_IDLE_HYSTERESIS - 1):
+        await _poll_sessions(coordinator)
+        assert coordinator.sessions_interval == DEFAULT_SCAN_INTERVAL_PLAYING
+
+    await _poll_sessions(coordinator)
+    assert coordinator.sessions_interval == DEFAULT_SCAN_INTERVAL_IDLE
+    assert coordinator.cadence_changes == changes + 1
+
+
+async def test_speeds_up_on_the_first_playing_sample(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Playback switches back to the fast interval right away."""
+    playing = {
+        session["Id"]: session["NowPlayingItem"]
+        for session in emby_server.sessions
+        if "NowPlayingItem" in session
+    }
+    changes = coordinator.cadence_changes
+    _stop_playback(emby_server)
+    for _ in range(ADAPTIVE_IDLE_HYSTERESIS):
+        await _poll_sessions(coordinator)
+    assert coordinator.sessions_interval == DEFAULT_SCAN_INTERVAL_IDLE
+
+    for session in emby_server.sessions:
+        if session["Id"] in playing:
+            session["NowPlayingItem"] = playing[session["Id"]]
+    await _poll_sessions(coordinator)
+    assert coordinator.sessions_interval == DEFAULT_SCAN_INTERVAL_PLAYING
+    assert coordinator.cadence_changes == changes + 2
+
+
+async def test_only_due_sections_are_polled(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """A tick requests the sections whose own interval has elapsed."""
+    now = time.monotonic()
+    assert coordinator._due_sections(now) == []
+    assert coordinator._due_sections(now + DEFAULT_SCAN_INTERVAL_PLAYING) == ["sessions"]
+
+    devices = emby_server.hits["/Devices"]
+    await _poll_sessions(coordinator)
+    assert emby_server.hits["/Devices"] == devices
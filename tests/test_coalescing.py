@@ -0,0 +1,66 @@
+"""Tests for sharing identical in-flight GET requests."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.api import EmbyAPIClient, EmbyConnectionError
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_identical_requests_share_one_round_trip(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Concurrent identical GETs send one request and get the same result."""
+    emby_server.latency = 0.05
+    results = await asyncio.gather(*(client.get_sessions() for _ in range(5)))
+
+    assert emby_server.hits["/Sessions"] == 1
+    assert all(result is results[0] for result in results)
+    assert client.coalesced_requests == 4
+
+
+async def test_different_params_are_not_shared(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Requests with different parameters are sent separately."""
+    emby_server.latency = 0.05
+    await asyncio.gather(client.get_activity_log(5), client.get_activity_log(10))
+
+    assert emby_server.hits["/System/ActivityLog/Entries"] == 2
+    assert client.coalesced_requests == 0
+
+
+async def test_errors_reach_every_waiter(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """A failed shared request raises for each caller, and the next is sent anew."""
+    emby_server.latency = 0.05
+    emby_server.fail_endpoints.add("/Sessions")
+    results = await asyncio.gather(
+        *(client.get_sessions() for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, EmbyConnectionError) for result in results)
+    assert emby_server.hits["/Sessions"] == 1
+
+    emby_server.fail_endpoints.clear()
+    assert await client.get_sessions()
+    assert emby_server.hits["/Sessions"] == 2
+
+
+async def test_cancelled_caller_does_not_cancel_the_others(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """One caller giving up leaves the shared request running for the rest."""
+    emby_server.latency = 0.05
+    first = asyncio.ensure_future(client.get_sessions())
+    second = asyncio.ensure_future(client.get_sessions())
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second
+    assert first.cancelled()
+    assert emby_server.hits["/Sessions"] == 1
@@ -0,0 +1,155 @@
+"""Tests for remote control commands and their optimistic state."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from homeassistant.components.media_player import (
+    MediaPlayerEntityFeature,
+    MediaPlayerState,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.media_player import EmbyMediaPlayer
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+from .common import wait_for
+
+pytestmark = pytest.mark.anyio
+
+
+def _session(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> dict[str, Any]:
+    """Return a session of the fake server that plays and is monitored."""
+    return next(
+        session
+        for session in emby_server.sessions
+        if "NowPlayingItem" in session
+        and not session["PlayState"]["IsPaused"]
+        and coordinator.get_playback(session["DeviceId"]) is not None
+    )
+
+
+async def _refresh_sessions(
+    coordinator: EmbyDataUpdateCoordinator, player: EmbyMediaPlayer
+) -> None:
+    """Poll the sessions and hand them to the player."""
+    coordinator._section_fetched.clear()
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+    player._update_session_data()
+
+
+@pytest.fixture
+async def session(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> dict[str, Any]:
+    """Return the session controlled by the player."""
+    return _session(emby_server, coordinator)
+
+
+@pytest.fixture
+async def player(
+    hass: HomeAssistant, coordinator: EmbyDataUpdateCoordinator, session: dict[str, Any]
+) -> EmbyMediaPlayer:
+    """Return a media player bound to a playing session."""
+    player = EmbyMediaPlayer(
+        coordinator,
+        coordinator.entry,
+        session["DeviceId"],
+        session["DeviceName"],
+        session["UserName"],
+    )
+    player.hass = hass
+    player.entity_id = "media_player.emby_test"
+    player._update_session_data()
+    return player
+
+
+def _queue_idle(
+    coordinator: EmbyDataUpdateCoordinator, session: dict[str, Any]
+) -> Callable[[], bool]:
+    """Return a condition that holds once the session's commands were sent."""
+    return lambda: not coordinator.command_queue(session["Id"]).busy
+
+
+async def test_pause_is_shown_before_the_server_confirms(
+    emby_server: FakeEmbyServer,
+    coordinator: EmbyDataUpdateCoordinator,
+    session: dict[str, Any],
+    player: EmbyMediaPlayer,
+) -> None:
+    """The expected state shows right away and is dropped once the server agrees."""
+    assert player.state == MediaPlayerState.PLAYING
+    await player.async_media_pause()
+    assert player.state == MediaPlayerState.PAUSED
+
+    await wait_for(_queue_idle(coordinator, session))
+    assert session["PlayState"]["IsPaused"]
+    await _refresh_sessions(coordinator, player)
+    assert player._optimistic == {}
+    assert player.state == MediaPlayerState.PAUSED
+
+
+async def test_volume_steps_coalesce(
+    emby_server: FakeEmbyServer,
+    coordinator: EmbyDataUpdateCoordinator,
+    session: dict[str, Any],
+    player: EmbyMediaPlayer,
+) -> None:
+    """A burst of steps queued together is sent as a single level."""
+    path = f"/Sessions/{session['Id']}/Command"
+    for _ in range(4):
+        await player.async_volume_up()
+    assert player.volume_level == pytest.approx(0.9)
+
+    await wait_for(_queue_idle(coordinator, session))
+    assert emby_server.hits[path] == 1
+    assert session["PlayState"]["VolumeLevel"] == 90
+    assert coordinator.command_queue(session["Id"]).coalesced == 3
+
+
+async def test_failed_command_shows_the_server_state(
+    emby_server: FakeEmbyServer,
+    coordinator: EmbyDataUpdateCoordinator,
+    session: dict[str, Any],
+    player: EmbyMediaPlayer,
+) -> None:
+    """The optimistic state is dropped when a command cannot be sent."""
+    emby_server.fail_endpoints.add(f"/Sessions/{session['Id']}/Playing/Pause")
+    await player.async_media_pause()
+    assert player.state == MediaPlayerState.PAUSED
+
+    await wait_for(_queue_idle(coordinator, session))
+    assert coordinator.command_queue(session["Id"]).failed == 1
+    assert player.state == MediaPlayerState.PLAYING
+
+
+async def test_volume_steps_without_a_known_level(
+    emby_server: FakeEmbyServer,
+    coordinator: EmbyDataUpdateCoordinator,
+    session: dict[str, Any],
+    player: EmbyMediaPlayer,
+) -> None:
+    """Clients that only support SetVolume are not stepped from an unknown level."""
+    path = f"/Sessions/{session['Id']}/Command"
+    del session["PlayState"]["VolumeLevel"]
+    await _refresh_sessions(coordinator, player)
+    assert player.volume_level is None
+    assert not player.supported_features & MediaPlayerEntityFeature.VOLUME_STEP
+
+    with pytest.raises(HomeAssistantError):
+        await player.async_volume_up()
+    assert emby_server.hits[path] == 0
+
+    # Clients that step themselves get VolumeUp
+    session["SupportedCommands"] = [*session["SupportedCommands"], "VolumeUp", "VolumeDown"]
+    await _refresh_sessions(coordinator, player)
+    assert player.supported_features & MediaPlayerEntityFeature.VOLUME_STEP
+    await player.async_volume_up()
+    await wait_for(_queue_idle(coordinator, session))
+    assert emby_server.hits[path] == 1
@@ -0,0 +1,62 @@
+"""Tests for conditional GETs and the reuse of unchanged responses."""
+from __future__ import annotations
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.api import EmbyAPIClient
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_not_modified_returns_previous_object(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """A 304 answer returns the object decoded for the previous response."""
+    emby_server.etags = True
+
+    first = await client.get_sessions()
+    second = await client.get_sessions()
+
+    assert second is first
+    assert emby_server.not_modified == 1
+    assert client.not_modified == 1
+
+
+async def test_changed_response_is_decoded(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """A changed body is decoded into a new object."""
+    emby_server.etags = True
+
+    first = await client.get_sessions()
+    emby_server.advance(30)
+    second = await client.get_sessions()
+
+    assert second is not first
+    assert second != first
+    assert emby_server.not_modified == 0
+    assert client.not_modified == 0
+
+
+async def test_identical_body_without_validators_is_reused(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Without ETags, a byte-identical body is recognised by its hash."""
+    first = await client.get_sessions()
+    second = await client.get_sessions()
+
+    assert second is first
+    assert emby_server.not_modified == 0
+    assert client.not_modified == 1
+
+
+async def test_one_off_queries_are_not_remembered(client: EmbyAPIClient) -> None:
+    """Searches and history pages do not take validator cache entries."""
+    await client.search_items("star", 5)
+    await client.get_activity_log(50, start_index=50)
+    await client.get_activity_log(50, min_date="2000-01-01T00:00:00Z")
+    assert not client._validators
+
+    await client.get_activity_log(10)
+    assert len(client._validators) == 1
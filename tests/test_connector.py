@@ -0,0 +1,37 @@
+"""Tests for the dedicated connection pool of a config entry."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fake_emby import API_KEY, FakeEmbyServer
+from custom_components.emby.api import EmbyAPIClient, create_session
+from custom_components.emby.const import CONNECTOR_LIMIT
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_connections_are_kept_alive(emby_server: FakeEmbyServer) -> None:
+    """Sequential requests reuse one connection; bursts stay within the limit."""
+    session = create_session()
+    try:
+        connector = session.connector
+        assert connector.limit == CONNECTOR_LIMIT
+        assert connector.limit_per_host == CONNECTOR_LIMIT
+
+        client = EmbyAPIClient(
+            host="127.0.0.1", port=emby_server.port, api_key=API_KEY, session=session
+        )
+        for _ in range(5):
+            await client.get_sessions()
+        assert len(emby_server.client_ports) == 1
+
+        emby_server.latency = 0.05
+        await asyncio.gather(
+            *(client.get_activity_log(limit) for limit in range(1, 3 * CONNECTOR_LIMIT))
+        )
+        assert len(emby_server.client_ports) <= CONNECTOR_LIMIT
+        await client.close()
+    finally:
+        await session.close()
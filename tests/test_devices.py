@@ -0,0 +1,111 @@
+"""Tests for the device discovery tracker."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.emby.const import DEVICE_STALE_DAYS
+from custom_components.emby.devices import DeviceTracker
+
+pytestmark = pytest.mark.anyio
+
+
+def _device(device_id: str, days_ago: float) -> dict[str, Any]:
+    """Return a /Devices item last active some days ago."""
+    seen = dt_util.utcnow() - timedelta(days=days_ago)
+    return {
+        "Id": device_id,
+        "Name": f"Device {device_id}",
+        "AppName": "Emby Web",
+        "LastUserName": "Alice",
+        "DateLastActivity": seen.isoformat(),
+    }
+
+
+@pytest.fixture
+def tracker(hass: HomeAssistant) -> DeviceTracker:
+    """Return a tracker without sightings."""
+    return DeviceTracker(hass, "test")
+
+
+async def test_recent_devices_are_candidates(tracker: DeviceTracker) -> None:
+    """Devices active recently are discovered once; stale and known ones are not."""
+    tracker.async_update_devices(
+        {"Items": [_device("recent", 1), _device("stale", DEVICE_STALE_DAYS + 1)]}
+    )
+    tracker.async_update_sessions([{"DeviceId": "playing", "DeviceName": "TV"}])
+
+    candidates = tracker.async_pop_candidates({"recent"})
+    assert [device["device_id"] for device in candidates] == ["playing"]
+    assert candidates[0]["device_name"] == "TV"
+    assert tracker.async_pop_candidates(set()) == []
+
+
+async def test_removed_active_devices_are_ignored(tracker: DeviceTracker) -> None:
+    """A device the user removed while active is not discovered again until re-added."""
+    tracker.async_update_devices({"Items": [_device("a", 1), _device("old", 100)]})
+    tracker.async_pop_candidates(set())
+
+    tracker.async_monitored_changed([], ["a", "old"])
+    assert tracker.ignored == {"a"}
+    tracker.async_update_sessions([{"DeviceId": "a"}, {"DeviceId": "old"}])
+    assert [device["device_id"] for device in tracker.async_pop_candidates(set())] == [
+        "old"
+    ]
+
+    tracker.async_monitored_changed(["a"], [])
+    assert tracker.ignored == set()
+
+
+async def test_stale_devices(tracker: DeviceTracker) -> None:
+    """Devices count as stale after DEVICE_STALE_DAYS without activity."""
+    now = dt_util.utcnow()
+    tracker.async_update_devices(
+        {"Items": [_device("recent", 1), _device("stale", DEVICE_STALE_DAYS + 1)]}
+    )
+    assert not tracker.is_stale("recent", now)
+    assert tracker.is_stale("stale", now)
+    # Devices never seen count from now
+    assert not tracker.is_stale("unknown", now)
+    assert tracker.is_stale("unknown", now + timedelta(days=DEVICE_STALE_DAYS))
+
+
+async def test_saves_only_changes(tracker: DeviceTracker) -> None:
+    """Unchanged sightings do not schedule a save; a pending one is not pushed back."""
+    store = tracker._store
+    devices = {"Items": [_device("a", 1)]}
+    tracker.async_update_sessions([])
+    tracker.async_monitored_changed([], [])
+    assert store._delay_handle is None
+
+    tracker.async_update_devices(devices)
+    handle = store._delay_handle
+    write_time = store._next_write_time
+    assert handle is not None
+
+    tracker.async_update_sessions([{"DeviceId": "b"}])
+    assert store._delay_handle is handle
+    assert store._next_write_time == write_time
+    assert set(store._data["data_func"]()["last_seen"]) == {"a", "b"}
+
+    await tracker.async_flush()
+    tracker.async_update_devices(devices)
+    assert not tracker._save_pending
+
+
+async def test_sightings_survive_a_restart(
+    hass: HomeAssistant, tracker: DeviceTracker
+) -> None:
+    """Flushed sightings and ignored devices are restored by a new tracker."""
+    tracker.async_update_devices({"Items": [_device("a", 1)]})
+    tracker.async_monitored_changed([], ["a"])
+    await tracker.async_flush()
+
+    restored = DeviceTracker(hass, "test")
+    await restored.async_load()
+    assert restored.last_seen == tracker.last_seen
+    assert restored.ignored == {"a"}
@@ -0,0 +1,63 @@
+"""Tests for the config entry diagnostics."""
+from __future__ import annotations
+
+import pytest
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from fake_emby import API_KEY, FakeEmbyServer
+from custom_components.emby.const import DOMAIN
+from custom_components.emby.diagnostics import async_get_config_entry_diagnostics
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_diagnostics_redact_personal_data(
+    hass: HomeAssistant, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Credentials, addresses, user names and activity texts are redacted."""
+    await er.async_load(hass)
+    entry = coordinator.entry
+    hass.data[DOMAIN] = {
+        entry.entry_id: {
+            "coordinator": coordinator,
+            "client": coordinator.client,
+            "search_index": None,
+        }
+    }
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert API_KEY not in str(diagnostics)
+    assert diagnostics["entry"]["data"]["host"] == REDACTED
+    data = diagnostics["data"]
+    assert data["users"] and all(user["Name"] == REDACTED for user in data["users"])
+    entries = data["activity_log"]["Items"]
+    assert entries and all(entry["Name"] == REDACTED for entry in entries)
+    assert all(session["UserName"] == REDACTED for session in data["sessions"])
+    # Names of other things are kept
+    assert data["scheduled_tasks"][0]["Name"] != REDACTED
+
+    caches = diagnostics["caches"]
+    assert caches["response_cache_entries"] == len(coordinator.client._cache)
+    assert caches["browse"]["pages"] == 0
+    assert diagnostics["entities"]["listeners"] == 0
+
+
+async def test_refresh_timings(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Each poll records where its time went, failed polls included."""
+    timing = coordinator.refresh_timings[-1]
+    assert "sessions" in timing["due"]
+    assert set(timing["sections_ms"]) == set(timing["due"])
+    assert timing["failed"] == []
+    assert {"network_ms", "decode_ms", "fanout_ms", "state_writes"} <= set(timing)
+
+    emby_server.fail_endpoints.add("/Sessions")
+    coordinator._section_fetched.clear()
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+    assert "sessions" in coordinator.refresh_timings[-1]["failed"]
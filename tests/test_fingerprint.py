@@ -0,0 +1,89 @@
+"""Tests for skipping state writes of entities whose data did not change."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.const import TICKS_PER_SECOND
+from custom_components.emby.entity import EmbyEntity
+from custom_components.emby.sensor import (
+    EmbyDataUpdateCoordinator,
+    EmbyMovieCountSensor,
+    EmbyPlaybackStateSensor,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def _listen(
+    coordinator: EmbyDataUpdateCoordinator, entity: EmbyEntity
+) -> list[EmbyEntity]:
+    """Subscribe an entity to the coordinator and record its state writes."""
+    writes: list[EmbyEntity] = []
+    entity.async_write_ha_state = lambda: writes.append(entity)
+    coordinator.async_add_listener(entity._handle_coordinator_update)
+    return writes
+
+
+async def _poll_sessions(coordinator: EmbyDataUpdateCoordinator) -> None:
+    """Poll the sessions right away."""
+    coordinator._section_fetched.pop("sessions", None)
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+
+
+def _two_sessions(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return a playing and another monitored session of the fake server."""
+    monitored = [
+        session
+        for session in emby_server.sessions
+        if coordinator.get_playback(session["DeviceId"]) is not None
+    ]
+    playing = next(session for session in monitored if "NowPlayingItem" in session)
+    other = next(session for session in monitored if session is not playing)
+    return playing, other
+
+
+async def test_only_changed_devices_write_state(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """A change in one device's session writes the state of that device only."""
+    first, second = _two_sessions(emby_server, coordinator)
+    entry = coordinator.entry
+    first_writes = _listen(
+        coordinator,
+        EmbyPlaybackStateSensor(coordinator, entry, first["DeviceId"], "First"),
+    )
+    second_writes = _listen(
+        coordinator,
+        EmbyPlaybackStateSensor(coordinator, entry, second["DeviceId"], "Second"),
+    )
+    count_writes = _listen(coordinator, EmbyMovieCountSensor(coordinator, entry))
+
+    # The first update after subscribing writes every entity
+    await _poll_sessions(coordinator)
+    assert (len(first_writes), len(second_writes), len(count_writes)) == (1, 1, 1)
+
+    first["PlayState"]["PositionTicks"] += 10 * TICKS_PER_SECOND
+    skipped = coordinator.state_writes_skipped
+    await _poll_sessions(coordinator)
+    assert (len(first_writes), len(second_writes), len(count_writes)) == (2, 1, 1)
+    assert coordinator.state_writes_skipped == skipped + 2
+
+
+async def test_failed_update_writes_state(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Entities write state when the coordinator becomes unavailable."""
+    writes = _listen(coordinator, EmbyMovieCountSensor(coordinator, coordinator.entry))
+    await _poll_sessions(coordinator)
+    assert len(writes) == 1
+
+    emby_server.fail_endpoints.add("/Sessions")
+    await _poll_sessions(coordinator)
+    assert not coordinator.last_update_success
+    assert len(writes) == 2
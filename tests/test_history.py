@@ -0,0 +1,101 @@
+"""Tests for the incremental activity history."""
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby import sensor
+from custom_components.emby.history import ActivityHistory
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def history(
+    hass: HomeAssistant,
+    coordinator: EmbyDataUpdateCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> ActivityHistory:
+    """Give the coordinator an empty history and small backfill pages."""
+    monkeypatch.setattr(sensor, "HISTORY_PAGE_SIZE", 10)
+    monkeypatch.setattr(sensor, "HISTORY_MAX_PAGES", 2)
+    await coordinator.history.async_close()
+    coordinator.history = ActivityHistory(hass, hass.config.path(".storage", "test.db"))
+    yield coordinator.history
+    await coordinator.history.async_close()
+
+
+def _stored_ids(history: ActivityHistory) -> set[int]:
+    with sqlite3.connect(history.path) as conn:
+        return {row[0] for row in conn.execute("SELECT id FROM activity")}
+
+
+async def test_backfill_resumes_where_it_stopped(
+    emby_server: FakeEmbyServer,
+    coordinator: EmbyDataUpdateCoordinator,
+    history: ActivityHistory,
+) -> None:
+    """A backfill longer than HISTORY_MAX_PAGES continues on later refreshes."""
+    all_ids = {entry["Id"] for entry in emby_server.activity}
+    assert len(all_ids) == 50
+
+    await coordinator._async_update_history()
+    assert len(_stored_ids(history)) == 20
+    assert await history.async_get_backfill() is not None
+    assert await history.async_get_high_water_mark() is None
+
+    # Entries logged in between shift the older ones, none is skipped
+    newest = dict(emby_server.activity[0], Id=2_000_000)
+    emby_server.activity.insert(0, newest)
+    all_ids.add(newest["Id"])
+
+    await coordinator._async_update_history()
+    await coordinator._async_update_history()
+    assert _stored_ids(history) == all_ids - {newest["Id"]}
+    assert await history.async_get_backfill() is None
+    assert await history.async_get_high_water_mark() is not None
+
+    # The next pass starts from the mark and reads what was logged meanwhile
+    await coordinator._async_update_history()
+    assert _stored_ids(history) == all_ids
+
+    # Once caught up, a refresh reads a single short page
+    requests = emby_server.hits["/System/ActivityLog/Entries"]
+    await coordinator._async_update_history()
+    assert emby_server.hits["/System/ActivityLog/Entries"] == requests + 1
+
+
+async def test_playback_stats_count_the_whole_history(
+    emby_server: FakeEmbyServer,
+    coordinator: EmbyDataUpdateCoordinator,
+) -> None:
+    """Today's counters come from the stored history, not a single page."""
+    playbacks = [
+        entry for entry in emby_server.activity if "Playback" in entry["Type"]
+    ]
+    stats = coordinator.playback_stats
+    assert stats["count"] == len(playbacks)
+    assert sum(user["count"] for user in stats["per_user"]) == len(playbacks)
+    assert len(stats["recent"]) == min(10, len(playbacks))
+
+
+async def test_entries_are_stored_once_and_pruned(hass: HomeAssistant) -> None:
+    """Overlapping pages add each entry once; old entries can be pruned."""
+    history = ActivityHistory(hass, hass.config.path(".storage", "prune.db"))
+    entries = [
+        {"Id": 1, "Date": "2024-01-01T10:00:00.0000000Z", "Type": "VideoPlayback"},
+        {"Id": 2, "Date": "2024-01-03T10:00:00.0000000Z", "Type": "VideoPlayback"},
+        {"Id": 3, "Date": None, "Type": "VideoPlayback"},
+    ]
+    try:
+        assert await history.async_add_entries(entries) == 2
+        assert await history.async_add_entries(entries) == 0
+        assert await history.async_prune(datetime(2024, 1, 2, tzinfo=timezone.utc)) == 1
+        assert _stored_ids(history) == {2}
+    finally:
+        await history.async_close()
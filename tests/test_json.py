@@ -0,0 +1,57 @@
+"""Tests for the JSON helpers, with and without orjson."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.emby import api
+from custom_components.emby.api import EmbyAPIClient, json_dumps_sorted, json_loads
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with orjson and with the standard library fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(api, "orjson", None)
+    elif api.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_loads(json_backend: str) -> None:
+    """Bodies decode the same with either backend."""
+    body = '{"Name": "影片", "Items": [1, 2.5, null, true]}'.encode()
+    assert json_loads(body) == {"Name": "影片", "Items": [1, 2.5, None, True]}
+
+
+def test_dumps_sorted_ignores_key_order(json_backend: str) -> None:
+    """Fingerprints do not depend on the order of the keys."""
+    first = {"b": 1, "a": {"y": [1, 2], "x": None}}
+    second = {"a": {"x": None, "y": [1, 2]}, "b": 1}
+    assert json_dumps_sorted(first) == json_dumps_sorted(second)
+    assert json_dumps_sorted(first) != json_dumps_sorted({**first, "b": 2})
+
+
+class _Opaque:
+    """A value neither JSON backend can serialize."""
+
+    def __str__(self) -> str:
+        return "opaque"
+
+
+def test_dumps_sorted_accepts_other_types(json_backend: str) -> None:
+    """Integer keys are allowed and unknown values serialize as strings."""
+    assert "opaque" in str(json_dumps_sorted({1: _Opaque()}))
+    moment = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert "2024-01-01" in str(json_dumps_sorted({"when": moment}))
+
+
+async def test_responses_are_decoded_once(client: EmbyAPIClient) -> None:
+    """JSON bodies are decoded from the raw bytes and the time is recorded."""
+    sessions = await client.get_sessions()
+    assert isinstance(sessions, list)
+    assert client.decode_ms > 0
+    assert client.endpoint_stats["/Sessions"].decode_ms > 0
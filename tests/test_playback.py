@@ -0,0 +1,91 @@
+"""Tests for the playback view model shared by device entities."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+from custom_components.emby.const import TICKS_PER_SECOND
+from custom_components.emby.media_player import EmbyMediaPlayer
+from custom_components.emby.playback import PlaybackSnapshot
+from custom_components.emby.sensor import (
+    EmbyDataUpdateCoordinator,
+    EmbyPlaybackRemainingSensor,
+    EmbyProgressPercentSensor,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def _session(position: float = 600, paused: bool = False) -> dict[str, Any]:
+    """Return a session playing an hour-long episode at a position in seconds."""
+    return {
+        "Id": "session-1",
+        "DeviceId": "device-1",
+        "NowPlayingItem": {
+            "Id": "1",
+            "Name": "Pilot",
+            "Type": "Episode",
+            "SeriesName": "Show",
+            "ParentIndexNumber": 1,
+            "IndexNumber": 2,
+            "RunTimeTicks": 3600 * TICKS_PER_SECOND,
+        },
+        "PlayState": {
+            "PositionTicks": int(position * TICKS_PER_SECOND),
+            "IsPaused": paused,
+            "VolumeLevel": 40,
+        },
+    }
+
+
+def test_episode_fields() -> None:
+    """Episodes are titled with the series and episode number."""
+    snapshot = PlaybackSnapshot(_session(paused=True), time.monotonic())
+    assert snapshot.is_playing and not snapshot.is_running
+    assert snapshot.title == "Show S01E02"
+    assert snapshot.media_type_cn == "剧集"
+    assert snapshot.volume_level == 40
+    assert snapshot.progress_percent() == 16
+    assert snapshot.remaining_seconds() == 3000
+
+
+def test_position_is_extrapolated_while_running() -> None:
+    """A running position advances with time, up to the runtime."""
+    sampled = time.monotonic() - 60
+    assert PlaybackSnapshot(_session(600), sampled).current_position_ticks() >= (
+        660 * TICKS_PER_SECOND
+    )
+    assert (
+        PlaybackSnapshot(_session(600, paused=True), sampled).current_position_ticks()
+        == 600 * TICKS_PER_SECOND
+    )
+    assert PlaybackSnapshot(_session(3590), sampled).remaining_seconds() == 0
+
+
+def test_idle_session() -> None:
+    """A session without a NowPlayingItem is not playing."""
+    snapshot = PlaybackSnapshot({"Id": "session-1", "DeviceId": "device-1"}, 0)
+    assert not snapshot.is_playing
+    assert snapshot.progress_percent() == 0
+    assert snapshot.remaining_seconds() is None
+
+
+async def test_entities_share_one_snapshot(
+    coordinator: EmbyDataUpdateCoordinator,
+) -> None:
+    """Every entity of a device reads the snapshot built by the coordinator."""
+    session = next(s for s in coordinator.data["sessions"] if "NowPlayingItem" in s)
+    device_id = session["DeviceId"]
+    entry = coordinator.entry
+    remaining = EmbyPlaybackRemainingSensor(coordinator, entry, device_id, "Device")
+    progress = EmbyProgressPercentSensor(coordinator, entry, device_id, "Device")
+    player = EmbyMediaPlayer(coordinator, entry, device_id, "Device", "")
+    player._update_session_data()
+
+    snapshot = coordinator.get_playback(device_id)
+    assert remaining.playback is snapshot
+    assert progress.playback is snapshot
+    assert player._playback is snapshot
+    assert player.media_title == snapshot.title
@@ -0,0 +1,61 @@
+"""Tests for the /Sessions field projection and the lazy MediaStreams."""
+from __future__ import annotations
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.api import EmbyAPIClient
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+from .common import wait_for
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_sessions_are_projected(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Polled sessions leave out idle sessions and bulky item fields."""
+    sessions = await client.get_sessions()
+
+    assert 0 < len(sessions) < len(emby_server.sessions)
+    for session in sessions:
+        item = session.get("NowPlayingItem")
+        if item is not None:
+            assert "MediaStreams" not in item
+            assert "People" not in item
+            assert "RunTimeTicks" in item
+
+
+async def test_projection_savings_are_measured(client: EmbyAPIClient) -> None:
+    """The full and projected session lists are compared by size."""
+    savings = await client.measure_sessions_projection()
+    assert savings["full_bytes"] > savings["projected_bytes"] > 0
+    assert savings["saved_bytes"] == savings["full_bytes"] - savings["projected_bytes"]
+
+
+async def test_media_streams_are_fetched_while_tracked(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Streams of playing items are fetched only while a track sensor wants them."""
+    playback = next(
+        snapshot
+        for snapshots in coordinator.playback_index.values()
+        for snapshot in snapshots
+        if snapshot.is_playing
+    )
+    assert coordinator.media_streams == {}
+    assert emby_server.hits["/Items"] == 0
+
+    remove = coordinator.async_track_media_streams(playback.device_id)
+    await wait_for(lambda: playback.item_id in coordinator.media_streams)
+    assert coordinator.media_streams[playback.item_id] == (
+        emby_server.items[playback.item_id]["MediaStreams"]
+    )
+    assert coordinator.media_streams_for(playback.session["NowPlayingItem"])
+
+    remove()
+    coordinator._section_fetched.pop("sessions", None)
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+    assert emby_server.hits["/Items"] == 1
@@ -0,0 +1,104 @@
+"""Tests for the per-endpoint request statistics and their sensors."""
+from __future__ import annotations
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.api import EmbyAPIClient, EmbyConnectionError
+from custom_components.emby.const import LATENCY_BUCKETS
+from custom_components.emby.sensor import (
+    EmbyDataUpdateCoordinator,
+    EmbyRefreshLatencySensor,
+    EmbyRequestFailuresSensor,
+    EmbySlowestEndpointSensor,
+)
+from custom_components.emby.stats import LatencyRecorder, percentile
+
+pytestmark = pytest.mark.anyio
+
+
+def test_percentile() -> None:
+    """Percentiles use the nearest rank."""
+    assert percentile([], 50) is None
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([float(value) for value in range(1, 101)], 95) == 95.0
+
+
+def test_histogram_buckets() -> None:
+    """Samples are counted in the first bucket whose bound they do not exceed."""
+    recorder = LatencyRecorder()
+    for value in (LATENCY_BUCKETS[0], LATENCY_BUCKETS[0] + 1, LATENCY_BUCKETS[-1] + 1):
+        recorder.record(value)
+
+    histogram = recorder.histogram()
+    assert histogram[f"<={LATENCY_BUCKETS[0]}"] == 1
+    assert histogram[f"<={LATENCY_BUCKETS[1]}"] == 1
+    assert histogram[f">{LATENCY_BUCKETS[-1]}"] == 1
+    assert sum(histogram.values()) == recorder.count == 3
+
+
+async def test_requests_are_recorded_per_endpoint(
+    emby_server: FakeEmbyServer, client: EmbyAPIClient
+) -> None:
+    """Each endpoint keeps its own request, failure and status counters."""
+    await client.get_sessions()
+    await client.get_sessions()
+    emby_server.fail_endpoints.add("/Devices")
+    with pytest.raises(EmbyConnectionError):
+        await client.get_devices()
+
+    sessions = client.endpoint_stats["/Sessions"].as_dict()
+    assert sessions["requests"] == 2
+    assert sessions["failures"] == 0
+    assert sessions["statuses"] == {200: 2}
+    assert sessions["bytes"] > 0
+    assert sessions["p50_ms"] is not None
+    assert client.endpoint_stats["/Devices"].failures == 1
+
+
+async def test_ids_are_grouped(emby_server: FakeEmbyServer, client: EmbyAPIClient) -> None:
+    """Requests for different items share one statistics entry."""
+    item_ids = list(emby_server.items)
+    assert len(item_ids) > 1
+    for item_id in item_ids:
+        await client.get_image(item_id, "Primary")
+
+    images = [endpoint for endpoint in client.endpoint_stats if "Images" in endpoint]
+    assert images == ["/Items/{id}/Images/Primary"]
+    assert client.endpoint_stats[images[0]].latency.count == len(item_ids)
+
+
+async def test_slowest_endpoint(emby_server: FakeEmbyServer, client: EmbyAPIClient) -> None:
+    """The endpoint with the highest p95 latency is reported as the slowest."""
+    assert client.slowest_endpoint() is None
+    await client.get_devices()
+    emby_server.latency = 0.05
+    await client.get_sessions()
+
+    endpoint, p95 = client.slowest_endpoint()
+    assert endpoint == "/Sessions"
+    assert p95 >= 50
+
+
+async def test_sensors(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """The diagnostic sensors expose the refresh latency and the failures."""
+    entry = coordinator.entry
+    p95 = EmbyRefreshLatencySensor(coordinator, entry, 95)
+    failures = EmbyRequestFailuresSensor(coordinator, entry)
+    slowest = EmbySlowestEndpointSensor(coordinator, entry)
+
+    assert p95.native_value is not None
+    assert p95.extra_state_attributes["refreshes"] >= 1
+    assert slowest.native_value in coordinator.client.endpoint_stats
+    assert failures.native_value == 0
+
+    emby_server.fail_endpoints.add("/Sessions")
+    coordinator._section_fetched.pop("sessions", None)
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+    session_failures = coordinator.client.endpoint_stats["/Sessions"].failures
+    assert session_failures > 0
+    assert failures.native_value == session_failures
+    assert failures.extra_state_attributes["/Sessions"]["statuses"][500] == session_failures
@@ -0,0 +1,162 @@
+"""Tests for the local search index and the emby.search service."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.api import EmbyAPIClient
+from custom_components.emby.const import DOMAIN, SERVICE_SEARCH
+from custom_components.emby.search import (
+    SearchIndex,
+    query_terms,
+    tokenize,
+    within_distance,
+)
+from custom_components.emby.services import async_setup_services
+
+pytestmark = pytest.mark.anyio
+
+
+def test_tokenize() -> None:
+    """Words are casefolded and CJK runs become characters and pairs."""
+    assert tokenize("The Last Star") == {"the", "last", "star"}
+    assert tokenize("流浪地球") == {"流", "浪", "地", "球", "流浪", "浪地", "地球"}
+    assert query_terms("Ｓtar 地球") == [("star", True), ("地球", False)]
+
+
+def test_within_distance() -> None:
+    """Edit distances are compared against a limit."""
+    assert within_distance("garden", "garden", 0)
+    assert within_distance("garden", "gardne", 2)
+    assert not within_distance("garden", "gardne", 1)
+    assert not within_distance("ocean", "oceanic", 1)
+
+
+@pytest.fixture
+async def index(
+    hass: HomeAssistant, client: EmbyAPIClient, emby_server: FakeEmbyServer
+) -> SearchIndex:
+    """Return an index built from the catalog of the fake server."""
+    index = SearchIndex(hass, client, "test")
+    await index.async_refresh()
+    return index
+
+
+def _latin_item(emby_server: FakeEmbyServer) -> dict[str, Any]:
+    """Return a catalog item named with Latin words, one of four letters or more."""
+    return next(
+        item
+        for item in emby_server.catalog
+        if item["Name"].isascii() and any(len(word) >= 4 for word in item["Name"].split())
+    )
+
+
+async def test_full_build(emby_server: FakeEmbyServer, index: SearchIndex) -> None:
+    """The first refresh indexes the whole catalog."""
+    assert index.ready
+    assert len(index) == len(emby_server.catalog)
+
+    item = _latin_item(emby_server)
+    assert index.search(item["Name"])[0]["id"] == item["Id"]
+
+
+async def test_prefix_fuzzy_and_cjk(
+    emby_server: FakeEmbyServer, index: SearchIndex
+) -> None:
+    """Words match by prefix or with a typo, CJK names by substring."""
+    item = _latin_item(emby_server)
+    *words, number = item["Name"].split()
+    word = max(words, key=len)
+
+    ids = [result["id"] for result in index.search(f"{word[:3]} {number}")]
+    assert item["Id"] in ids
+    ids = [result["id"] for result in index.search(f"{word[:-1]}q {number}")]
+    assert item["Id"] in ids
+
+    cjk = next(item for item in emby_server.catalog if not item["Name"].isascii())
+    ids = [result["id"] for result in index.search(cjk["Name"][1:3], limit=50)]
+    assert cjk["Id"] in ids
+
+
+async def test_media_type_filter(emby_server: FakeEmbyServer, index: SearchIndex) -> None:
+    """Results can be limited to one item type."""
+    item = _latin_item(emby_server)
+    word = item["Name"].split()[0]
+    results = index.search(word, limit=50, media_type=item["Type"])
+    assert results
+    assert {result["type"] for result in results} == {item["Type"]}
+    assert index.search("no such title") == []
+
+
+async def test_incremental_refresh(
+    emby_server: FakeEmbyServer, index: SearchIndex
+) -> None:
+    """Later refreshes only download items saved since the previous one."""
+    emby_server.advance(60)
+    emby_server.add_catalog_items(3)
+    hits = emby_server.hits["/Items"]
+    await index.async_refresh()
+
+    assert len(index) == len(emby_server.catalog)
+    assert index.search(emby_server.catalog[-1]["Name"])[0]["id"] == (
+        emby_server.catalog[-1]["Id"]
+    )
+    # One page of changes plus the total count
+    assert emby_server.hits["/Items"] == hits + 2
+
+
+async def test_deleted_items_trigger_rebuild(
+    emby_server: FakeEmbyServer, index: SearchIndex
+) -> None:
+    """A shrunken library schedules a full rebuild, which drops deleted items."""
+    deleted = emby_server.catalog.pop()
+    await index.async_refresh()
+    assert index.last_full is None
+
+    await index.async_refresh()
+    assert len(index) == len(emby_server.catalog)
+    assert deleted["Id"] not in {
+        result["id"] for result in index.search(deleted["Name"], limit=50)
+    }
+
+
+async def test_persistence(
+    hass: HomeAssistant, client: EmbyAPIClient, index: SearchIndex
+) -> None:
+    """A flushed index is restored by the next instance."""
+    await index.async_flush()
+    restored = SearchIndex(hass, client, "test")
+    await restored.async_load()
+
+    assert restored.ready
+    assert len(restored) == len(index)
+    assert restored.last_full == index.last_full
+
+
+async def test_search_service(
+    hass: HomeAssistant,
+    client: EmbyAPIClient,
+    emby_server: FakeEmbyServer,
+    index: SearchIndex,
+) -> None:
+    """The service answers from the index, or from the server without one."""
+    item = _latin_item(emby_server)
+    hass.data[DOMAIN] = {"entry": {"client": client, "search_index": index}}
+    async_setup_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_SEARCH, {"query": item["Name"]}, blocking=True, return_response=True
+    )
+    assert response["items"][0]["id"] == item["Id"]
+    assert response["items"][0]["config_entry_id"] == "entry"
+    hits = emby_server.hits["/Items"]
+
+    hass.data[DOMAIN]["entry"]["search_index"] = None
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_SEARCH, {"query": item["Name"]}, blocking=True, return_response=True
+    )
+    assert item["Id"] in {match["id"] for match in response["items"]}
+    assert emby_server.hits["/Items"] == hits + 1
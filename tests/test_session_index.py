@@ -0,0 +1,65 @@
+"""Tests for the session index of the coordinator."""
+from __future__ import annotations
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+pytestmark = pytest.mark.anyio
+
+
+async def _poll_sessions(coordinator: EmbyDataUpdateCoordinator) -> None:
+    """Poll the sessions right away."""
+    coordinator._section_fetched.pop("sessions", None)
+    coordinator.client.invalidate()
+    await coordinator.async_refresh()
+
+
+async def test_sessions_are_found_by_either_device_id(
+    coordinator: EmbyDataUpdateCoordinator,
+) -> None:
+    """Sessions are indexed by DeviceId and by InternalDeviceId."""
+    for session in coordinator.data["sessions"]:
+        by_id = coordinator.get_playback(session["DeviceId"])
+        by_internal_id = coordinator.get_playback(str(session["InternalDeviceId"]))
+        assert by_id is by_internal_id
+        assert by_id.session is session
+    assert coordinator.get_playback("unknown") is None
+    assert coordinator.sessions_for("unknown") == []
+    assert coordinator.sessions_for("all") == coordinator.data["sessions"]
+
+
+async def test_playing_session_of_a_device_is_preferred(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """A device with several sessions resolves to the one that plays."""
+    idle, playing = emby_server.sessions[:2]
+    idle.pop("NowPlayingItem", None)
+    playing.setdefault("NowPlayingItem", {"Id": "1", "Name": "Movie", "Type": "Movie"})
+    for session in (idle, playing):
+        session["DeviceId"] = "shared"
+        session["LastActivityDate"] = emby_server.now.strftime(
+            "%Y-%m-%dT%H:%M:%S.0000000Z"
+        )
+    await _poll_sessions(coordinator)
+
+    assert [s.session_id for s in coordinator.playback_for("shared")] == [
+        idle["Id"],
+        playing["Id"],
+    ]
+    assert coordinator.get_playback("shared").session_id == playing["Id"]
+    assert coordinator.get_session("shared")["Id"] == playing["Id"]
+
+
+async def test_index_is_rebuilt_per_session_update(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Ended sessions drop out of the index at the next update."""
+    session = coordinator.data["sessions"][0]
+    emby_server.sessions = [
+        s for s in emby_server.sessions if s["DeviceId"] != session["DeviceId"]
+    ]
+    await _poll_sessions(coordinator)
+    assert coordinator.get_playback(session["DeviceId"]) is None
+    assert coordinator.get_playback(str(session["InternalDeviceId"])) is None
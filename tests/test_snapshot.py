@@ -0,0 +1,53 @@
+"""Tests for the persisted snapshot of the coordinator data."""
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+pytestmark = pytest.mark.anyio
+
+
+async def _refresh_all(coordinator: EmbyDataUpdateCoordinator) -> None:
+    """Poll every section right away."""
+    coordinator._section_fetched.clear()
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+
+
+async def test_pending_save_is_not_rearmed(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Polls while a save is pending do not push it back, and it saves the latest data."""
+    store = coordinator._store
+    handle = store._delay_handle
+    assert handle is not None
+    write_time = store._next_write_time
+
+    emby_server.advance(30)
+    await _refresh_all(coordinator)
+
+    assert store._delay_handle is handle
+    assert store._next_write_time == write_time
+    saved = store._data["data_func"]()
+    assert saved["sessions"][0]["LastActivityDate"] == (
+        coordinator.data["sessions"][0]["LastActivityDate"]
+    )
+
+
+async def test_snapshot_seeds_a_new_coordinator(
+    hass: HomeAssistant, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """The snapshot written on close is loaded without playback state."""
+    await coordinator.async_close()
+
+    seeded = EmbyDataUpdateCoordinator(hass, coordinator.client, coordinator.entry)
+    assert await seeded.async_load_snapshot()
+    assert seeded.data["users"] == coordinator.data["users"]
+    assert [s["DeviceId"] for s in seeded.data["sessions"]] == [
+        s["DeviceId"] for s in coordinator.data["sessions"]
+    ]
+    assert all("NowPlayingItem" not in s for s in seeded.data["sessions"])
+    await seeded.history.async_close()
@@ -0,0 +1,90 @@
+"""Tests for the watch time accounting."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.emby.const import TICKS_PER_SECOND
+from custom_components.emby.playback import PlaybackSnapshot
+from custom_components.emby.watchtime import WatchTimeTracker
+
+pytestmark = pytest.mark.anyio
+
+
+def _session(position: float, paused: bool = False, item_id: str = "1") -> dict[str, Any]:
+    """Return a session playing an item at a position in seconds."""
+    return {
+        "Id": "session-1",
+        "DeviceId": "device-1",
+        "DeviceName": "Living room",
+        "UserName": "Alice",
+        "NowPlayingItem": {"Id": item_id, "Name": f"Movie {item_id}", "Type": "Movie"},
+        "PlayState": {
+            "PositionTicks": int(position * TICKS_PER_SECOND),
+            "IsPaused": paused,
+        },
+    }
+
+
+@pytest.fixture
+def tracker(hass: HomeAssistant) -> WatchTimeTracker:
+    """Return a tracker with empty totals."""
+    return WatchTimeTracker(hass, "test")
+
+
+def _update(tracker: WatchTimeTracker, sampled_at: float, **kwargs: Any) -> bool:
+    return tracker.async_update([PlaybackSnapshot(_session(**kwargs), sampled_at)])
+
+
+async def test_counts_played_time(tracker: WatchTimeTracker) -> None:
+    """Position advances up to the wall time are counted per user and device."""
+    assert not _update(tracker, 0, position=100)
+    assert _update(tracker, 30, position=130)
+
+    assert tracker.total == 30
+    assert tracker.users == {"Alice": 30}
+    assert tracker.devices == {"Living room": 30}
+    assert tracker.items == {"Movie 1": 30}
+
+
+async def test_seeks_pauses_and_item_changes_are_not_counted(
+    tracker: WatchTimeTracker,
+) -> None:
+    """Only continuous playback of the same item adds watch time."""
+    _update(tracker, 0, position=100)
+    assert not _update(tracker, 30, position=1000)  # Seek forward
+    assert not _update(tracker, 60, position=500)  # Seek back
+    assert not _update(tracker, 90, position=500, paused=True)
+    assert not _update(tracker, 120, position=510, item_id="2")
+    assert tracker.total == 0
+
+
+async def test_pending_save_is_not_rearmed(tracker: WatchTimeTracker) -> None:
+    """Later progress does not push a pending save back, which writes the latest totals."""
+    store = tracker._store
+    _update(tracker, 0, position=0)
+    _update(tracker, 10, position=10)
+    handle = store._delay_handle
+    write_time = store._next_write_time
+    assert handle is not None
+
+    _update(tracker, 20, position=20)
+    assert store._delay_handle is handle
+    assert store._next_write_time == write_time
+    assert store._data["data_func"]()["total"] == 20
+
+
+async def test_totals_survive_a_restart(
+    hass: HomeAssistant, tracker: WatchTimeTracker
+) -> None:
+    """Flushed totals of today are restored by a new tracker."""
+    _update(tracker, 0, position=0)
+    _update(tracker, 10, position=10)
+    await tracker.async_flush()
+
+    restored = WatchTimeTracker(hass, "test")
+    await restored.async_load()
+    assert restored.total == 10
+    assert restored.users == {"Alice": 10}
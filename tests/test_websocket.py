@@ -0,0 +1,114 @@
+"""Tests for session updates pushed over the Emby WebSocket."""
+from __future__ import annotations
+
+import pytest
+
+from fake_emby import FakeEmbyServer
+from custom_components.emby import api
+from custom_components.emby.sensor import EmbyDataUpdateCoordinator
+
+from .common import wait_for
+
+pytestmark = pytest.mark.anyio
+
+
+async def _connect(coordinator: EmbyDataUpdateCoordinator) -> None:
+    """Start the push subscription and wait for the first session list."""
+    coordinator.async_start_websocket()
+    await wait_for(lambda: coordinator.websocket.connected)
+
+
+def _playing(emby_server: FakeEmbyServer) -> dict:
+    """Return a session of the fake server that is playing."""
+    return next(
+        session for session in emby_server.sessions if "NowPlayingItem" in session
+    )
+
+
+async def test_pushed_sessions_update_the_coordinator(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Pushed sessions replace the polled ones without a /Sessions request."""
+    await _connect(coordinator)
+    polled = emby_server.hits["/Sessions"]
+
+    session = _playing(emby_server)
+    emby_server.advance(0)
+    session["NowPlayingItem"]["Name"] = "Pushed title"
+    await emby_server.push_sessions()
+
+    def pushed() -> bool:
+        return any(
+            s.get("NowPlayingItem", {}).get("Name") == "Pushed title"
+            for s in coordinator.data["sessions"]
+        )
+
+    await wait_for(pushed)
+    playback = coordinator.get_playback(session["DeviceId"])
+    assert playback is not None and playback.title == "Pushed title"
+
+    # Sessions are not polled while the subscription is up
+    await coordinator.async_request_full_refresh()
+    assert emby_server.hits["/Sessions"] == polled
+
+
+async def test_pushed_idle_sessions_are_dropped(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Pushed sessions get the same inactivity cut-off as polled ones."""
+    await _connect(coordinator)
+
+    idle = emby_server.sessions[0]
+    idle["LastActivityDate"] = "2000-01-01T00:00:00.0000000Z"
+    idle["DeviceName"] = "Idle device"
+    await emby_server.push_sessions()
+    await wait_for(
+        lambda: all(s["DeviceName"] != "Idle device" for s in coordinator.data["sessions"])
+    )
+    assert coordinator.get_playback(idle["DeviceId"]) is None
+
+
+async def test_disconnect_falls_back_to_polling(
+    emby_server: FakeEmbyServer, coordinator: EmbyDataUpdateCoordinator
+) -> None:
+    """Sessions are polled again once the push connection drops."""
+    await _connect(coordinator)
+    polled = emby_server.hits["/Sessions"]
+
+    emby_server.advance(0)
+    _playing(emby_server)["NowPlayingItem"]["Name"] = "Missed update"
+    await emby_server.close_websockets()
+    await wait_for(lambda: not coordinator.websocket.connected)
+
+    # The session list is polled right away instead of at the next interval
+    await wait_for(lambda: emby_server.hits["/Sessions"] > polled)
+    await wait_for(
+        lambda: any(
+            s.get("NowPlayingItem", {}).get("Name") == "Missed update"
+            for s in coordinator.data["sessions"]
+        )
+    )
+    assert coordinator.last_update_success
+
+
+async def test_callback_error_reconnects(
+    emby_server: FakeEmbyServer,
+    coordinator: EmbyDataUpdateCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An unexpected error while handling a push does not end the subscription."""
+    monkeypatch.setattr(api, "WEBSOCKET_RECONNECT_MIN", 0.05)
+    await _connect(coordinator)
+    polled = emby_server.hits["/Sessions"]
+
+    def broken(sessions: list[dict]) -> None:
+        raise RuntimeError("handler broke")
+
+    handler = coordinator.websocket._on_sessions
+    coordinator.websocket._on_sessions = broken
+    await emby_server.push_sessions()
+    await wait_for(lambda: not coordinator.websocket.connected)
+    await wait_for(lambda: emby_server.hits["/Sessions"] > polled)
+
+    coordinator.websocket._on_sessions = handler
+    await wait_for(lambda: coordinator.websocket.connected)